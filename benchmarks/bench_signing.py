@@ -0,0 +1,42 @@
+"""
+Microbenchmark of the per-request cost of signing, comparing RestClient.generate_telesign_headers with a RequestSigner
+created once per client.
+
+    $ python benchmarks/bench_signing.py
+"""
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+from telesign.auth import RequestSigner
+from telesign.rest import RestClient
+
+CUSTOMER_ID = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+API_KEY = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+RESOURCE = "/v1/messaging"
+FIELDS = "message=You%27re+scheduled+for+a+dentist+appointment&message_type=ARN&phone_number=15555555555"
+
+
+def main(number=100000, repeat=5):
+    signer = RequestSigner(CUSTOMER_ID, API_KEY, user_agent=RestClient.user_agent)
+
+    cases = [
+        ("generate_telesign_headers", lambda: RestClient.generate_telesign_headers(CUSTOMER_ID, API_KEY, "POST",
+                                                                                   RESOURCE, FIELDS,
+                                                                                   user_agent=RestClient.user_agent)),
+        ("RequestSigner.headers", lambda: signer.headers("POST", RESOURCE, FIELDS)),
+    ]
+
+    results = {}
+    for name, function in cases:
+        best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+        results[name] = best
+        print("{name:<28} {usec:8.2f} usec/request".format(name=name, usec=best * 1e6))
+
+    print("{name:<28} {speedup:8.2f}x".format(name="speedup",
+                                              speedup=results["generate_telesign_headers"] /
+                                              results["RequestSigner.headers"]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares the requests per second and the peak memory allocated per request of the RestClient transports, sending
+signed messaging requests to the local mock server over a single keep-alive connection.
+
+    $ python benchmarks/bench_transport.py
+"""
+from __future__ import print_function, unicode_literals
+
+import time
+import tracemalloc
+
+from server import start_server_process
+
+from telesign.messaging import MessagingClient
+from telesign.transport import HTTPClientTransport
+
+CUSTOMER_ID = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+API_KEY = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+
+def send(client, number):
+    for _ in range(number):
+        client.message("15555555555", "You're scheduled for a dentist appointment at 2:30PM.", "ARN").status_code
+
+
+def measure(client, number=2000, allocation_number=200):
+    send(client, 50)
+
+    started = time.perf_counter()
+    send(client, number)
+    requests_per_second = number / (time.perf_counter() - started)
+
+    # a fresh trace per request counts its peak from zero
+    peak_total = 0
+    for _ in range(allocation_number):
+        tracemalloc.start()
+        send(client, 1)
+        peak_total += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return requests_per_second, peak_total / float(allocation_number)
+
+
+def main():
+    process, url = start_server_process()
+
+    try:
+        cases = [
+            ("requests", MessagingClient(CUSTOMER_ID, API_KEY, rest_endpoint=url)),
+            ("http.client", MessagingClient(CUSTOMER_ID, API_KEY, rest_endpoint=url, transport=HTTPClientTransport())),
+        ]
+
+        print("{0:<14} {1:>12} {2:>18}".format("transport", "requests/s", "peak alloc KiB/req"))
+        for name, client in cases:
+            requests_per_second, allocated = measure(client)
+            print("{0:<14} {1:>12.0f} {2:>18.1f}".format(name, requests_per_second, allocated / 1024))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+"""
+The SDK benchmark suite: sends requests to the local mock TeleSign server in several scenarios and reports latency
+percentiles, throughput and memory, so that releases and performance features can be compared.
+
+    $ python benchmarks/run.py --latency 0.02 --requests 2000 --concurrency 32
+    $ python benchmarks/run.py --scenario threads --transport http.client --json results.json
+
+Scenarios:
+
+    single   one thread sending one request at a time
+    threads  a thread pool sharing one client
+    asyncio  concurrent tasks on one event loop sharing one AsyncMessagingClient
+    bulk     MessagingClient.message_bulk
+    process  telesign.engine.ProcessEngine, concurrency split over one worker process per core, Requests only
+    lookup   a thread pool mixing PhoneID, Score and messaging status lookups
+
+Latency is measured per request, from the call to the returned Response, except in the process scenario where it runs
+from reading the job to yielding its result. Memory is the peak memory allocated while a
+scenario runs, measured with tracemalloc in a separate shorter run, divided by the number of requests in flight.
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from server import start_server_process
+
+import telesign
+from telesign.engine import ProcessEngine
+from telesign.instrumentation import HookInstrument
+from telesign.messaging import MessagingClient
+from telesign.phoneid import PhoneIdClient
+from telesign.retry import RetryPolicy
+from telesign.score import ScoreClient
+from telesign.transport import HTTPClientTransport
+
+CUSTOMER_ID = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+API_KEY = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+PHONE_NUMBER = "15555555555"
+MESSAGE = "You're scheduled for a dentist appointment at 2:30PM."
+TRANSPORTS = ('requests', 'http.client')
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float('nan')
+
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+
+class Scenario(object):
+    """
+    A benchmark scenario, run() sends number requests and returns the list of per-request latencies in seconds.
+    """
+    name = None
+
+    def __init__(self, url, transport, concurrency):
+        self.url = url
+        self.transport = transport
+        self.concurrency = concurrency
+
+    def client(self, client_class, latencies=None):
+        transport = HTTPClientTransport(pool_maxsize=self.concurrency) if self.transport == 'http.client' else None
+        instruments = [HookInstrument(after=lambda context: latencies.append(context.elapsed))] if latencies is not \
+            None else None
+
+        return client_class(CUSTOMER_ID, API_KEY,
+                            rest_endpoint=self.url,
+                            pool_maxsize=self.concurrency,
+                            transport=transport,
+                            retry_policy=RetryPolicy.disabled(),
+                            instruments=instruments)
+
+    def in_flight(self):
+        return self.concurrency
+
+    def run(self, number):
+        raise NotImplementedError
+
+
+class SingleScenario(Scenario):
+    name = 'single'
+
+    def in_flight(self):
+        return 1
+
+    def run(self, number):
+        latencies = []
+        client = self.client(MessagingClient, latencies)
+
+        for _ in range(number):
+            client.message(PHONE_NUMBER, MESSAGE, 'ARN')
+
+        return latencies
+
+
+class ThreadsScenario(Scenario):
+    name = 'threads'
+
+    def run(self, number):
+        latencies = []
+        client = self.client(MessagingClient, latencies)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for _ in executor.map(lambda _: client.message(PHONE_NUMBER, MESSAGE, 'ARN'), range(number)):
+                pass
+
+        return latencies
+
+
+class LookupScenario(Scenario):
+    name = 'lookup'
+
+    def run(self, number):
+        latencies = []
+        phoneid = self.client(PhoneIdClient, latencies)
+        score = self.client(ScoreClient, latencies)
+        messaging = self.client(MessagingClient, latencies)
+
+        lookups = [lambda: phoneid.phoneid(PHONE_NUMBER),
+                   lambda: score.score(PHONE_NUMBER, 'create'),
+                   lambda: messaging.status('0123456789ABCDEF0123456789ABCDEF')]
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for _ in executor.map(lambda i: lookups[i % len(lookups)](), range(number)):
+                pass
+
+        return latencies
+
+
+class BulkScenario(Scenario):
+    name = 'bulk'
+
+    def run(self, number):
+        latencies = []
+        client = self.client(MessagingClient, latencies)
+
+        messages = ((PHONE_NUMBER, MESSAGE, 'ARN') for _ in range(number))
+        for _ in client.message_bulk(messages, concurrency=self.concurrency):
+            pass
+
+        return latencies
+
+
+class ProcessScenario(Scenario):
+    name = 'process'
+
+    engine = None
+
+    def run(self, number):
+        if self.engine is None:
+            processes = os.cpu_count() or 1
+            self.engine = ProcessEngine(CUSTOMER_ID, API_KEY,
+                                        processes=processes,
+                                        threads=max(1, self.concurrency // processes),
+                                        chunk_size=16,
+                                        rest_endpoint=self.url,
+                                        retry_policy=RetryPolicy.disabled())
+
+        latencies = []
+        read = {}
+
+        def jobs():
+            for i in range(number):
+                read[i] = time.perf_counter()
+                yield 'message', (PHONE_NUMBER, MESSAGE, 'ARN')
+
+        for result in self.engine.imap(jobs()):
+            latencies.append(time.perf_counter() - read.pop(result.index))
+
+        return latencies
+
+
+class AsyncioScenario(Scenario):
+    name = 'asyncio'
+
+    def run(self, number):
+        from telesign.aio.messaging import AsyncMessagingClient
+
+        latencies = []
+
+        async def send_all():
+            async with AsyncMessagingClient(CUSTOMER_ID, API_KEY, rest_endpoint=self.url,
+                                            retry_policy=RetryPolicy.disabled()) as client:
+                semaphore = asyncio.Semaphore(self.concurrency)
+
+                async def send():
+                    async with semaphore:
+                        started = time.perf_counter()
+                        await client.message(PHONE_NUMBER, MESSAGE, 'ARN')
+                        latencies.append(time.perf_counter() - started)
+
+                await asyncio.gather(*[send() for _ in range(number)])
+
+        asyncio.run(send_all())
+
+        return latencies
+
+
+SCENARIOS = dict((scenario.name, scenario) for scenario in
+                 (SingleScenario, ThreadsScenario, AsyncioScenario, BulkScenario, LookupScenario, ProcessScenario))
+
+
+def measure(scenario, number, memory_number):
+    scenario.run(min(number, 50))
+
+    started = time.perf_counter()
+    latencies = sorted(scenario.run(number))
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    scenario.run(memory_number)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'scenario': scenario.name,
+            'transport': scenario.transport if scenario.name != 'asyncio' else 'aiohttp',
+            'concurrency': scenario.in_flight(),
+            'requests': len(latencies),
+            'requests_per_second': len(latencies) / elapsed,
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'peak_kib_per_request': peak / 1024.0 / scenario.in_flight()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeleSign SDK benchmark suite.")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="scenario to run, may be repeated, defaults to all")
+    parser.add_argument('--transport', action='append', choices=TRANSPORTS,
+                        help="RestClient transport to use, may be repeated, defaults to all")
+    parser.add_argument('--requests', type=int, default=1000, help="requests sent per scenario")
+    parser.add_argument('--memory-requests', type=int, default=200, help="requests sent while tracing memory")
+    parser.add_argument('--concurrency', type=int, default=16, help="requests in flight in concurrent scenarios")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds the mock server waits per request")
+    parser.add_argument('--jitter', type=float, default=0.0, help="maximum seconds randomly added to the latency")
+    parser.add_argument('--json', metavar='PATH', help="also write the results as JSON to PATH")
+    args = parser.parse_args()
+
+    process, url = start_server_process('--latency', str(args.latency), '--jitter', str(args.jitter))
+
+    results = []
+    try:
+        print("{0:<8} {1:<12} {2:>5} {3:>10} {4:>10} {5:>10} {6:>13}".format(
+            "scenario", "transport", "conc", "req/s", "p50 ms", "p99 ms", "peak KiB/req"))
+
+        for name in args.scenario or sorted(SCENARIOS):
+            if name == 'asyncio':
+                transports = ['aiohttp']
+            elif name == 'process':
+                transports = ['requests']
+            else:
+                transports = args.transport or TRANSPORTS
+
+            for transport in transports:
+                result = measure(SCENARIOS[name](url, transport, args.concurrency), args.requests,
+                                 args.memory_requests)
+                results.append(result)
+
+                print("{scenario:<8} {transport:<12} {concurrency:>5} {requests_per_second:>10.0f} {p50_ms:>10.2f} "
+                      "{p99_ms:>10.2f} {peak_kib_per_request:>13.1f}".format(**result))
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'telesign': telesign.__version__,
+                       'python': platform.python_version(),
+                       'latency': args.latency,
+                       'jitter': args.jitter,
+                       'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
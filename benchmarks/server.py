@@ -0,0 +1,148 @@
+"""
+A local stand-in for the TeleSign REST API used by the benchmarks, serving canned responses for the messaging, voice,
+phoneid and score resources and their status resources over keep-alive HTTP/1.1 connections.
+
+    $ python benchmarks/server.py --port 8080 --latency 0.05
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _json(body):
+    return json.dumps(body).encode('utf-8')
+
+
+SEND_RESPONSE = _json({'reference_id': '0123456789ABCDEF0123456789ABCDEF',
+                       'status': {'code': 290,
+                                  'description': 'Message in progress',
+                                  'updated_on': '2017-04-25T19:02:51.000000Z'}})
+
+STATUS_RESPONSE = _json({'reference_id': '0123456789ABCDEF0123456789ABCDEF',
+                         'status': {'code': 200,
+                                    'description': 'Delivered to handset',
+                                    'updated_on': '2017-04-25T19:02:53.000000Z'},
+                         'submit_timestamp': '2017-04-25T19:02:51.000000Z'})
+
+PHONEID_RESPONSE = _json({'reference_id': '0123456789ABCDEF0123456789ABCDEF',
+                          'status': {'code': 300, 'description': 'Transaction successfully completed'},
+                          'numbering': {'original': {'complete_phone_number': '15555555555',
+                                                     'country_code': '1',
+                                                     'phone_number': '5555555555'},
+                                        'cleansing': {'call': {'country_code': '1',
+                                                               'phone_number': '5555555555',
+                                                               'cleansed_code': 100},
+                                                      'sms': {'country_code': '1',
+                                                              'phone_number': '5555555555',
+                                                              'cleansed_code': 100}}},
+                          'phone_type': {'code': '2', 'description': 'MOBILE'},
+                          'carrier': {'name': 'Example Wireless'},
+                          'location': {'city': 'Marina del Rey',
+                                       'country': {'iso2': 'US', 'iso3': 'USA', 'name': 'United States'},
+                                       'time_zone': {'name': 'America/Los_Angeles',
+                                                     'utc_offset_min': '-8',
+                                                     'utc_offset_max': '-8'}}})
+
+SCORE_RESPONSE = _json({'reference_id': '0123456789ABCDEF0123456789ABCDEF',
+                        'status': {'code': 300, 'description': 'Transaction successfully completed'},
+                        'phone_type': {'code': '2', 'description': 'MOBILE'},
+                        'carrier': {'name': 'Example Wireless'},
+                        'risk': {'level': 'low', 'recommendation': 'allow', 'score': 9}})
+
+NOT_FOUND_RESPONSE = _json({'status': {'code': 10033, 'description': 'Invalid resource'}})
+
+ROUTES = [
+    ('POST', re.compile(r'^/v1/(messaging|voice)$'), SEND_RESPONSE),
+    ('GET', re.compile(r'^/v1/(messaging|voice)/[^/]+$'), STATUS_RESPONSE),
+    ('POST', re.compile(r'^/v1/phoneid/[^/]+$'), PHONEID_RESPONSE),
+    ('POST', re.compile(r'^/v1/score/[^/]+$'), SCORE_RESPONSE),
+]
+
+
+class MockTeleSignHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    # headers and body are sent in a single segment, avoiding delayed ACK stalls
+    wbufsize = -1
+
+    def _handle(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        status_code, body = 404, NOT_FOUND_RESPONSE
+        for method, pattern, response in ROUTES:
+            if self.command == method and pattern.match(self.path):
+                status_code, body = 200, response
+                break
+
+        latency = self.server.latency
+        if self.server.jitter:
+            latency += random.uniform(0, self.server.jitter)
+        if latency > 0:
+            time.sleep(latency)
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockTeleSignServer(ThreadingHTTPServer):
+    """
+    :param latency: (optional) The seconds waited before responding to each request.
+    :param jitter: (optional) The maximum number of seconds randomly added to latency.
+    """
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, server_address, latency=0.0, jitter=0.0):
+        ThreadingHTTPServer.__init__(self, server_address, MockTeleSignHandler)
+        self.latency = latency
+        self.jitter = jitter
+
+
+def start_server_process(*args):
+    """
+    Starts the mock server in a child process, so it does not compete with the benchmark for the GIL.
+
+    :return: The (process, url) tuple, terminate the process when done.
+    """
+    process = subprocess.Popen([sys.executable, __file__, '--port', '0'] + list(args),
+                               stdout=subprocess.PIPE, universal_newlines=True)
+
+    return process, process.stdout.readline().strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds waited before each response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="maximum seconds randomly added to the latency")
+    args = parser.parse_args()
+
+    server = MockTeleSignServer((args.host, args.port), latency=args.latency, jitter=args.jitter)
+
+    print("http://{host}:{port}".format(host=args.host, port=server.server_address[1]))
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
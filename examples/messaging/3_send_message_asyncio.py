@@ -0,0 +1,23 @@
+from __future__ import print_function
+import asyncio
+
+from telesign.aio.messaging import AsyncMessagingClient
+
+customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+phone_numbers = ["phone_number_1", "phone_number_2", "phone_number_3"]
+message = "You're scheduled for a dentist appointment at 2:30PM."
+message_type = "ARN"
+
+
+async def main():
+    async with AsyncMessagingClient(customer_id, api_key) as messaging:
+        responses = await asyncio.gather(*[messaging.message(phone_number, message, message_type)
+                                           for phone_number in phone_numbers])
+
+    for phone_number, response in zip(phone_numbers, responses):
+        print("{}: {}".format(phone_number, response.json))
+
+
+asyncio.run(main())
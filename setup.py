@@ -1,6 +1,9 @@
+import re
+
 from setuptools import setup, find_packages
 
-version = "2.2.0"
+with open("telesign/__init__.py") as f:
+    version = re.search(r'^__version__ = "(.+)"$', f.read(), re.MULTILINE).group(1)
 
 try:
     with open("README") as f:
@@ -18,20 +21,23 @@ setup(name='telesign',
           "License :: OSI Approved :: MIT License",
           "Natural Language :: English",
           "Programming Language :: Python",
-          "Programming Language :: Python :: 2.6",
-          "Programming Language :: Python :: 2.7",
           "Programming Language :: Python :: 3",
-          "Programming Language :: Python :: 3.3",
-          "Programming Language :: Python :: 3.4",
-          "Programming Language :: Python :: 3.5",
-          "Programming Language :: Python :: 3.6",
+          "Programming Language :: Python :: 3 :: Only",
+          "Programming Language :: Python :: 3.7",
+          "Programming Language :: Python :: 3.8",
+          "Programming Language :: Python :: 3.9",
+          "Programming Language :: Python :: 3.10",
+          "Programming Language :: Python :: 3.11",
       ],
       long_description=readme_content,
       keywords='telesign, sms, voice, mobile, authentication, identity, messaging',
       author='TeleSign Corp.',
       author_email='support@telesign.com',
       url="https://github.com/telesign/python_telesign",
+      python_requires='>=3.7',
       install_requires=['requests'],
-      tests_require=['nose', 'mock', 'pytz', 'coverage', 'codecov'],
+      extras_require={'async': ['aiohttp'], 'arrow': ['pyarrow']},
+      entry_points={'console_scripts': ['telesign-enrich = telesign.enrich:main']},
+      tests_require=['pytest', 'pytest-cov', 'mock', 'pytz', 'codecov'],
       packages=find_packages(exclude=['test', 'test.*', 'examples', 'examples.*']),
       )
@@ -1,8 +1,6 @@
-from pkg_resources import get_distribution
+__path__ = __import__('pkgutil').extend_path(__path__, __name__)
 
-__import__('pkg_resources').declare_namespace(__name__)
-
-__version__ = get_distribution("telesign").version
+__version__ = "2.2.0"
 __author__ = "TeleSign"
 __copyright__ = "Copyright 2017, TeleSign Corp."
 __credits__ = ["TeleSign"]
@@ -0,0 +1,6 @@
+"""
+asyncio flavours of the TeleSign REST clients.
+
+These clients mirror :class:`telesign.rest.RestClient` and the product clients but perform their HTTP requests with
+aiohttp, so many requests can be in flight on a single event loop. Install with ``pip install telesign[async]``.
+"""
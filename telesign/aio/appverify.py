@@ -0,0 +1,26 @@
+from __future__ import unicode_literals
+
+from telesign.aio.rest import AsyncRestClient
+from telesign.appverify import APPVERIFY_STATUS_RESOURCE
+
+
+class AsyncAppVerifyClient(AsyncRestClient):
+    """
+    The asyncio counterpart of AppVerifyClient, used to check App Verify transactions from your backend.
+    """
+
+    def __init__(self, customer_id, api_key, **kwargs):
+        super(AsyncAppVerifyClient, self).__init__(customer_id, api_key, **kwargs)
+
+    async def status(self, external_id, **params):
+        """
+        Retrieves the verification result for an App Verify transaction by external_id. To ensure a secure verification
+        flow you must check the status using TeleSign's servers on your backend. Do not rely on the SDK alone to
+        indicate a successful verification.
+
+        See https://developer.telesign.com/docs/app-verify-android-sdk-self#section-get-status-service or
+        https://developer.telesign.com/docs/app-verify-ios-sdk-self#section-get-status-service for detailed
+        API documentation.
+        """
+        return await self.get(APPVERIFY_STATUS_RESOURCE.format(external_id=external_id),
+                              **params)
@@ -0,0 +1,47 @@
+from __future__ import unicode_literals
+
+from telesign.aio.rest import AsyncRestClient
+from telesign.otp import default_generator
+from telesign.messaging import MESSAGING_RESOURCE, MESSAGING_STATUS_RESOURCE, MESSAGING_VERIFICATION_TEMPLATE
+
+
+class AsyncMessagingClient(AsyncRestClient):
+    """
+    The asyncio counterpart of MessagingClient. TeleSign's Messaging API allows you to easily send SMS messages.
+    """
+
+    def __init__(self, customer_id, api_key, otp_generator=None, **kwargs):
+        super(AsyncMessagingClient, self).__init__(customer_id, api_key, **kwargs)
+
+        self.otp_generator = otp_generator if otp_generator is not None else default_generator()
+
+    async def message(self, phone_number, message, message_type, **params):
+        """
+        Send a message to the target phone_number.
+
+        See https://developer.telesign.com/docs/messaging-api for detailed API documentation.
+        """
+        return await self.post(MESSAGING_RESOURCE,
+                               phone_number=phone_number,
+                               message=message,
+                               message_type=message_type,
+                               **params)
+
+    async def send_verification_code(self, phone_number, template=MESSAGING_VERIFICATION_TEMPLATE, message_type='OTP',
+                                     **params):
+        """
+        Send a message containing a new one-time passcode to the target phone_number, see
+        MessagingClient.send_verification_code.
+        """
+        code = self.otp_generator.generate()
+
+        return code, await self.message(phone_number, template.format(code=code), message_type, **params)
+
+    async def status(self, reference_id, **params):
+        """
+        Retrieves the current status of the message.
+
+        See https://developer.telesign.com/docs/messaging-api for detailed API documentation.
+        """
+        return await self.get(MESSAGING_STATUS_RESOURCE.format(reference_id=reference_id),
+                              **params)
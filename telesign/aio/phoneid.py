@@ -0,0 +1,23 @@
+from __future__ import unicode_literals
+
+from telesign.aio.rest import AsyncRestClient
+from telesign.phoneid import PHONEID_RESOURCE
+
+
+class AsyncPhoneIdClient(AsyncRestClient):
+    """
+    The asyncio counterpart of PhoneIdClient, delivering deep phone number data attributes.
+    """
+
+    def __init__(self, customer_id, api_key, **kwargs):
+        super(AsyncPhoneIdClient, self).__init__(customer_id, api_key, **kwargs)
+
+    async def phoneid(self, phone_number, **params):
+        """
+        The PhoneID API provides a cleansed phone number, phone type, and telecom carrier information to determine the
+        best communication method - SMS or voice.
+
+        See https://developer.telesign.com/docs/phoneid-api for detailed API documentation.
+        """
+        return await self.post(PHONEID_RESOURCE.format(phone_number=phone_number),
+                               **params)
@@ -0,0 +1,57 @@
+from __future__ import unicode_literals
+
+import asyncio
+import time
+
+from telesign.poller import BaseStatusPoller
+
+
+class AsyncStatusPoller(BaseStatusPoller):
+    """
+    The asyncio counterpart of StatusPoller, status is a coroutine function such as AsyncMessagingClient.status.
+
+    Updates are delivered to the callback, and yielded when iterating over the poller with async for, which ends once
+    no transaction is left to poll.
+    """
+
+    async def poll_due(self):
+        """
+        Looks up every transaction that is due, with at most concurrency lookups in flight.
+
+        :return: The list of StatusUpdate objects emitted.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def lookup(tracked):
+            async with semaphore:
+                try:
+                    response, error = await self.status(tracked.reference_id), None
+                except Exception as e:
+                    response, error = None, e
+
+            return self._handle(tracked, response, error)
+
+        updates = await asyncio.gather(*[lookup(tracked) for tracked in self._pop_due(time.monotonic())])
+
+        return [update for update in updates if update is not None]
+
+    async def __aiter__(self):
+        while True:
+            next_due = self.next_due()
+
+            if next_due is None:
+                return
+
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            for update in await self.poll_due():
+                yield update
+
+    async def run(self):
+        """
+        Polls until no transaction is left to poll.
+        """
+        async for _ in self:
+            pass
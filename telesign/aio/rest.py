@@ -0,0 +1,225 @@
+from __future__ import unicode_literals
+
+import asyncio
+import json
+import time
+
+import aiohttp
+import requests
+
+from telesign.auth import RequestSigner
+from telesign.rest import UserAgent
+from telesign.retry import RetryPolicy
+
+
+class AsyncRestClient(requests.models.RequestEncodingMixin):
+    """
+    The TeleSign AsyncRestClient is the asyncio counterpart of RestClient, it can be extended to make requests against
+    any of TeleSign's REST API endpoints from within an event loop.
+
+    Requests are signed with the same RequestSigner as RestClient and url encoded with RequestEncodingMixin, so the
+    requests sent are identical to those sent by RestClient.
+
+    The underlying aiohttp session is created on first use, inside the running event loop, and should be released with
+    close() or by using the client as an async context manager.
+
+    See https://developer.telesign.com for detailed API documentation.
+    """
+    user_agent = UserAgent("aiohttp", lambda: aiohttp.__version__)
+
+    class Response(object):
+        """
+        A simple HTTP Response object to abstract the underlying aiohttp response, it exposes the same attributes as
+        RestClient.Response and likewise decodes body and json on first access only.
+
+        :param aiohttp_response: An aiohttp response object.
+        :param content: The response body that was read from aiohttp_response, as bytes.
+        """
+        __slots__ = ('status_code', 'headers', 'ok', 'content', '_encoding', '_body', '_json')
+
+        def __init__(self, aiohttp_response, content):
+            self.status_code = aiohttp_response.status
+            self.headers = aiohttp_response.headers
+            self.ok = aiohttp_response.status < 400
+            self.content = content
+
+            self._encoding = aiohttp_response.charset or 'utf-8'
+
+        @property
+        def body(self):
+            try:
+                return self._body
+            except AttributeError:
+                pass
+
+            self._body = self.content.decode(self._encoding, 'replace')
+
+            return self._body
+
+        @property
+        def json(self):
+            try:
+                return self._json
+            except AttributeError:
+                pass
+
+            try:
+                self._json = json.loads(self.body)
+            except (Exception, ValueError):
+                self._json = None
+
+            return self._json
+
+    def __init__(self,
+                 customer_id,
+                 api_key,
+                 rest_endpoint='https://rest-api.telesign.com',
+                 proxy=None,
+                 timeout=10,
+                 session=None,
+                 retry_policy=None,
+                 rate_limiter=None):
+        """
+        TeleSign AsyncRestClient useful for making generic RESTful requests against our API from asyncio code.
+
+        :param customer_id: Your customer_id string associated with your account.
+        :param api_key: Your api_key string associated with your account.
+        :param rest_endpoint: (optional) Override the default rest_endpoint to target another endpoint string.
+        :param proxy: (optional) The URL of the HTTP proxy to send requests through, as a string.
+        :param timeout: (optional) How long to wait for the whole request to complete before giving up, as a float.
+        :param session: (optional) An aiohttp.ClientSession to send requests with, it is not closed by close().
+        :param retry_policy: (optional) The telesign.retry.RetryPolicy deciding which failed requests are retried,
+            defaults to RetryPolicy(). Connection failures count as attempts, there is no session level retry.
+        :param rate_limiter: (optional) A telesign.ratelimit.RateLimiter pacing the requests of this client, it can be
+            shared with other clients.
+        """
+        self.customer_id = customer_id
+        self.api_key = api_key
+
+        self.signer = RequestSigner(customer_id, api_key, user_agent=self.user_agent)
+
+        self.api_host = rest_endpoint
+
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+        self.rate_limiter = rate_limiter
+
+        self.session = session
+        self._owns_session = session is None
+
+        self.proxy = proxy
+
+        self.timeout = timeout
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the aiohttp session created by this client, a session passed to the constructor is left open.
+        """
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def post(self, resource, **params):
+        """
+        Generic TeleSign REST API POST handler.
+
+        :param resource: The partial resource URI to perform the request against, as a string.
+        :param params: Body params to perform the POST request with, as a dictionary.
+        :return: The AsyncRestClient Response object.
+        """
+        return await self._execute('POST', resource, **params)
+
+    async def get(self, resource, **params):
+        """
+        Generic TeleSign REST API GET handler.
+
+        :param resource: The partial resource URI to perform the request against, as a string.
+        :param params: Body params to perform the GET request with, as a dictionary.
+        :return: The AsyncRestClient Response object.
+        """
+        return await self._execute('GET', resource, **params)
+
+    async def put(self, resource, **params):
+        """
+        Generic TeleSign REST API PUT handler.
+
+        :param resource: The partial resource URI to perform the request against, as a string.
+        :param params: Body params to perform the PUT request with, as a dictionary.
+        :return: The AsyncRestClient Response object.
+        """
+        return await self._execute('PUT', resource, **params)
+
+    async def delete(self, resource, **params):
+        """
+        Generic TeleSign REST API DELETE handler.
+
+        :param resource: The partial resource URI to perform the request against, as a string.
+        :param params: Body params to perform the DELETE request with, as a dictionary.
+        :return: The AsyncRestClient Response object.
+        """
+        return await self._execute('DELETE', resource, **params)
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+
+        return self.session
+
+    async def _execute(self, method_name, resource, **params):
+        """
+        Generic TeleSign REST API request handler.
+
+        :param method_name: The HTTP method name, as an upper case string.
+        :param resource: The partial resource URI to perform the request against, as a string.
+        :param params: Body params to perform the HTTP request with, as a dictionary.
+        :return: The AsyncRestClient Response object.
+        """
+        resource_uri = "{api_host}{resource}".format(api_host=self.api_host, resource=resource)
+
+        url_encoded_fields = self._encode_params(params)
+
+        retry_policy = self.retry_policy
+        retryable = retry_policy.is_retryable_request(method_name, params)
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(resource)
+
+            headers = self.signer.headers(method_name, resource, url_encoded_fields)
+
+            request = self._get_session().request(method_name,
+                                                  resource_uri,
+                                                  data=url_encoded_fields.encode('utf-8'),
+                                                  headers=headers,
+                                                  proxy=self.proxy,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+            try:
+                async with request as aiohttp_response:
+                    response = self.Response(aiohttp_response, await aiohttp_response.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not retryable:
+                    raise
+
+                delay = retry_policy.next_delay(attempt, time.monotonic() - started)
+                if delay is None:
+                    raise
+            else:
+                if not retryable or not retry_policy.is_retryable_response(response):
+                    return response
+
+                delay = retry_policy.next_delay(attempt, time.monotonic() - started, response)
+                if delay is None:
+                    return response
+
+            await asyncio.sleep(delay)
@@ -0,0 +1,24 @@
+from __future__ import unicode_literals
+
+from telesign.aio.rest import AsyncRestClient
+from telesign.score import SCORE_RESOURCE
+
+
+class AsyncScoreClient(AsyncRestClient):
+    """
+    The asyncio counterpart of ScoreClient, providing risk information about a specified phone number.
+    """
+
+    def __init__(self, customer_id, api_key, **kwargs):
+        super(AsyncScoreClient, self).__init__(customer_id, api_key, **kwargs)
+
+    async def score(self, phone_number, account_lifecycle_event, **params):
+        """
+        Score is an API that delivers reputation scoring based on phone number intelligence, traffic patterns, machine
+        learning, and a global data consortium.
+
+        See https://developer.telesign.com/docs/score-api for detailed API documentation.
+        """
+        return await self.post(SCORE_RESOURCE.format(phone_number=phone_number),
+                               account_lifecycle_event=account_lifecycle_event,
+                               **params)
@@ -0,0 +1,47 @@
+from __future__ import unicode_literals
+
+from telesign.aio.rest import AsyncRestClient
+from telesign.otp import default_generator
+from telesign.voice import VOICE_RESOURCE, VOICE_STATUS_RESOURCE, VOICE_VERIFICATION_TEMPLATE
+
+
+class AsyncVoiceClient(AsyncRestClient):
+    """
+    The asyncio counterpart of VoiceClient. TeleSign's Voice API allows you to easily send voice messages.
+    """
+
+    def __init__(self, customer_id, api_key, otp_generator=None, **kwargs):
+        super(AsyncVoiceClient, self).__init__(customer_id, api_key, **kwargs)
+
+        self.otp_generator = otp_generator if otp_generator is not None else default_generator()
+
+    async def call(self, phone_number, message, message_type, **params):
+        """
+        Send a voice call to the target phone_number.
+
+        See https://developer.telesign.com/docs/voice-api for detailed API documentation.
+        """
+        return await self.post(VOICE_RESOURCE,
+                               phone_number=phone_number,
+                               message=message,
+                               message_type=message_type,
+                               **params)
+
+    async def send_verification_code(self, phone_number, template=VOICE_VERIFICATION_TEMPLATE, message_type='OTP',
+                                     **params):
+        """
+        Call the target phone_number and read out a new one-time passcode, see VoiceClient.send_verification_code.
+        """
+        code = self.otp_generator.generate()
+        message = template.format(code=code, spoken_code=", ".join(code))
+
+        return code, await self.call(phone_number, message, message_type, **params)
+
+    async def status(self, reference_id, **params):
+        """
+        Retrieves the current status of the voice call.
+
+        See https://developer.telesign.com/docs/voice-api for detailed API documentation.
+        """
+        return await self.get(VOICE_STATUS_RESOURCE.format(reference_id=reference_id),
+                              **params)
@@ -0,0 +1,117 @@
+from __future__ import unicode_literals
+
+import hmac
+import os
+import time
+from base64 import b64encode, b64decode
+from binascii import hexlify
+from email.utils import formatdate
+from hashlib import sha256
+
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+AUTH_METHOD = "HMAC-SHA256"
+
+
+def random_nonce():
+    """
+    Generates a random version 4 UUID string, equivalent to but cheaper than str(uuid.uuid4()).
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0f | 0x40
+    raw[8] = raw[8] & 0x3f | 0x80
+    h = hexlify(bytes(raw)).decode("ascii")
+
+    return "{0}-{1}-{2}-{3}-{4}".format(h[:8], h[8:12], h[12:16], h[16:20], h[20:])
+
+
+class RequestSigner(object):
+    """
+    Signs TeleSign REST API requests for one account, producing the same headers as
+    RestClient.generate_telesign_headers.
+
+    The api_key is decoded and the HMAC key schedule is prepared once, when the signer is created, each request only
+    copies the prepared HMAC. The rfc 2616 date is formatted at most once per second. A signer holds no per-request
+    state and can be shared between threads.
+
+    :param customer_id: Your account customer_id.
+    :param api_key: Your account api_key.
+    :param user_agent: (optional) User Agent added to the headers of every request, as a string.
+    """
+
+    def __init__(self, customer_id, api_key, user_agent=None):
+        self.customer_id = customer_id
+        self.user_agent = user_agent
+
+        self._hmac = hmac.new(b64decode(api_key), digestmod=sha256)
+        self._authorization_prefix = "TSA {customer_id}:".format(customer_id=customer_id)
+        self._date = (None, None)
+
+    def date_rfc2616(self):
+        """
+        The current date and time formatted in rfc 2616, cached for the current second.
+        """
+        now = int(time.time())
+        second, date = self._date
+
+        if second != now:
+            date = formatdate(now, usegmt=True)
+            self._date = (now, date)
+
+        return date
+
+    def signature(self, string_to_sign):
+        """
+        The base64 encoded HMAC-SHA256 signature of string_to_sign.
+        """
+        signer = self._hmac.copy()
+        signer.update(string_to_sign.encode("utf-8"))
+
+        return b64encode(signer.digest()).decode("utf-8")
+
+    def headers(self, method_name, resource, url_encoded_fields, date_rfc2616=None, nonce=None):
+        """
+        Generates the TeleSign REST API headers used to authenticate a request.
+
+        :param method_name: The HTTP method name of the request as a upper case string, should be one of 'POST', 'GET',
+            'PUT' or 'DELETE'.
+        :param resource: The partial resource URI to perform the request against, as a string.
+        :param url_encoded_fields: HTTP body parameters to perform the HTTP request with, must be a urlencoded string.
+        :param date_rfc2616: (optional) The date and time of the request formatted in rfc 2616, as a string.
+        :param nonce: (optional) A unique cryptographic nonce for the request, as a string.
+        :return: The TeleSign authentication headers.
+        """
+        if date_rfc2616 is None:
+            date_rfc2616 = self.date_rfc2616()
+
+        if nonce is None:
+            nonce = random_nonce()
+
+        if method_name == "POST" or method_name == "PUT":
+            content_type = FORM_CONTENT_TYPE
+
+            if url_encoded_fields:
+                string_to_sign = (method_name + "\n" + content_type + "\n" + date_rfc2616 +
+                                  "\nx-ts-auth-method:" + AUTH_METHOD + "\nx-ts-nonce:" + nonce +
+                                  "\n" + url_encoded_fields + "\n" + resource)
+            else:
+                string_to_sign = (method_name + "\n" + content_type + "\n" + date_rfc2616 +
+                                  "\nx-ts-auth-method:" + AUTH_METHOD + "\nx-ts-nonce:" + nonce +
+                                  "\n" + resource)
+        else:
+            content_type = ""
+            string_to_sign = (method_name + "\n\n" + date_rfc2616 +
+                              "\nx-ts-auth-method:" + AUTH_METHOD + "\nx-ts-nonce:" + nonce +
+                              "\n" + resource)
+
+        headers = {
+            "Authorization": self._authorization_prefix + self.signature(string_to_sign),
+            "Date": date_rfc2616,
+            "Content-Type": content_type,
+            "x-ts-auth-method": AUTH_METHOD,
+            "x-ts-nonce": nonce
+        }
+
+        if self.user_agent:
+            headers['User-Agent'] = self.user_agent
+
+        return headers
@@ -0,0 +1,107 @@
+from __future__ import unicode_literals
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class BulkResult(object):
+    """
+    The outcome of one item of a bulk operation.
+
+    :param index: The position of the item in the input iterable, as an int.
+    :param item: The input item.
+    :param response: The RestClient Response object, or None if the request raised.
+    :param error: The exception raised while processing the item, or None.
+    """
+    __slots__ = ('index', 'item', 'response', 'error')
+
+    def __init__(self, index, item, response=None, error=None):
+        self.index = index
+        self.item = item
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.response is not None and bool(self.response.ok)
+
+    def __repr__(self):
+        return "BulkResult(index={index}, ok={ok})".format(index=self.index, ok=self.ok)
+
+
+def _call(function, index, item):
+    try:
+        return BulkResult(index, item, response=function(item))
+    except Exception as e:
+        return BulkResult(index, item, error=e)
+
+
+def unique(items, key):
+    """
+    The (index, item) pairs of the items whose key was not seen at an earlier index.
+
+    :param items: Iterable of items, consumed lazily.
+    :param key: Callable returning the key identifying duplicates of an item.
+    """
+    seen = set()
+
+    for index, item in enumerate(items):
+        item_key = key(item)
+
+        if item_key not in seen:
+            seen.add(item_key)
+            yield index, item
+
+
+def imap_bounded(function, iterable, concurrency=8, ordered=True, max_pending=None, unique_key=None):
+    """
+    Lazily apply function to every item of iterable on a pool of threads, yielding a BulkResult per item.
+
+    At most concurrency calls run at once and the input is only consumed as fast as results are yielded, so neither the
+    input nor the results are ever held in memory as a whole. Exceptions raised by function are returned in
+    BulkResult.error instead of aborting the iteration.
+
+    :param function: Callable invoked with each item, its return value is stored in BulkResult.response.
+    :param iterable: The items to process, consumed lazily.
+    :param concurrency: (optional) The number of worker threads, as an int.
+    :param ordered: (optional) Whether results are yielded in input order, rather than in completion order.
+    :param max_pending: (optional) The maximum number of submitted but not yet yielded items, as an int. Defaults to
+        twice the concurrency, a larger window lets ordered iteration make progress past a slow item.
+    :param unique_key: (optional) Callable returning the key of an item. An item whose key was already seen is a
+        duplicate, function is not called for it and no BulkResult is yielded for it, the index of the other results is
+        still their position in iterable. The keys seen are kept in memory.
+    :return: A generator of BulkResult objects.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    max_pending = max(max_pending or 2 * concurrency, concurrency)
+    items = enumerate(iterable) if unique_key is None else unique(iterable, unique_key)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if ordered:
+            pending = deque()
+
+            for index, item in items:
+                pending.append(executor.submit(_call, function, index, item))
+
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+
+            for index, item in items:
+                pending.add(executor.submit(_call, function, index, item))
+
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
@@ -0,0 +1,190 @@
+from __future__ import unicode_literals
+
+import threading
+import time
+from collections import OrderedDict
+
+from requests.models import RequestEncodingMixin
+
+from telesign.phonenumber import phone_number_key
+from telesign.singleflight import SingleFlight
+
+
+class CacheBackend(object):
+    """
+    The interface of a ResponseCache storage backend. Subclass it to store responses in an external service such as
+    memcached or Redis, keys are strings and values are RestClient Response objects.
+    """
+
+    def get(self, key):
+        """
+        The value stored under key, or None if there is none or it has expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        """
+        Stores value under key for ttl seconds.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Removes the value stored under key, if any.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Removes every stored value.
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    A thread-safe in-process CacheBackend with per-entry expiry and least recently used eviction.
+
+    :param maxsize: (optional) The maximum number of entries, the least recently used entry is evicted beyond it.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires, value = entry
+
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache(object):
+    """
+    Caches successful lookup responses, such as those of PhoneID and Score, so that repeated lookups of the same phone
+    number within ttl seconds are answered without a billable request. Concurrent identical lookups that miss the cache
+    are coalesced, only one request is sent and its response is shared.
+
+    A ResponseCache is thread-safe and can be shared by several clients, cache keys include the customer_id, the
+    endpoint and the resource.
+
+    :param backend: (optional) The CacheBackend storing responses, defaults to a MemoryCache.
+    :param ttl: (optional) The number of seconds a response is cached for.
+    """
+
+    def __init__(self, backend=None, ttl=300):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+
+        self._single_flight = SingleFlight()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(customer_id, api_host, resource, phone_number, params):
+        """
+        The cache key of a lookup, phone numbers that only differ in formatting share a key.
+
+        :param customer_id: The customer_id of the client making the lookup, as a string.
+        :param api_host: The endpoint of the client making the lookup, such as its rest_endpoint, as a string.
+        :param resource: The resource template of the lookup, as a string.
+        :param phone_number: The phone number looked up, as a string.
+        :param params: The params of the lookup, as a dictionary.
+        """
+        return "{customer_id}|{api_host}{resource}|{phone_number}|{params}".format(
+            customer_id=customer_id,
+            api_host=api_host,
+            resource=resource,
+            phone_number=phone_number_key(phone_number),
+            params=RequestEncodingMixin._encode_params(sorted(params.items())))
+
+    def fetch(self, key, function):
+        """
+        The cached response under key, or the response returned by function, which is cached if it is ok.
+
+        :param key: The cache key, see ResponseCache.key.
+        :param function: Callable taking no arguments and returning a RestClient Response object.
+        """
+        response = self.backend.get(key)
+
+        if response is not None:
+            with self._lock:
+                self.hits += 1
+            return response
+
+        with self._lock:
+            self.misses += 1
+
+        return self._single_flight.do(key, lambda: self._load(key, function))
+
+    def _load(self, key, function):
+        response = self.backend.get(key)
+
+        if response is not None:
+            return response
+
+        response = function()
+
+        if response.ok and self.ttl > 0:
+            self.backend.set(key, response, self.ttl)
+
+        return response
+
+
+class RequestCoalescer(ResponseCache):
+    """
+    Single-flight deduplication of identical GET requests, such as status polls of the same reference_id from several
+    threads: concurrent identical requests share one HTTP request and its Response. With a freshness window, an ok
+    response also answers identical requests made within freshness seconds after it was received.
+
+    Pass it to a RestClient as coalescer, it can be shared by several clients.
+
+    :param freshness: (optional) The number of seconds a response is reused for, 0 only coalesces concurrent requests.
+    :param maxsize: (optional) The maximum number of fresh responses kept.
+    """
+
+    def __init__(self, freshness=0, maxsize=1000):
+        super(RequestCoalescer, self).__init__(backend=MemoryCache(maxsize=maxsize), ttl=freshness)
+
+    @staticmethod
+    def request_key(customer_id, resource_uri, url_encoded_fields):
+        """
+        The key identifying identical requests.
+        """
+        return "{customer_id}|{resource_uri}|{fields}".format(customer_id=customer_id,
+                                                              resource_uri=resource_uri,
+                                                              fields=url_encoded_fields)
@@ -0,0 +1,101 @@
+from __future__ import unicode_literals
+
+import hmac
+import json
+from base64 import b64decode, b64encode
+from collections import namedtuple
+from hashlib import sha256
+
+DeliveryReport = namedtuple('DeliveryReport', ['reference_id',
+                                               'status_code',
+                                               'status_description',
+                                               'updated_on',
+                                               'submit_timestamp',
+                                               'sub_resource',
+                                               'errors'])
+DeliveryReport.__doc__ = """
+A delivery report sent by TeleSign to your callback URL, see parse_delivery_report.
+"""
+
+
+def parse_delivery_report(body):
+    """
+    Parses the JSON body of a delivery report callback into a DeliveryReport.
+
+    :param body: The POST body of the callback, as bytes or a string.
+    :return: The DeliveryReport, fields missing from the body are None.
+    """
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+
+    report = json.loads(body)
+    status = report.get('status') or {}
+
+    return DeliveryReport(reference_id=report.get('reference_id'),
+                          status_code=status.get('code'),
+                          status_description=status.get('description'),
+                          updated_on=status.get('updated_on'),
+                          submit_timestamp=report.get('submit_timestamp'),
+                          sub_resource=report.get('sub_resource'),
+                          errors=tuple(report.get('errors') or ()))
+
+
+class CallbackVerifier(object):
+    """
+    Verifies that callbacks were sent by TeleSign, for receivers handling many callbacks with the same api_key.
+
+    The api_key is decoded and the HMAC key schedule is prepared once, and signatures are compared in constant time with
+    hmac.compare_digest. A CallbackVerifier holds no per-callback state and can be shared between threads.
+
+    :param api_key: The TeleSign API api_key associated with your account.
+    """
+
+    def __init__(self, api_key):
+        self._hmac = hmac.new(b64decode(api_key), digestmod=sha256)
+
+    def signature(self, body):
+        """
+        The expected signature of body, as base64 encoded bytes.
+
+        :param body: The POST body of the callback, as bytes or a string.
+        """
+        signer = self._hmac.copy()
+        signer.update(body if isinstance(body, bytes) else body.encode('utf-8'))
+
+        return b64encode(signer.digest())
+
+    def verify(self, signature, body):
+        """
+        Whether signature is the valid signature of body.
+
+        :param signature: The TeleSign Authorization header value supplied in the callback, as a string or bytes.
+        :param body: The POST body of the callback, as bytes or a string. Pass the raw bytes received when available.
+        """
+        if not isinstance(signature, bytes):
+            signature = signature.encode('utf-8')
+
+        return hmac.compare_digest(self.signature(body), signature)
+
+    def verify_many(self, callbacks):
+        """
+        Verifies a batch of queued callbacks.
+
+        :param callbacks: Iterable of (signature, body) tuples.
+        :return: A list of booleans, True for each callback with a valid signature.
+        """
+        verify = self.verify
+
+        return [verify(signature, body) for signature, body in callbacks]
+
+    def parse(self, signature, body):
+        """
+        Verifies a delivery report callback and parses it.
+
+        :param signature: The TeleSign Authorization header value supplied in the callback, as a string or bytes.
+        :param body: The POST body of the callback, as bytes or a string.
+        :return: The DeliveryReport, or None if the signature is not valid.
+        """
+        if not self.verify(signature, body):
+            return None
+
+        return parse_delivery_report(body)
@@ -0,0 +1,223 @@
+from __future__ import unicode_literals
+
+import threading
+import time
+from collections import deque
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request when the circuit breaker of every endpoint is open.
+    """
+
+
+class CircuitBreaker(object):
+    """
+    Fails requests fast while an endpoint is unhealthy, instead of letting every caller wait for its timeout.
+
+    The outcome of the last window calls is kept. Once at least minimum_calls are known and the share of failed calls
+    reaches failure_rate_threshold, or the share of calls slower than slow_call_seconds reaches
+    slow_call_rate_threshold, the breaker opens and rejects calls. After reset_timeout seconds it is half open and lets
+    a single trial call through, which closes it on success and opens it again on failure.
+
+    :param failure_rate_threshold: (optional) The share of failed calls opening the breaker, between 0 and 1.
+    :param slow_call_seconds: (optional) The duration above which a call is slow, slow calls are not tracked if None.
+    :param slow_call_rate_threshold: (optional) The share of slow calls opening the breaker, between 0 and 1.
+    :param window: (optional) The number of most recent calls considered, as an int.
+    :param minimum_calls: (optional) The number of calls needed before the breaker can open, as an int.
+    :param reset_timeout: (optional) The seconds an open breaker waits before letting a trial call through.
+    """
+
+    def __init__(self,
+                 failure_rate_threshold=0.5,
+                 slow_call_seconds=None,
+                 slow_call_rate_threshold=0.8,
+                 window=20,
+                 minimum_calls=10,
+                 reset_timeout=30.0):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.reset_timeout = reset_timeout
+
+        self._calls = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened >= self.reset_timeout:
+                return HALF_OPEN
+
+            return self._state
+
+    def allow(self):
+        """
+        Whether a call may be made now. A True answer in the half open state reserves the trial call, its outcome must
+        be recorded.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+
+            if self._state == OPEN:
+                if time.monotonic() - self._opened < self.reset_timeout:
+                    return False
+
+                self._state = HALF_OPEN
+
+            if self._trial_in_flight:
+                return False
+
+            self._trial_in_flight = True
+
+            return True
+
+    def release(self):
+        """
+        Gives back a call allowed but never made, so the trial call reserved in the half open state, if any, can be
+        made by another caller.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record(self, success, elapsed):
+        """
+        Records the outcome of a call.
+
+        :param success: Whether the call succeeded.
+        :param elapsed: The duration of the call in seconds.
+        """
+        slow = self.slow_call_seconds is not None and elapsed > self.slow_call_seconds
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_in_flight = False
+
+                if success and not slow:
+                    self._state = CLOSED
+                    self._calls.clear()
+                else:
+                    self._open()
+
+                return
+
+            self._calls.append((success, slow))
+
+            if self._state == CLOSED and len(self._calls) >= self.minimum_calls:
+                failures = sum(1 for call_success, _ in self._calls if not call_success)
+                slow_calls = sum(1 for _, call_slow in self._calls if call_slow)
+
+                if (failures >= self.failure_rate_threshold * len(self._calls) or
+                        slow_calls >= self.slow_call_rate_threshold * len(self._calls)):
+                    self._open()
+
+    def _open(self):
+        self._state = OPEN
+        self._opened = time.monotonic()
+        self._calls.clear()
+
+
+class Endpoint(object):
+    """
+    A REST endpoint of an EndpointPool, with its circuit breaker and moving average latency.
+    """
+    __slots__ = ('url', 'breaker', 'latency')
+
+    def __init__(self, url, breaker):
+        self.url = url
+        self.breaker = breaker
+        self.latency = None
+
+    def __repr__(self):
+        return "Endpoint({url!r}, state={state})".format(url=self.url, state=self.breaker.state)
+
+
+class EndpointPool(object):
+    """
+    Several equivalent TeleSign REST endpoints, each guarded by its own CircuitBreaker, pass it to RestClient as
+    rest_endpoint. A pool can be shared by several clients so that they share the health of the endpoints.
+
+    Every request goes to an endpoint whose breaker allows it. With the latency strategy the endpoint with the lowest
+    exponentially weighted moving average latency is chosen, endpoints without measurements first. With the priority
+    strategy the first allowed endpoint in the given order is chosen, so the others are only used for failover.
+
+    A response with a status code of 500 or above, or a connection failure, counts as a failure. Only the latency of
+    successful requests is averaged.
+
+    :param endpoints: The endpoint URLs, as a list of strings.
+    :param strategy: (optional) Either 'latency' or 'priority'.
+    :param latency_smoothing: (optional) The weight of the latest latency in the moving average, between 0 and 1.
+    :param breaker_options: (optional) Keyword arguments of the CircuitBreaker of each endpoint.
+    """
+
+    def __init__(self, endpoints, strategy='latency', latency_smoothing=0.2, **breaker_options):
+        if not endpoints:
+            raise ValueError("at least one endpoint is required")
+
+        if strategy not in ('latency', 'priority'):
+            raise ValueError("strategy must be 'latency' or 'priority'")
+
+        self.endpoints = [Endpoint(url, CircuitBreaker(**breaker_options)) for url in endpoints]
+        self.strategy = strategy
+        self.latency_smoothing = latency_smoothing
+
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self):
+        return self.endpoints[0].url
+
+    def _candidates(self):
+        if self.strategy == 'priority':
+            return self.endpoints
+
+        with self._lock:
+            return sorted(self.endpoints, key=lambda endpoint: endpoint.latency or 0.0)
+
+    def select(self):
+        """
+        The Endpoint the next request should be sent to.
+
+        :raises CircuitOpenError: if the circuit breaker of every endpoint is open.
+        """
+        for endpoint in self._candidates():
+            if endpoint.breaker.allow():
+                return endpoint
+
+        raise CircuitOpenError("the circuit breaker of every endpoint is open: {urls}".format(
+            urls=", ".join(endpoint.url for endpoint in self.endpoints)))
+
+    def release(self, endpoint):
+        """
+        Gives back an endpoint returned by select to which no request was sent.
+        """
+        endpoint.breaker.release()
+
+    def record(self, endpoint, success, elapsed):
+        """
+        Records the outcome of a request sent to endpoint.
+
+        :param endpoint: The Endpoint returned by select.
+        :param success: Whether the request succeeded.
+        :param elapsed: The duration of the request in seconds.
+        """
+        endpoint.breaker.record(success, elapsed)
+
+        if not success:
+            return
+
+        with self._lock:
+            if endpoint.latency is None:
+                endpoint.latency = elapsed
+            else:
+                endpoint.latency += self.latency_smoothing * (elapsed - endpoint.latency)
@@ -0,0 +1,267 @@
+from __future__ import unicode_literals
+
+import csv
+import io
+import math
+import os
+from array import array
+
+from telesign.util import lookup_field
+
+INT = 'int'
+FLOAT = 'float'
+CATEGORY = 'category'
+STRING = 'str'
+
+
+class Column(object):
+    """
+    A column of a ResultAccumulator: a field of the lookup responses, stored in a compact array of its kind.
+
+    An int column holds 64 bit integers and a byte of validity per row, a float column holds doubles with NaN for
+    missing values, a category column holds a 32 bit code per row into its distinct values, and a str column holds
+    the strings themselves. Category suits fields with few distinct values, such as a phone type or a carrier name.
+
+    :param name: The name of the column.
+    :param path: The dotted path of the field in the response JSON, see telesign.util.lookup_field.
+    :param kind: (optional) INT, FLOAT, CATEGORY or STRING.
+    """
+    __slots__ = ('name', 'path', 'kind', 'values', 'valid', 'categories', 'codes')
+
+    def __init__(self, name, path, kind=STRING):
+        if kind not in (INT, FLOAT, CATEGORY, STRING):
+            raise ValueError("unsupported column kind {kind!r}".format(kind=kind))
+
+        self.name = name
+        self.path = path
+        self.kind = kind
+        self.clear()
+
+    def clear(self):
+        """
+        Removes all the values of the column.
+        """
+        self.values = array('q') if self.kind == INT else array('d') if self.kind == FLOAT else \
+            array('i') if self.kind == CATEGORY else []
+        self.valid = bytearray()
+        self.categories = []
+        self.codes = {}
+
+    def append(self, value):
+        """
+        Appends a value, None or a value that cannot be converted to the kind of the column is stored as missing.
+        """
+        if self.kind == INT:
+            try:
+                # raises OverflowError beyond 64 bits, before anything is appended
+                self.values.append(int(value))
+            except (TypeError, ValueError, OverflowError):
+                self.values.append(0)
+                self.valid.append(0)
+            else:
+                self.valid.append(1)
+
+        elif self.kind == FLOAT:
+            try:
+                self.values.append(float(value) if value is not None else math.nan)
+            except (TypeError, ValueError):
+                self.values.append(math.nan)
+
+        elif self.kind == CATEGORY:
+            if value is None:
+                self.values.append(-1)
+                return
+
+            value = str(value)
+
+            try:
+                code = self.codes[value]
+            except KeyError:
+                code = self.codes[value] = len(self.categories)
+                self.categories.append(value)
+
+            self.values.append(code)
+
+        else:
+            self.values.append(str(value) if value is not None else None)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if self.kind == INT:
+            return self.values[index] if self.valid[index] else None
+
+        if self.kind == FLOAT:
+            value = self.values[index]
+            return None if math.isnan(value) else value
+
+        if self.kind == CATEGORY:
+            code = self.values[index]
+            return self.categories[code] if code >= 0 else None
+
+        return self.values[index]
+
+    def __iter__(self):
+        for index in range(len(self.values)):
+            yield self[index]
+
+    def to_arrow(self):
+        """
+        The column as a pyarrow Array, a DictionaryArray for a category column. The int, float and category arrays
+        are read by pyarrow from their buffers, rather than converted value by value.
+        """
+        import pyarrow
+        import pyarrow.compute
+
+        if self.kind == STRING:
+            return pyarrow.array(self.values, type=pyarrow.string())
+
+        length = len(self.values)
+        arrow_type = {INT: pyarrow.int64(), FLOAT: pyarrow.float64(), CATEGORY: pyarrow.int32()}[self.kind]
+        values = pyarrow.Array.from_buffers(arrow_type, length, [None, pyarrow.py_buffer(self.values)])
+
+        if self.kind == INT:
+            valid = pyarrow.Array.from_buffers(pyarrow.uint8(), length, [None, pyarrow.py_buffer(bytes(self.valid))])
+            valid = pyarrow.compute.not_equal(valid, 0)
+        elif self.kind == FLOAT:
+            valid = pyarrow.compute.invert(pyarrow.compute.is_nan(values))
+        else:
+            valid = pyarrow.compute.greater_equal(values, 0)
+
+        values = pyarrow.compute.if_else(valid, values, pyarrow.scalar(None, arrow_type))
+
+        if self.kind == CATEGORY:
+            return pyarrow.DictionaryArray.from_arrays(values, pyarrow.array(self.categories, type=pyarrow.string()))
+
+        return values
+
+
+def default_columns():
+    """
+    The columns of a ResultAccumulator by default: the status code of the response, and the phone type and carrier
+    of PhoneID or the risk level and score of Score, missing from the rows of the other.
+    """
+    return [Column('status_code', 'status.code', INT),
+            Column('phone_type', 'phone_type.description', CATEGORY),
+            Column('carrier', 'carrier.name', CATEGORY),
+            Column('risk_level', 'risk.level', CATEGORY),
+            Column('risk_score', 'risk.score', INT)]
+
+
+class ResultAccumulator(object):
+    """
+    Collects the fields of many PhoneID or Score responses into compact columns, for export to CSV or, with pyarrow
+    installed, to an Arrow table or a Parquet file.
+
+    Only the fields of the columns are kept, not the response dictionaries, so a million results with the default
+    columns take about a hundred megabytes, most of it the phone numbers. Rows enriched by telesign.enrich.Enricher
+    can be added too, with paths prefixed by their operation, such as Column('risk_level', 'score.risk.level',
+    CATEGORY).
+
+    :param columns: (optional) A list of Column, defaults to default_columns().
+    :param phone_column: (optional) The name of the column of phone numbers, or None to leave them out.
+    """
+
+    def __init__(self, columns=None, phone_column='phone_number'):
+        self.phone_column = phone_column
+        self.columns = ([Column(phone_column, None, STRING)] if phone_column else []) + \
+            list(columns if columns is not None else default_columns())
+
+        names = [column.name for column in self.columns]
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate column names in {names}".format(names=names))
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    @property
+    def names(self):
+        """
+        The names of the columns, in order.
+        """
+        return [column.name for column in self.columns]
+
+    def add(self, phone_number, response):
+        """
+        Adds the fields of a response.
+
+        :param phone_number: The phone number looked up, as a string.
+        :param response: The RestClient Response object, or its decoded JSON.
+        """
+        document = getattr(response, 'json', response)
+
+        for column in self.columns:
+            if column.path is None:
+                column.append(phone_number)
+            else:
+                column.append(lookup_field(document, column.path))
+
+    def add_row(self, row):
+        """
+        Adds an enriched row, the phone number is read from the phone column of the row.
+        """
+        self.add(row.get(self.phone_column), row)
+
+    def extend(self, results):
+        """
+        Adds an iterable of (phone_number, response) pairs.
+        """
+        for phone_number, response in results:
+            self.add(phone_number, response)
+
+    def column(self, name):
+        """
+        The Column named name.
+        """
+        for column in self.columns:
+            if column.name == name:
+                return column
+
+        raise KeyError(name)
+
+    def rows(self):
+        """
+        The rows of the accumulator, as tuples in column order, None for missing values.
+        """
+        return zip(*self.columns)
+
+    def clear(self):
+        """
+        Removes all the rows.
+        """
+        for column in self.columns:
+            column.clear()
+
+    def to_csv(self, path_or_file):
+        """
+        Writes the rows as CSV with a header row, missing values as empty fields.
+
+        :param path_or_file: The path of the file, as a string or path-like object, or an open text file.
+        """
+        if not hasattr(path_or_file, 'write'):
+            with io.open(os.fspath(path_or_file), 'w', encoding='utf-8', newline='') as f:
+                return self.to_csv(f)
+
+        writer = csv.writer(path_or_file, lineterminator='\n')
+        writer.writerow(self.names)
+        writer.writerows(self.rows())
+
+    def to_arrow(self):
+        """
+        The rows as a pyarrow Table, which requires pyarrow to be installed.
+        """
+        import pyarrow
+
+        return pyarrow.table([column.to_arrow() for column in self.columns], names=self.names)
+
+    def to_parquet(self, path, **options):
+        """
+        Writes the rows to a Parquet file, which requires pyarrow to be installed.
+
+        :param path: The path of the file.
+        :param options: (optional) Keyword arguments of pyarrow.parquet.write_table, such as compression.
+        """
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self.to_arrow(), path, **options)
@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import time
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when a request is abandoned because its deadline passed before it could be sent.
+    """
+
+
+class Deadline(object):
+    """
+    A point in time by which a request must complete, carried across retries, rate limiting and queueing.
+
+    RestClient methods accept either a Deadline or a number of seconds from the call, create a Deadline up front to
+    count time spent queueing before the call as well.
+
+    :param seconds: The number of seconds from now until the deadline.
+    """
+    __slots__ = ('expires',)
+
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + seconds
+
+    @classmethod
+    def coerce(cls, deadline):
+        """
+        The Deadline for deadline given as a Deadline, a number of seconds from now, or None.
+        """
+        if deadline is None or isinstance(deadline, cls):
+            return deadline
+
+        return cls(deadline)
+
+    def remaining(self):
+        """
+        The number of seconds left until the deadline, negative once it passed.
+        """
+        return self.expires - time.monotonic()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        """
+        Raises DeadlineExceeded if the deadline passed, otherwise returns the number of seconds left.
+        """
+        remaining = self.remaining()
+
+        if remaining <= 0:
+            raise DeadlineExceeded("deadline exceeded by {seconds:.3f}s".format(seconds=-remaining))
+
+        return remaining
+
+    def bound(self, timeout):
+        """
+        A timeout, a float or a (connect, read) tuple, shortened so that it ends by the deadline.
+        """
+        remaining = self.check()
+
+        if isinstance(timeout, tuple):
+            return tuple(remaining if value is None else min(value, remaining) for value in timeout)
+
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __repr__(self):
+        return "Deadline(remaining={remaining:.3f})".format(remaining=self.remaining())
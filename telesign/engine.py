@@ -0,0 +1,196 @@
+from __future__ import unicode_literals
+
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+
+from telesign.bulk import BulkResult
+from telesign.messaging import MessagingClient
+from telesign.phoneid import PhoneIdClient
+from telesign.score import ScoreClient
+from telesign.voice import VoiceClient
+
+OPERATIONS = {
+    'message': (MessagingClient, 'message'),
+    'call': (VoiceClient, 'call'),
+    'phoneid': (PhoneIdClient, 'phoneid'),
+    'score': (ScoreClient, 'score'),
+}
+"""
+The operations a job may name, mapped to the client class and method performing it.
+"""
+
+_worker = None
+
+
+class _Worker(object):
+    """
+    The state of a worker process: one warm client per operation, created on first use, and the threads sending the
+    jobs of a chunk concurrently.
+    """
+
+    def __init__(self, customer_id, api_key, threads, parse_json, client_options):
+        self.customer_id = customer_id
+        self.api_key = api_key
+        self.parse_json = parse_json
+        self.client_options = dict(client_options, raw_responses=True, max_concurrency=threads)
+        self.clients = {}
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+
+    def client(self, client_class):
+        client = self.clients.get(client_class)
+
+        if client is None:
+            client = self.clients[client_class] = client_class(self.customer_id, self.api_key, **self.client_options)
+
+        return client
+
+    def run(self, indexed_job):
+        index, job = indexed_job
+
+        try:
+            client_class, method_name = OPERATIONS[job[0]]
+            params = job[2] if len(job) > 2 and job[2] else {}
+
+            response = getattr(self.client(client_class), method_name)(*job[1], **params)
+
+            if self.parse_json:
+                response.json
+
+            return BulkResult(index, job, response=response)
+        except Exception as e:
+            return BulkResult(index, job, error=_picklable(e))
+
+
+def _picklable(error):
+    """
+    The error itself if it can be sent back to the dispatcher, otherwise a RuntimeError describing it.
+    """
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(repr(error))
+
+
+def _init_worker(customer_id, api_key, threads, parse_json, client_options):
+    global _worker
+    _worker = _Worker(customer_id, api_key, threads, parse_json, client_options)
+
+
+def _run_chunk(chunk):
+    return list(_worker.executor.map(_worker.run, chunk))
+
+
+class ProcessEngine(object):
+    """
+    Sends a stream of jobs from a pool of worker processes, so that signing, url encoding and JSON parsing of
+    responses scale with the number of cores instead of competing for the GIL of a single process.
+
+    Every worker process keeps its own warm clients and sends the jobs of a chunk from a pool of threads. The jobs are
+    consumed lazily in chunks and at most max_pending chunks are in flight at once, so the input is only read as fast as
+    the results are consumed.
+
+    A job is an (operation, args) or (operation, args, params) tuple, where operation is a key of OPERATIONS, args a
+    tuple of positional arguments and params a dictionary of additional parameters of the client method, for example
+    ('message', ('+15555550100', 'Your code is 12345', 'OTP')) or ('phoneid', ('+15555550100',)). Jobs, params and
+    client_options must be picklable.
+
+    :param customer_id: Your customer_id string associated with your account.
+    :param api_key: Your api_key string associated with your account.
+    :param processes: (optional) The number of worker processes, as an int, defaults to the number of cores.
+    :param threads: (optional) The number of jobs each worker process sends at once, as an int.
+    :param chunk_size: (optional) The number of jobs handed to a worker process at once, as an int.
+    :param max_pending: (optional) The maximum number of chunks sent to the workers but not yet yielded, as an int.
+        Defaults to twice the number of processes.
+    :param parse_json: (optional) Whether the workers decode the JSON body of every response, so that Response.json
+        costs nothing in the dispatcher.
+    :param mp_context: (optional) The multiprocessing context starting the worker processes.
+    :param client_options: Keyword arguments of the clients created in the workers, for example rest_endpoint.
+    """
+
+    def __init__(self,
+                 customer_id,
+                 api_key,
+                 processes=None,
+                 threads=8,
+                 chunk_size=64,
+                 max_pending=None,
+                 parse_json=True,
+                 mp_context=None,
+                 **client_options):
+        processes = processes or os.cpu_count() or 1
+
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * processes
+
+        self.executor = ProcessPoolExecutor(max_workers=processes,
+                                            mp_context=mp_context,
+                                            initializer=_init_worker,
+                                            initargs=(customer_id, api_key, threads, parse_json, client_options))
+
+    def _chunks(self, jobs):
+        indexed_jobs = enumerate(jobs)
+
+        while True:
+            chunk = list(islice(indexed_jobs, self.chunk_size))
+            if not chunk:
+                return
+
+            yield chunk
+
+    def imap(self, jobs, ordered=True):
+        """
+        Sends jobs, yielding a telesign.bulk.BulkResult per job as results become available.
+
+        A failed job does not abort the stream, its exception is reported in BulkResult.error.
+
+        :param jobs: Iterable of jobs, consumed lazily.
+        :param ordered: (optional) Whether results are yielded in input order, rather than in completion order of the
+            chunks.
+        :return: A generator of BulkResult objects.
+        """
+        if ordered:
+            pending = deque()
+
+            for chunk in self._chunks(jobs):
+                pending.append(self.executor.submit(_run_chunk, chunk))
+
+                if len(pending) >= self.max_pending:
+                    for result in pending.popleft().result():
+                        yield result
+
+            while pending:
+                for result in pending.popleft().result():
+                    yield result
+        else:
+            pending = set()
+
+            for chunk in self._chunks(jobs):
+                pending.add(self.executor.submit(_run_chunk, chunk))
+
+                if len(pending) >= self.max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for result in future.result():
+                            yield result
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for result in future.result():
+                        yield result
+
+    def close(self):
+        """
+        Shuts the worker processes down once their pending chunks are sent.
+        """
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,315 @@
+"""
+Enriches the phone numbers of a CSV or JSONL contact list with PhoneID and Score lookups.
+
+    $ telesign-enrich contacts.csv enriched.csv --operation phoneid --operation score --concurrency 16
+    $ python -m telesign.enrich contacts.jsonl enriched.jsonl --phone-column mobile --country-code 44
+
+The credentials are read from --customer-id and --api-key, or the TELESIGN_CUSTOMER_ID and TELESIGN_API_KEY environment
+variables. Rows are read, looked up and written as a stream, and the progress is checkpointed next to the output file,
+so an interrupted run started again with the same arguments resumes after the last checkpointed row.
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from itertools import islice
+
+from telesign.bulk import imap_bounded
+from telesign.phoneid import PhoneIdClient
+from telesign.phonenumber import PhoneNumberNormalizer
+from telesign.ratelimit import RateLimiter, TokenBucket, PHONEID_PREFIX, SCORE_PREFIX
+from telesign.score import ScoreClient
+from telesign.util import lookup_field
+
+OPERATIONS = ('phoneid', 'score')
+
+DEFAULT_FIELDS = {
+    'phoneid': ('status.code', 'status.description', 'phone_type.description', 'carrier.name',
+                'location.country.name'),
+    'score': ('status.code', 'status.description', 'risk.level', 'risk.score', 'risk.recommendation'),
+}
+"""
+The fields of the lookup responses written to CSV output, as paths into the response JSON.
+"""
+
+
+class Enricher(object):
+    """
+    Adds the results of PhoneID and Score lookups to rows of contacts.
+
+    Rows are dictionaries, the lookups of up to concurrency rows run at once with telesign.bulk.imap_bounded and the
+    enriched rows are yielded in input order. The complete response JSON of a lookup is stored under the name of its
+    operation, a lookup that failed stores its error under the name of the operation followed by .error.
+
+    :param phoneid_client: (optional) The PhoneIdClient of phoneid lookups, required if they are among operations.
+    :param score_client: (optional) The ScoreClient of score lookups, required if they are among operations.
+    :param operations: (optional) The lookups made for every row, among OPERATIONS.
+    :param phone_column: (optional) The key of the phone number in a row.
+    :param account_lifecycle_event: (optional) The account_lifecycle_event of score lookups.
+    :param concurrency: (optional) The maximum number of rows looked up at once, as an int.
+    """
+
+    def __init__(self,
+                 phoneid_client=None,
+                 score_client=None,
+                 operations=('phoneid',),
+                 phone_column='phone_number',
+                 account_lifecycle_event='create',
+                 concurrency=8):
+        clients = {'phoneid': phoneid_client, 'score': score_client}
+
+        for operation in operations:
+            if operation not in OPERATIONS:
+                raise ValueError("unknown operation {operation!r}".format(operation=operation))
+
+            if clients[operation] is None:
+                raise ValueError("the {operation} operation requires a {operation}_client".format(operation=operation))
+
+        self.lookups = {'phoneid': lambda phone_number: phoneid_client.phoneid(phone_number),
+                        'score': lambda phone_number: score_client.score(phone_number, account_lifecycle_event)}
+        self.operations = tuple(operations)
+        self.phone_column = phone_column
+        self.concurrency = concurrency
+
+    def enrich_row(self, row):
+        """
+        Looks up the phone number of a row and returns the enriched row.
+        """
+        row = dict(row)
+
+        for operation in self.operations:
+            try:
+                response = self.lookups[operation](row.get(self.phone_column) or '')
+            except Exception as e:
+                row[operation + '.error'] = "{type}: {error}".format(type=type(e).__name__, error=e)
+            else:
+                row[operation] = response.json
+                if not response.ok:
+                    row[operation + '.error'] = "HTTP {status_code}".format(status_code=response.status_code)
+
+        return row
+
+    def enrich(self, rows):
+        """
+        Enriches rows lazily, in constant memory.
+
+        :param rows: Iterable of rows, as dictionaries.
+        :return: A generator of enriched rows.
+        """
+        for result in imap_bounded(self.enrich_row, rows, concurrency=self.concurrency):
+            yield result.response
+
+    def columns(self, input_columns, fields=None):
+        """
+        The columns of CSV output: the input columns, then for every operation its fields and error.
+
+        :param fields: (optional) A dictionary mapping operations to the fields written, defaults to DEFAULT_FIELDS.
+        """
+        fields = fields or DEFAULT_FIELDS
+        columns = list(input_columns)
+
+        for operation in self.operations:
+            columns.extend("{operation}.{field}".format(operation=operation, field=field)
+                           for field in fields[operation])
+            columns.append(operation + '.error')
+
+        return columns
+
+
+def lookup_rate_limiter(rate):
+    """
+    A RateLimiter allowing rate lookups per second in total, PhoneID and Score lookups drawing from the same bucket.
+    """
+    bucket = TokenBucket(rate)
+
+    return RateLimiter({PHONEID_PREFIX: bucket, SCORE_PREFIX: bucket})
+
+
+def file_format(path, file_format=None):
+    """
+    The format of a file, 'csv' or 'jsonl', given explicitly or by the extension of path.
+    """
+    if file_format is None:
+        file_format = 'jsonl' if path.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+    if file_format not in ('csv', 'jsonl'):
+        raise ValueError("unsupported format {format!r}".format(format=file_format))
+
+    return file_format
+
+
+def read_rows(f, file_format):
+    """
+    The rows of an open text file, read lazily.
+
+    :return: A (columns, rows) tuple, columns is None for JSONL input.
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(f)
+        return reader.fieldnames or [], reader
+
+    return None, (json.loads(line) for line in f if line.strip())
+
+
+class _Checkpoint(object):
+    """
+    The number of rows written to the output file and its size after them, stored next to it.
+    """
+
+    def __init__(self, output_path):
+        self.path = output_path + '.checkpoint'
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                checkpoint = json.load(f)
+        except (IOError, OSError, ValueError):
+            return 0, 0
+
+        return checkpoint['rows'], checkpoint['offset']
+
+    def save(self, rows, offset):
+        with open(self.path + '.tmp', 'w') as f:
+            json.dump({'rows': rows, 'offset': offset}, f)
+
+        os.replace(self.path + '.tmp', self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def enrich_file(enricher,
+                input_path,
+                output_path,
+                input_format=None,
+                output_format=None,
+                fields=None,
+                resume=True,
+                checkpoint_every=500):
+    """
+    Enriches the rows of a CSV or JSONL file into another, checkpointing progress every checkpoint_every rows.
+
+    With resume, a run resumes after the rows written by an interrupted run, anything written after its last checkpoint
+    is discarded. The checkpoint is removed once the whole input is enriched.
+
+    :param enricher: The Enricher.
+    :param input_path: The path of the input file.
+    :param output_path: The path of the output file.
+    :param input_format: (optional) The format of the input, 'csv' or 'jsonl', defaults to that of its extension.
+    :param output_format: (optional) The format of the output, 'csv' or 'jsonl', defaults to that of its extension.
+    :param fields: (optional) The fields of CSV output, see Enricher.columns.
+    :param resume: (optional) Whether to resume an interrupted run, rather than start over.
+    :param checkpoint_every: (optional) The number of rows written between two checkpoints, as an int.
+    :return: The number of rows enriched by this run, as an int.
+    """
+    input_format = file_format(input_path, input_format)
+    output_format = file_format(output_path, output_format)
+
+    checkpoint = _Checkpoint(output_path)
+    done, offset = checkpoint.load() if resume else (0, 0)
+
+    with io.open(input_path, 'r', encoding='utf-8', newline='') as input_file, \
+            open(output_path, 'r+b' if offset else 'wb') as output_file:
+        output_file.truncate(offset)
+        output_file.seek(offset)
+
+        input_columns, rows = read_rows(input_file, input_format)
+        rows = islice(rows, done, None)
+
+        buffer = io.StringIO()
+
+        if output_format == 'csv':
+            writer = csv.DictWriter(buffer, enricher.columns(input_columns or [enricher.phone_column], fields),
+                                    extrasaction='ignore', lineterminator='\n')
+            if not offset:
+                writer.writeheader()
+
+        def write_buffer():
+            output_file.write(buffer.getvalue().encode('utf-8'))
+            output_file.flush()
+
+            buffer.seek(0)
+            buffer.truncate()
+
+            checkpoint.save(done + enriched, output_file.tell())
+
+        enriched = 0
+
+        for row in enricher.enrich(rows):
+            if output_format == 'csv':
+                for operation in enricher.operations:
+                    document = row.pop(operation, None)
+                    for field in (fields or DEFAULT_FIELDS)[operation]:
+                        row["{operation}.{field}".format(operation=operation, field=field)] = \
+                            lookup_field(document, field)
+
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row, separators=(',', ':')) + '\n')
+
+            enriched += 1
+
+            if enriched % checkpoint_every == 0:
+                write_buffer()
+
+        write_buffer()
+
+    checkpoint.remove()
+
+    return enriched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='telesign-enrich',
+                                     description="Enrich the phone numbers of a CSV or JSONL file with TeleSign "
+                                                 "PhoneID and Score lookups.")
+    parser.add_argument('input', help="input file, .csv or .jsonl")
+    parser.add_argument('output', help="output file, .csv or .jsonl")
+    parser.add_argument('--operation', action='append', choices=OPERATIONS,
+                        help="lookup made for every row, may be repeated, defaults to phoneid")
+    parser.add_argument('--phone-column', default='phone_number', help="column holding the phone numbers")
+    parser.add_argument('--country-code', help="country code of phone numbers written in national format")
+    parser.add_argument('--account-lifecycle-event', default='create', help="account_lifecycle_event of Score")
+    parser.add_argument('--concurrency', type=int, default=8, help="rows looked up at once")
+    parser.add_argument('--rate', type=float, help="maximum lookups per second, of all operations together")
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'), help="defaults to the input file extension")
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'), help="defaults to the output file extension")
+    parser.add_argument('--checkpoint-every', type=int, default=500, help="rows written between checkpoints")
+    parser.add_argument('--restart', action='store_true', help="start over instead of resuming an interrupted run")
+    parser.add_argument('--customer-id', default=os.environ.get('TELESIGN_CUSTOMER_ID'))
+    parser.add_argument('--api-key', default=os.environ.get('TELESIGN_API_KEY'))
+    parser.add_argument('--rest-endpoint', default='https://rest-api.telesign.com')
+    args = parser.parse_args(argv)
+
+    if not args.customer_id or not args.api_key:
+        parser.error("--customer-id and --api-key, or TELESIGN_CUSTOMER_ID and TELESIGN_API_KEY, are required")
+
+    rate_limiter = lookup_rate_limiter(args.rate) if args.rate else None
+    client_options = dict(rest_endpoint=args.rest_endpoint,
+                          max_concurrency=args.concurrency,
+                          rate_limiter=rate_limiter,
+                          phone_number_normalizer=PhoneNumberNormalizer(args.country_code))
+
+    enricher = Enricher(phoneid_client=PhoneIdClient(args.customer_id, args.api_key, **client_options),
+                        score_client=ScoreClient(args.customer_id, args.api_key, **client_options),
+                        operations=args.operation or ('phoneid',),
+                        phone_column=args.phone_column,
+                        account_lifecycle_event=args.account_lifecycle_event,
+                        concurrency=args.concurrency)
+
+    enriched = enrich_file(enricher, args.input, args.output,
+                           input_format=args.input_format,
+                           output_format=args.output_format,
+                           resume=not args.restart,
+                           checkpoint_every=args.checkpoint_every)
+
+    print("{enriched} rows enriched into {output}".format(enriched=enriched, output=args.output), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
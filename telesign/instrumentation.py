@@ -0,0 +1,214 @@
+from __future__ import unicode_literals
+
+import threading
+import time
+from collections import defaultdict
+
+PHASES = ('encode', 'rate_limit', 'sign', 'transport', 'server', 'backoff')
+
+
+def resource_label(resource):
+    """
+    The low cardinality label of a resource, its first two path segments, such as /v1/messaging for
+    /v1/messaging/{reference_id}.
+    """
+    parts = resource.split('/', 3)
+
+    return '/'.join(parts[:3])
+
+
+class RequestContext(object):
+    """
+    The measurements of one RestClient request, across all its attempts, passed to every Instrument.
+
+    Timings are in seconds and keyed by phase: encode is the url encoding of the params, rate_limit the wait for the
+    rate limiter, sign the signing, transport the sending of the request and receiving of the response (including
+    connection acquisition and TLS), server the part of transport until the response headers were parsed, as reported
+    by the elapsed of the transport response, and backoff the sleep between attempts. The server phase is not the
+    processing time of the server alone: it also covers uploading the request and, with Requests, opening a new
+    connection and its TLS handshake, which telesign.transport.HTTPClientTransport does before it starts the clock.
+    Only the download of the response body is left out. Instruments may keep per request state, such as a span, in
+    the data dictionary.
+
+    :param method_name: The HTTP method name, as an upper case string.
+    :param resource: The partial resource URI of the request, as a string.
+    """
+    __slots__ = ('method_name', 'resource', 'label', 'started', 'elapsed', 'attempts', 'timings', 'response', 'error',
+                 'data')
+
+    def __init__(self, method_name, resource):
+        self.method_name = method_name
+        self.resource = resource
+        self.label = resource_label(resource)
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self.attempts = 0
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self.response = None
+        self.error = None
+        self.data = {}
+
+    @property
+    def status_code(self):
+        return self.response.status_code if self.response is not None else None
+
+    def mark(self, phase, since):
+        """
+        Adds the time elapsed since the perf_counter timestamp since to phase, and returns the current timestamp.
+        """
+        now = time.perf_counter()
+        self.timings[phase] += now - since
+
+        return now
+
+
+class Instrument(object):
+    """
+    The base class of RestClient instruments. Instruments are attached with the instruments argument of RestClient
+    and shared by all requests of the client, possibly from several threads.
+
+    Nothing is measured when a client has no instrument attached.
+    """
+
+    def before_request(self, context):
+        """
+        Called with the RequestContext before the first attempt of a request.
+        """
+
+    def after_request(self, context):
+        """
+        Called with the RequestContext once the request completed, with context.response set, or failed, with
+        context.error set.
+        """
+
+
+class HookInstrument(Instrument):
+    """
+    An Instrument calling plain functions.
+
+    :param before: (optional) Callable invoked with the RequestContext before the request.
+    :param after: (optional) Callable invoked with the RequestContext after the request.
+    """
+
+    def __init__(self, before=None, after=None):
+        self.before = before
+        self.after = after
+
+    def before_request(self, context):
+        if self.before is not None:
+            self.before(context)
+
+    def after_request(self, context):
+        if self.after is not None:
+            self.after(context)
+
+
+class MetricsCollector(Instrument):
+    """
+    An in-process Instrument counting requests by resource label and status code and totalling phase timings by
+    resource label, for callers without a metrics library.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.timings = defaultdict(lambda: dict.fromkeys(PHASES + ('total',), 0.0))
+
+    def after_request(self, context):
+        with self._lock:
+            if context.error is not None:
+                self.errors[(context.label, type(context.error).__name__)] += 1
+            else:
+                self.requests[(context.label, context.status_code)] += 1
+
+            timings = self.timings[context.label]
+            for phase, seconds in context.timings.items():
+                timings[phase] += seconds
+            timings['total'] += context.elapsed
+
+    def snapshot(self):
+        """
+        A copy of the counters and timings, as a dictionary.
+        """
+        with self._lock:
+            return {'requests': dict(self.requests),
+                    'errors': dict(self.errors),
+                    'timings': dict((label, dict(timings)) for label, timings in self.timings.items())}
+
+
+class PrometheusInstrument(Instrument):
+    """
+    Exports request counters and phase latency histograms with prometheus_client, which must be installed.
+
+    :param registry: (optional) The prometheus_client CollectorRegistry to register the metrics in, defaults to the
+        global registry.
+    :param namespace: (optional) The prefix of the metric names.
+    """
+
+    def __init__(self, registry=None, namespace='telesign'):
+        from prometheus_client import Counter, Histogram, REGISTRY
+
+        registry = registry if registry is not None else REGISTRY
+
+        self.requests = Counter('requests_total', 'TeleSign REST API requests.',
+                                ['method', 'resource', 'status_code'], namespace=namespace, registry=registry)
+        self.retries = Counter('retries_total', 'TeleSign REST API request attempts beyond the first.',
+                               ['method', 'resource'], namespace=namespace, registry=registry)
+        self.latency = Histogram('request_duration_seconds', 'TeleSign REST API request latency.',
+                                 ['method', 'resource'], namespace=namespace, registry=registry)
+        self.phases = Histogram('request_phase_duration_seconds', 'TeleSign REST API request latency by phase.',
+                                ['resource', 'phase'], namespace=namespace, registry=registry)
+
+    def after_request(self, context):
+        status_code = context.status_code if context.error is None else type(context.error).__name__
+
+        self.requests.labels(context.method_name, context.label, str(status_code)).inc()
+        if context.attempts > 1:
+            self.retries.labels(context.method_name, context.label).inc(context.attempts - 1)
+
+        self.latency.labels(context.method_name, context.label).observe(context.elapsed)
+        for phase, seconds in context.timings.items():
+            if seconds:
+                self.phases.labels(context.label, phase).observe(seconds)
+
+
+class OpenTelemetryInstrument(Instrument):
+    """
+    Records a span per request with the OpenTelemetry API, which must be installed. Phase timings are recorded as span
+    attributes.
+
+    :param tracer: (optional) The OpenTelemetry Tracer, defaults to the tracer of the global tracer provider.
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer('telesign')
+
+    def before_request(self, context):
+        span = self.tracer.start_span("TeleSign {method} {resource}".format(method=context.method_name,
+                                                                           resource=context.label),
+                                      kind=self._trace.SpanKind.CLIENT)
+        span.set_attribute('http.method', context.method_name)
+        span.set_attribute('telesign.resource', context.resource)
+
+        context.data[self] = span
+
+    def after_request(self, context):
+        span = context.data.pop(self)
+
+        span.set_attribute('telesign.attempts', context.attempts)
+        for phase, seconds in context.timings.items():
+            span.set_attribute('telesign.{phase}_seconds'.format(phase=phase), seconds)
+
+        if context.error is not None:
+            span.record_exception(context.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        else:
+            span.set_attribute('http.status_code', context.status_code)
+            if context.status_code >= 500:
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+        span.end()
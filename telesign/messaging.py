@@ -1,9 +1,12 @@
 from __future__ import unicode_literals
 
+from telesign.bulk import imap_bounded
+from telesign.otp import default_generator
 from telesign.rest import RestClient
 
 MESSAGING_RESOURCE = "/v1/messaging"
 MESSAGING_STATUS_RESOURCE = "/v1/messaging/{reference_id}"
+MESSAGING_VERIFICATION_TEMPLATE = "Your code is {code}"
 
 
 class MessagingClient(RestClient):
@@ -12,21 +15,43 @@ class MessagingClient(RestClient):
     or you can send verification messages containing one-time passcodes (OTP).
     """
 
-    def __init__(self, customer_id, api_key, **kwargs):
+    def __init__(self, customer_id, api_key, otp_generator=None, **kwargs):
+        """
+        :param otp_generator: (optional) The telesign.otp.OtpGenerator creating the codes of send_verification_code,
+            defaults to a generator of 5 digit codes shared by all clients.
+        """
         super(MessagingClient, self).__init__(customer_id, api_key, **kwargs)
 
+        self.otp_generator = otp_generator if otp_generator is not None else default_generator()
+
     def message(self, phone_number, message, message_type, **params):
         """
         Send a message to the target phone_number.
 
         See https://developer.telesign.com/docs/messaging-api for detailed API documentation.
         """
+        phone_number = self.normalize_phone_number(phone_number)
+
         return self.post(MESSAGING_RESOURCE,
                          phone_number=phone_number,
                          message=message,
                          message_type=message_type,
                          **params)
 
+    def send_verification_code(self, phone_number, template=MESSAGING_VERIFICATION_TEMPLATE, message_type='OTP',
+                               **params):
+        """
+        Send a message containing a new one-time passcode to the target phone_number.
+
+        :param phone_number: The phone number to send the code to, as a string.
+        :param template: (optional) The message, formatted with the code as code.
+        :param message_type: (optional) The message_type of the message.
+        :return: A (code, response) tuple of the code sent, as a string, and the RestClient Response object.
+        """
+        code = self.otp_generator.generate()
+
+        return code, self.message(phone_number, template.format(code=code), message_type, **params)
+
     def status(self, reference_id, **params):
         """
         Retrieves the current status of the message.
@@ -35,3 +60,32 @@ class MessagingClient(RestClient):
         """
         return self.get(MESSAGING_STATUS_RESOURCE.format(reference_id=reference_id),
                         **params)
+
+    def message_bulk(self, messages, concurrency=8, ordered=True, dedup=False):
+        """
+        Send many messages with at most concurrency requests in flight at once.
+
+        The messages are consumed lazily and the results are yielded as they become available, so arbitrarily large
+        campaigns are sent in constant memory. A failed send does not abort the batch, it is reported in the result of
+        that message. Size the connection pool, pool_maxsize, to at least concurrency.
+
+        :param messages: Iterable of (phone_number, message, message_type) or (phone_number, message, message_type,
+            params) tuples, where params is a dictionary of additional parameters.
+        :param concurrency: (optional) The maximum number of messages sent at once, as an int.
+        :param ordered: (optional) Whether results are yielded in input order, rather than in completion order.
+        :param dedup: (optional) Whether to send a message only once to a phone number, however it is formatted, see
+            RestClient.phone_number_key. Later duplicates of a message are skipped before any request is sent and have
+            no result.
+        :return: A generator of telesign.bulk.BulkResult objects, one per message.
+        """
+        return imap_bounded(self._message_item, messages, concurrency=concurrency, ordered=ordered,
+                            unique_key=self._message_key if dedup else None)
+
+    def _message_key(self, item):
+        return (self.phone_number_key(item[0]),) + tuple(item[1:3])
+
+    def _message_item(self, item):
+        phone_number, message, message_type = item[:3]
+        params = item[3] if len(item) > 3 and item[3] else {}
+
+        return self.message(phone_number, message, message_type, **params)
@@ -0,0 +1,124 @@
+from __future__ import unicode_literals
+
+import os
+import threading
+import weakref
+from collections import deque
+
+OTP_ALPHABET = '123456789'
+
+
+class OtpGenerator(object):
+    """
+    Generates one-time passcodes from entropy drawn in bulk from os.urandom.
+
+    Each random byte is turned into a character of alphabet by rejection sampling: bytes at or above the largest
+    multiple of len(alphabet) are dropped and the others map to alphabet[byte % len(alphabet)], so every character is
+    equally likely and independent, as with random_with_n_digits. The mapping of a whole block of bytes is done in a
+    single bytes.translate call.
+
+    Codes of the default length are handed out from a pool refilled pool_size codes at a time, a generator is safe to
+    share between threads. The pool is emptied in a forked child process, so that processes forked from the same parent
+    never hand out the same codes.
+
+    :param length: (optional) The number of characters of a code, as an int.
+    :param alphabet: (optional) The characters codes are made of, at most 256 of them.
+    :param pool_size: (optional) The number of codes generated at once when the pool runs out, as an int.
+    """
+
+    def __init__(self, length=5, alphabet=OTP_ALPHABET, pool_size=256):
+        if not 0 < len(alphabet) <= 256:
+            raise ValueError("alphabet must have between 1 and 256 characters")
+
+        self.length = length
+        self.alphabet = alphabet
+        self.pool_size = pool_size
+
+        limit = 256 - 256 % len(alphabet)
+
+        # bytes map straight to latin-1 characters, other alphabets go through indices
+        self._latin1 = all(ord(character) < 256 for character in alphabet)
+        self._table = bytes(bytearray(ord(alphabet[i % len(alphabet)]) if self._latin1 else i % len(alphabet)
+                                      for i in range(256)))
+        self._rejected = bytes(bytearray(range(limit, 256)))
+        self._pool = deque()
+        self._lock = threading.Lock()
+
+        _generators.add(self)
+
+    def _after_fork(self):
+        # the lock may have been held by a thread of the parent, which does not exist in the child
+        self._lock = threading.Lock()
+        self._pool = deque()
+
+    def characters(self, n):
+        """
+        Draws n random characters of alphabet.
+
+        :return: The characters, as a string.
+        """
+        chunks = []
+        missing = n
+
+        while missing > 0:
+            # accepts 252 of 256 bytes for the default alphabet, a little extra entropy avoids most second draws
+            drawn = os.urandom(missing + missing // 16 + 8).translate(self._table, self._rejected)[:missing]
+
+            if self._latin1:
+                chunks.append(drawn.decode('latin-1'))
+            else:
+                chunks.append("".join([self.alphabet[i] for i in bytearray(drawn)]))
+
+            missing -= len(drawn)
+
+        return "".join(chunks)
+
+    def generate(self, length=None):
+        """
+        Generates a code.
+
+        :param length: (optional) The number of characters of the code, defaults to the length of the generator.
+        :return: The code, as a string.
+        """
+        if length is not None and length != self.length:
+            return self.characters(length)
+
+        while True:
+            try:
+                return self._pool.popleft()
+            except IndexError:
+                pass
+
+            # other threads pop without the lock, so the refilled pool may be emptied again before it is popped
+            with self._lock:
+                if not self._pool:
+                    characters = self.characters(self.length * self.pool_size)
+                    self._pool.extend(characters[i:i + self.length] for i in range(0, len(characters), self.length))
+
+    __call__ = generate
+
+
+_default_generator = None
+
+_generators = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for generator in list(_generators):
+        generator._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def default_generator():
+    """
+    The OtpGenerator shared by the clients and random_with_n_digits when no other generator is given.
+    """
+    global _default_generator
+
+    if _default_generator is None:
+        _default_generator = OtpGenerator()
+
+    return _default_generator
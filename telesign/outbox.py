@@ -0,0 +1,548 @@
+from __future__ import unicode_literals
+
+import heapq
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque, namedtuple
+
+from telesign.bulk import imap_bounded
+from telesign.circuit import CircuitOpenError
+from telesign.deadline import DeadlineExceeded
+
+ENQUEUED = 1
+SENT = 2
+FAILED = 3
+CHECKPOINT = 4
+
+PENDING = 'pending'
+
+_HEADER = struct.Struct('<IIB')  # payload length, crc32 of the payload, record type
+
+logger = logging.getLogger(__name__)
+
+OutboxStatus = namedtuple('OutboxStatus', ['state', 'reference_id', 'status_code'])
+"""
+The outcome of a queued message: state is 'pending', 'sent' or 'failed', reference_id and status_code are those of the
+TeleSign response, if any.
+"""
+
+
+class WriteAheadLog(object):
+    """
+    An append-only log of typed records in a memory-mapped file.
+
+    Appending a record copies it into the mapped pages of the file, so it survives the process crashing or being
+    restarted as soon as append returns, flush() also makes it survive the machine losing power. Each record is checked
+    with a crc32, the log ends at the first incomplete record, as left by a write interrupted by a crash. The file
+    grows by doubling when full.
+
+    :param path: The path of the log file, created if it does not exist.
+    :param initial_size: (optional) The size in bytes the log file is created with.
+    """
+
+    def __init__(self, path, initial_size=1 << 20):
+        self.path = path
+        self.initial_size = initial_size
+
+        self._open()
+
+    def _open(self):
+        self._file = open(self.path, 'r+b' if os.path.exists(self.path) else 'w+b')
+
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size < self.initial_size:
+            self._file.truncate(self.initial_size)
+            self.size = self.initial_size
+
+        self._map = mmap.mmap(self._file.fileno(), self.size)
+
+        self.position = 0
+        for _, _, end in self._scan():
+            self.position = end
+
+        # clear what an interrupted write left behind, later records must not run into it
+        if self._map[self.position:].strip(b'\0'):
+            self._map[self.position:] = b'\0' * (self.size - self.position)
+
+    def _scan(self):
+        position = 0
+
+        while position + _HEADER.size <= self.size:
+            length, crc, record_type = _HEADER.unpack_from(self._map, position)
+            end = position + _HEADER.size + length
+
+            if record_type == 0 or end > self.size:
+                return
+
+            payload = self._map[position + _HEADER.size:end]
+            if zlib.crc32(payload) & 0xffffffff != crc:
+                return
+
+            yield record_type, payload, end
+            position = end
+
+    def records(self):
+        """
+        The complete records of the log, in the order they were appended.
+
+        :return: A generator of (record_type, payload) tuples.
+        """
+        for record_type, payload, _ in self._scan():
+            yield record_type, payload
+
+    def append(self, record_type, payload):
+        """
+        Appends a record. Not thread-safe, callers sharing a log must serialize appends.
+
+        :param record_type: The type of the record, an int from 1 to 255.
+        :param payload: The content of the record, as bytes.
+        """
+        end = self.position + _HEADER.size + len(payload)
+
+        if end > self.size:
+            self._grow(end)
+
+        # the header is written last, a record interrupted before it is complete is not read back
+        self._map[self.position + _HEADER.size:end] = payload
+        _HEADER.pack_into(self._map, self.position, len(payload), zlib.crc32(payload) & 0xffffffff, record_type)
+
+        self.position = end
+
+    def _grow(self, minimum_size):
+        size = self.size
+
+        while size < minimum_size:
+            size *= 2
+
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self.size = size
+
+    def flush(self):
+        """
+        Writes the appended records through to the disk.
+        """
+        self._map.flush()
+        os.fsync(self._file.fileno())
+
+    def rewrite(self, records):
+        """
+        Atomically replaces the content of the log with records, dropping everything appended before.
+
+        :param records: Iterable of (record_type, payload) tuples.
+        """
+        self.prepare_rewrite(records)
+        self.commit_rewrite(self.position)
+
+    def prepare_rewrite(self, records):
+        """
+        Writes records to the replacement of the log and syncs it to the disk, leaving the log itself untouched, so
+        that appends may go on meanwhile. See commit_rewrite.
+
+        :param records: Iterable of (record_type, payload) tuples.
+        """
+        with open(self.path + '.compact', 'wb') as compacted:
+            for record_type, payload in records:
+                compacted.write(_HEADER.pack(len(payload), zlib.crc32(payload) & 0xffffffff, record_type))
+                compacted.write(payload)
+
+            compacted.flush()
+            os.fsync(compacted.fileno())
+
+    def commit_rewrite(self, since):
+        """
+        Atomically replaces the log with the replacement written by prepare_rewrite, followed by the records appended
+        to the log from position since on. Not thread-safe, like append.
+
+        :param since: The position of the log when prepare_rewrite was given its records.
+        """
+        compacted_path = self.path + '.compact'
+
+        with open(compacted_path, 'ab') as compacted:
+            compacted.write(self._map[since:self.position])
+            compacted.flush()
+            os.fsync(compacted.fileno())
+
+        self.close()
+        os.replace(compacted_path, self.path)
+        self._open()
+
+    def close(self):
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+
+
+class OutboxError(Exception):
+    """
+    Raised by an Outbox whose drainer stopped on an unexpected error, such as the log failing to grow.
+    """
+
+
+class OutboxEntry(object):
+    """
+    A message waiting in an Outbox to be sent.
+    """
+    __slots__ = ('id', 'phone_number', 'message', 'message_type', 'params', 'attempts', 'not_before')
+
+    def __init__(self, id, phone_number, message, message_type, params):
+        self.id = id
+        self.phone_number = phone_number
+        self.message = message
+        self.message_type = message_type
+        self.params = params
+        self.attempts = 0
+        self.not_before = 0.0
+
+    def record(self):
+        return json.dumps({'id': self.id,
+                           'phone_number': self.phone_number,
+                           'message': self.message,
+                           'message_type': self.message_type,
+                           'params': self.params}, separators=(',', ':')).encode('utf-8')
+
+    def __repr__(self):
+        return "OutboxEntry(id={id}, attempts={attempts})".format(id=self.id, attempts=self.attempts)
+
+
+class Outbox(object):
+    """
+    A durable queue of messages in front of MessagingClient.message.
+
+    message() records the send in a WriteAheadLog and returns immediately, a background drainer sends the queued
+    messages in batches of at most batch_size, concurrency at a time, and records the reference_id of every sent
+    message. A message that could not be sent, because the request raised one of retryable_errors or the response has a
+    429 or 5xx status, is sent again after retry_interval seconds, doubling with every attempt up to
+    max_retry_interval, at most max_attempts times. Any other error, and running out of attempts, fails the message for
+    good and hands it to dead_letter. Messages still queued when the process stops are sent once an Outbox is opened
+    again on the same path.
+
+    An exception raised by callback or dead_letter is logged and does not stop the drainer. If the drainer stops on
+    any other error, message() and drain() raise OutboxError until start() is called again.
+
+    Delivery is at least once: a message sent just before a crash, whose outcome was not recorded yet, is sent again.
+    The log is compacted, keeping only the queued messages, once it grows past compact_size, the outcome of messages
+    sent before the last compaction is then no longer available after a restart. The compacted log is written by the
+    drainer while messages keep being queued.
+
+    :param client: The MessagingClient sending the messages.
+    :param path: The path of the log file.
+    :param batch_size: (optional) The maximum number of messages sent and recorded together, as an int.
+    :param concurrency: (optional) The maximum number of messages sent at once, as an int.
+    :param callback: (optional) Callable invoked from the drainer with a telesign.bulk.BulkResult, whose index is the
+        message id, for every message sent, failed or to be retried.
+    :param dead_letter: (optional) Callable invoked from the drainer with the BulkResult of the last attempt of every
+        message that failed for good.
+    :param max_attempts: (optional) The maximum number of attempts to send a message, as an int.
+    :param retryable_errors: (optional) The exceptions of a send that are retried, defaults to IOError,
+        CircuitOpenError, DeadlineExceeded and the retryable errors of the client transport.
+    :param sync: (optional) Whether every queued message and outcome is flushed to the disk before returning, to
+        survive the machine losing power at the cost of queuing at disk speed.
+    :param retry_interval: (optional) The number of seconds before a message is sent again after a first failure.
+    :param max_retry_interval: (optional) The maximum number of seconds between two attempts to send a message.
+    :param compact_size: (optional) The size in bytes of the log above which it is compacted.
+    :param max_results: (optional) The maximum number of outcomes kept in memory for status(), as an int.
+    :param start: (optional) Whether to start the drainer immediately, see start().
+    """
+
+    def __init__(self,
+                 client,
+                 path,
+                 batch_size=32,
+                 concurrency=8,
+                 callback=None,
+                 dead_letter=None,
+                 max_attempts=10,
+                 retryable_errors=None,
+                 sync=False,
+                 retry_interval=1.0,
+                 max_retry_interval=60.0,
+                 compact_size=4 << 20,
+                 max_results=10000,
+                 start=True):
+        self.client = client
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.callback = callback
+        self.dead_letter = dead_letter
+        self.max_attempts = max_attempts
+        self.retryable_errors = retryable_errors if retryable_errors is not None else \
+            (IOError, CircuitOpenError, DeadlineExceeded) + \
+            tuple(getattr(getattr(client, 'transport', None), 'retryable_errors', ()))
+        self.sync = sync
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.compact_size = compact_size
+        self.max_results = max_results
+
+        self._pending = OrderedDict()
+        self._ready = deque()  # queued messages due now, in order
+        self._retries = []  # heap of (not_before, id, entry) of messages waiting to be retried
+        self._results = OrderedDict()
+        self._next_id = 0
+        self._compacted_size = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stopped = False
+        self._error = None
+        self._thread = None
+
+        self._log = WriteAheadLog(path)
+        self._replay()
+        self._ready.extend(self._pending.values())
+
+        if start:
+            self.start()
+
+    def _replay(self):
+        for record_type, payload in self._log.records():
+            record = json.loads(payload.decode('utf-8'))
+
+            if record_type == ENQUEUED:
+                self._pending[record['id']] = OutboxEntry(record['id'], record['phone_number'], record['message'],
+                                                          record['message_type'], record['params'])
+            elif record_type in (SENT, FAILED):
+                self._pending.pop(record['id'], None)
+                self._remember(record['id'], OutboxStatus('sent' if record_type == SENT else 'failed',
+                                                          record['reference_id'], record['status_code']))
+
+            self._next_id = max(self._next_id, record.get('next_id', record['id'] + 1))
+
+    def _remember(self, entry_id, status):
+        self._results[entry_id] = status
+
+        if len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+    def message(self, phone_number, message, message_type, **params):
+        """
+        Queues a message to the target phone_number, see MessagingClient.message.
+
+        :return: The id of the queued message, as an int.
+        :raises OutboxError: if the drainer stopped on an error.
+        """
+        with self._lock:
+            self._check_drainer()
+
+            entry = OutboxEntry(self._next_id, phone_number, message, message_type, params)
+            self._next_id += 1
+
+            self._log.append(ENQUEUED, entry.record())
+            if self.sync:
+                self._log.flush()
+
+            self._pending[entry.id] = entry
+            self._ready.append(entry)
+            self._changed.notify_all()
+
+        return entry.id
+
+    def _check_drainer(self):
+        if self._error is not None:
+            raise OutboxError("the outbox drainer stopped: {type}: {error}".format(type=type(self._error).__name__,
+                                                                                  error=self._error))
+
+    def status(self, entry_id):
+        """
+        The OutboxStatus of a queued message, or None if it is unknown.
+        """
+        with self._lock:
+            if entry_id in self._pending:
+                return OutboxStatus(PENDING, None, None)
+
+            return self._results.get(entry_id)
+
+    def reference_id(self, entry_id):
+        """
+        The reference_id of a sent message, or None if it was not sent.
+        """
+        status = self.status(entry_id)
+
+        return status.reference_id if status is not None else None
+
+    def pending(self):
+        """
+        The number of messages waiting to be sent, as an int.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def _next_batch(self):
+        with self._lock:
+            while not self._stopped:
+                now = time.monotonic()
+
+                while self._retries and self._retries[0][0] <= now:
+                    self._ready.append(heapq.heappop(self._retries)[2])
+
+                batch = []
+                while self._ready and len(batch) < self.batch_size:
+                    batch.append(self._ready.popleft())
+
+                if batch:
+                    return batch
+
+                self._changed.wait(self._retries[0][0] - now if self._retries else None)
+
+            return None
+
+    def _send(self, entry):
+        return self.client.message(entry.phone_number, entry.message, entry.message_type, **entry.params)
+
+    def _send_batch(self, batch):
+        results = list(imap_bounded(self._send, batch, concurrency=self.concurrency))
+        dead = []
+
+        with self._lock:
+            for result in results:
+                entry, response = result.item, result.response
+
+                if response is not None:
+                    retryable = response.status_code == 429 or response.status_code >= 500
+                else:
+                    retryable = isinstance(result.error, self.retryable_errors)
+
+                entry.attempts += 1
+
+                if response is not None and response.ok:
+                    self._record(entry, SENT, OutboxStatus('sent', (response.json or {}).get('reference_id'),
+                                                           response.status_code))
+                elif not retryable or entry.attempts >= self.max_attempts:
+                    self._record(entry, FAILED, OutboxStatus('failed', None,
+                                                             response.status_code if response is not None else None))
+                    dead.append(result)
+                else:
+                    entry.not_before = time.monotonic() + min(self.max_retry_interval,
+                                                              self.retry_interval * 2 ** (entry.attempts - 1))
+                    heapq.heappush(self._retries, (entry.not_before, entry.id, entry))
+
+            if self.sync:
+                self._log.flush()
+
+            compact = self._log.position > max(self.compact_size, 2 * self._compacted_size)
+
+            self._changed.notify_all()
+
+        if compact:
+            self._compact()
+
+        for result in results:
+            result.index = result.item.id
+
+        self._notify(self.callback, results)
+        self._notify(self.dead_letter, dead)
+
+    def _record(self, entry, record_type, status):
+        self._log.append(record_type, json.dumps(
+            {'id': entry.id, 'reference_id': status.reference_id, 'status_code': status.status_code},
+            separators=(',', ':')).encode('utf-8'))
+
+        del self._pending[entry.id]
+        self._remember(entry.id, status)
+
+    @staticmethod
+    def _notify(callback, results):
+        if callback is None:
+            return
+
+        for result in results:
+            try:
+                callback(result)
+            except Exception:
+                logger.exception("outbox callback failed for message %s", result.index)
+
+    def _compact(self):
+        # only the snapshot and the swap hold the lock, messages are queued while the compacted log is written
+        with self._lock:
+            entries = list(self._pending.values())
+            next_id = self._next_id
+            since = self._log.position
+
+        checkpoint = json.dumps({'id': -1, 'next_id': next_id}).encode('utf-8')
+        self._log.prepare_rewrite([(CHECKPOINT, checkpoint)] + [(ENQUEUED, entry.record()) for entry in entries])
+
+        with self._lock:
+            self._log.commit_rewrite(since)
+            self._compacted_size = self._log.position
+
+    def run(self):
+        """
+        Sends the queued messages until stop() is called, waiting for messages to be queued when idle.
+        """
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+
+                self._send_batch(batch)
+        except Exception as e:
+            logger.exception("outbox drainer stopped")
+
+            with self._lock:
+                self._error = e
+                self._changed.notify_all()
+
+    def start(self):
+        """
+        Runs the drainer on a background thread until stop() is called, does nothing if it is already running.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stopped = False
+            self._error = None
+
+        self._thread = threading.Thread(target=self.run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops the drainer once the batch being sent, if any, is recorded, and waits for its thread to finish.
+        """
+        with self._lock:
+            self._stopped = True
+            self._changed.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def drain(self, timeout=None):
+        """
+        Waits until no message is queued, including messages waiting to be retried.
+
+        :param timeout: (optional) The maximum number of seconds to wait.
+        :return: Whether the queue was emptied.
+        :raises OutboxError: if the drainer stopped on an error.
+        """
+        with self._lock:
+            drained = self._changed.wait_for(lambda: not self._pending or self._error is not None, timeout)
+            self._check_drainer()
+
+            return drained
+
+    def close(self):
+        """
+        Stops the drainer and closes the log, queued messages are sent once an Outbox is opened again on its path.
+        """
+        self.stop()
+
+        with self._lock:
+            self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -11,15 +11,29 @@ class PhoneIdClient(RestClient):
     verification process and evaluate risk.
     """
 
-    def __init__(self, customer_id, api_key, **kwargs):
+    def __init__(self, customer_id, api_key, cache=None, **kwargs):
+        """
+        :param cache: (optional) A telesign.cache.ResponseCache answering repeated lookups of a phone number.
+        """
         super(PhoneIdClient, self).__init__(customer_id, api_key, **kwargs)
 
-    def phoneid(self, phone_number, **params):
+        self.cache = cache
+
+    def phoneid(self, phone_number, deadline=None, **params):
         """
         The PhoneID API provides a cleansed phone number, phone type, and telecom carrier information to determine the
         best communication method - SMS or voice.
 
+        A deadline, see RestClient.post, is not part of the cache key.
+
         See https://developer.telesign.com/docs/phoneid-api for detailed API documentation.
         """
-        return self.post(PHONEID_RESOURCE.format(phone_number=phone_number),
-                         **params)
+        phone_number = self.normalize_phone_number(phone_number)
+        resource = PHONEID_RESOURCE.format(phone_number=phone_number)
+
+        if self.cache is None:
+            return self.post(resource, deadline=deadline, **params)
+
+        key = self.cache.key(self.customer_id, self.api_host, PHONEID_RESOURCE, phone_number, params)
+
+        return self.cache.fetch(key, lambda: self.post(resource, deadline=deadline, **params))
@@ -0,0 +1,150 @@
+from __future__ import unicode_literals
+
+import re
+
+MIN_DIGITS = 7
+MAX_DIGITS = 15
+
+# dropped before parsing: whitespace, the usual separators and invisible formatting characters
+_SEPARATORS = dict.fromkeys(map(ord, ' \t\r\n\u00a0\u2007\u202f\u200b\u200e\u200f'
+                                     '-\u2010\u2011\u2012\u2013\u2014\u2212.()[]/'))
+
+# joins the numbers of a batch, it is not a separator so it survives their removal
+_BATCH_DELIMITER = '\x1f'
+
+_EXTENSION = re.compile(r'(?:ext|extension|x|#)[0-9]*$', re.IGNORECASE)
+_NUMBER = re.compile(r'\+?[0-9]+')
+
+
+class InvalidPhoneNumber(ValueError):
+    """
+    Raised when a phone number cannot be normalized.
+    """
+
+
+class PhoneNumberNormalizer(object):
+    """
+    Canonicalizes phone numbers to the TeleSign format: the E.164 country code and subscriber number, as digits only.
+
+    Whitespace, separators and extensions are removed. A number starting with + is international, and so is a number
+    starting with the international dialing prefix of the default_country_code: 011 for the North American Numbering
+    Plan, country code 1, and 00 elsewhere, both without default_country_code. Any other number is national if
+    default_country_code is given: its trunk prefix is removed and default_country_code prepended, so 0114 496 0000
+    is a Sheffield number with default_country_code 44. Without default_country_code, other numbers must already start
+    with their country code. For the North American Numbering Plan, the national trunk prefix is 1 and a national
+    number has 10 digits and an area code that does not start with 0 or 1.
+
+    :param default_country_code: (optional) The country code of numbers written in national format, as a string.
+    :param trunk_prefix: (optional) The national trunk prefix removed from national numbers, as a string.
+    """
+
+    def __init__(self, default_country_code=None, trunk_prefix='0'):
+        self.default_country_code = default_country_code
+        self.trunk_prefix = trunk_prefix
+
+    def normalize(self, phone_number):
+        """
+        The canonical form of phone_number, such as 15550100000 for "+1 (555) 010-0000".
+
+        :raise InvalidPhoneNumber: If phone_number has too few or too many digits or contains other characters.
+        """
+        return self._digits(phone_number.translate(_SEPARATORS), phone_number)
+
+    __call__ = normalize
+
+    def e164(self, phone_number):
+        """
+        The E.164 form of phone_number, the canonical form prefixed with +.
+        """
+        return '+' + self.normalize(phone_number)
+
+    def normalize_many(self, phone_numbers):
+        """
+        Normalizes a batch of phone numbers.
+
+        Separators are removed from the whole batch in a single pass, and every distinct number is parsed only once.
+
+        :param phone_numbers: A list of phone numbers, as strings.
+        :return: A list of the canonical forms, None where a phone number is invalid.
+        """
+        stripped = _BATCH_DELIMITER.join(phone_numbers).translate(_SEPARATORS).split(_BATCH_DELIMITER) \
+            if phone_numbers else []
+
+        if len(stripped) != len(phone_numbers):
+            # a number containing the delimiter, fall back to one at a time
+            stripped = [phone_number.translate(_SEPARATORS) for phone_number in phone_numbers]
+
+        normalized = {}
+        results = []
+
+        for number, phone_number in zip(stripped, phone_numbers):
+            try:
+                result = normalized[number]
+            except KeyError:
+                try:
+                    result = self._digits(number, phone_number)
+                except InvalidPhoneNumber:
+                    result = None
+
+                normalized[number] = result
+
+            results.append(result)
+
+        return results
+
+    def _digits(self, number, phone_number):
+        if not _NUMBER.fullmatch(number):
+            number = _EXTENSION.sub('', number)
+
+            if not _NUMBER.fullmatch(number):
+                raise InvalidPhoneNumber("invalid phone number {phone_number!r}".format(phone_number=phone_number))
+
+        if number.startswith('+'):
+            digits = number[1:]
+        elif number.startswith('011') and self.default_country_code in (None, '1'):
+            digits = number[3:]
+        elif number.startswith('00') and self.default_country_code != '1':
+            digits = number[2:]
+        elif self.default_country_code is None:
+            digits = number
+        elif self.default_country_code == '1':
+            digits = number if len(number) == 11 and number.startswith('1') else '1' + number
+
+            if len(digits) != 11 or digits[1] in '01':
+                raise InvalidPhoneNumber("invalid phone number {phone_number!r}".format(phone_number=phone_number))
+        else:
+            if self.trunk_prefix and number.startswith(self.trunk_prefix):
+                number = number[len(self.trunk_prefix):]
+
+            digits = self.default_country_code + number
+
+        if not MIN_DIGITS <= len(digits) <= MAX_DIGITS or digits.startswith('0'):
+            raise InvalidPhoneNumber("invalid phone number {phone_number!r}".format(phone_number=phone_number))
+
+        return digits
+
+
+_default_normalizer = PhoneNumberNormalizer()
+
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+
+def normalize(phone_number, default_country_code=None):
+    """
+    The canonical TeleSign form of phone_number, see PhoneNumberNormalizer.
+    """
+    if default_country_code is None:
+        return _default_normalizer.normalize(phone_number)
+
+    return PhoneNumberNormalizer(default_country_code).normalize(phone_number)
+
+
+def phone_number_key(phone_number):
+    """
+    The canonical form of phone_number, or only its digits if it is invalid, identifying a phone number in cache and
+    verification keys regardless of its formatting.
+    """
+    try:
+        return _default_normalizer.normalize(phone_number)
+    except InvalidPhoneNumber:
+        return _NON_DIGITS.sub('', phone_number)
@@ -0,0 +1,270 @@
+from __future__ import unicode_literals
+
+import heapq
+import itertools
+import threading
+import time
+
+from telesign.bulk import imap_bounded
+
+IN_PROGRESS_STATUS_CODES = frozenset([
+    103,  # voice: call in progress
+    290,  # messaging: message in progress
+    291,  # messaging: queued
+    292,  # messaging: queued at gateway
+    295,  # messaging: status delayed
+])
+
+
+class StatusUpdate(object):
+    """
+    A change of status of a polled transaction.
+
+    :param reference_id: The reference_id of the transaction.
+    :param response: The RestClient Response object of the status lookup, or None if it raised.
+    :param status_code: The TeleSign status code of the transaction, or None if it is unknown. It is the last known
+        status code when the lookup raised or got an error response.
+    :param terminal: Whether the transaction reached a final status, or was given up on, and is no longer polled.
+    :param age: The seconds elapsed since the transaction was registered.
+    :param error: The exception raised by the status lookup, or None.
+    """
+    __slots__ = ('reference_id', 'response', 'status_code', 'terminal', 'age', 'error')
+
+    def __init__(self, reference_id, response, status_code, terminal, age, error=None):
+        self.reference_id = reference_id
+        self.response = response
+        self.status_code = status_code
+        self.terminal = terminal
+        self.age = age
+        self.error = error
+
+    def __repr__(self):
+        return "StatusUpdate(reference_id={reference_id!r}, status_code={status_code}, terminal={terminal})".format(
+            reference_id=self.reference_id, status_code=self.status_code, terminal=self.terminal)
+
+
+class _Tracked(object):
+    __slots__ = ('reference_id', 'registered', 'status_code')
+
+    def __init__(self, reference_id, registered):
+        self.reference_id = reference_id
+        self.registered = registered
+        self.status_code = None
+
+
+class BaseStatusPoller(object):
+    """
+    The scheduling shared by StatusPoller and telesign.aio.poller.AsyncStatusPoller.
+
+    Every registered reference_id is looked up after min_interval seconds, then at intervals growing with the age of the
+    transaction, backoff times its age, capped at max_interval. A transaction stops being polled once its status code is
+    not one of in_progress_codes, or after max_age seconds. A lookup that raises or gets a 429 or 5xx response is
+    retried on the same schedule, any other error response, such as a 404 for an unknown reference_id, ends the
+    polling.
+
+    :param status: The status lookup, such as MessagingClient.status or VoiceClient.status.
+    :param callback: (optional) Callable invoked with every StatusUpdate.
+    :param concurrency: (optional) The maximum number of status lookups in flight at once, as an int.
+    :param min_interval: (optional) The minimum number of seconds between two lookups of a transaction.
+    :param max_interval: (optional) The maximum number of seconds between two lookups of a transaction.
+    :param backoff: (optional) The fraction of the age of a transaction waited before its next lookup.
+    :param max_age: (optional) The number of seconds after which a transaction is given up on.
+    :param in_progress_codes: (optional) The status codes that are not final.
+    """
+
+    def __init__(self,
+                 status,
+                 callback=None,
+                 concurrency=4,
+                 min_interval=1.0,
+                 max_interval=60.0,
+                 backoff=0.5,
+                 max_age=3600.0,
+                 in_progress_codes=IN_PROGRESS_STATUS_CODES):
+        self.status = status
+        self.callback = callback
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_age = max_age
+        self.in_progress_codes = frozenset(in_progress_codes)
+
+        self._tracked = {}
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tracked)
+
+    def register(self, reference_id, sent_at=None):
+        """
+        Starts polling the status of reference_id.
+
+        :param reference_id: The reference_id returned when the message or call was sent.
+        :param sent_at: (optional) The time.monotonic() timestamp of the send, defaults to now.
+        """
+        now = time.monotonic()
+        tracked = _Tracked(reference_id, sent_at if sent_at is not None else now)
+
+        with self._lock:
+            self._tracked[reference_id] = tracked
+            self._push(tracked, now)
+
+    def unregister(self, reference_id):
+        """
+        Stops polling the status of reference_id.
+        """
+        with self._lock:
+            self._tracked.pop(reference_id, None)
+
+    def next_due(self):
+        """
+        The time.monotonic() timestamp of the next scheduled lookup, or None if nothing is being polled.
+        """
+        with self._lock:
+            while self._schedule and self._tracked.get(self._schedule[0][2]) is not self._schedule[0][3]:
+                heapq.heappop(self._schedule)
+
+            return self._schedule[0][0] if self._schedule else None
+
+    def _push(self, tracked, now):
+        interval = min(self.max_interval, max(self.min_interval, (now - tracked.registered) * self.backoff))
+
+        heapq.heappush(self._schedule, (now + interval, next(self._sequence), tracked.reference_id, tracked))
+
+    def _pop_due(self, now):
+        due = []
+
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                tracked = heapq.heappop(self._schedule)[3]
+
+                if self._tracked.get(tracked.reference_id) is tracked:
+                    due.append(tracked)
+
+        return due
+
+    def _handle(self, tracked, response, error):
+        now = time.monotonic()
+        age = now - tracked.registered
+
+        # an error response holds an API error code rather than a delivery status, only a 429 or 5xx one is retried
+        failed = error is not None or not response.ok
+        rejected = error is None and not response.ok and response.status_code != 429 and response.status_code < 500
+
+        status_code = tracked.status_code
+        if not failed:
+            try:
+                status_code = response.json['status']['code']
+            except (KeyError, TypeError):
+                pass
+
+        terminal = (status_code is not None and status_code not in self.in_progress_codes) or rejected or \
+            age >= self.max_age
+        changed = status_code != tracked.status_code
+        tracked.status_code = status_code
+
+        with self._lock:
+            if terminal:
+                self._tracked.pop(tracked.reference_id, None)
+            elif self._tracked.get(tracked.reference_id) is tracked:
+                self._push(tracked, now)
+
+        if not (changed or terminal or failed):
+            return None
+
+        update = StatusUpdate(tracked.reference_id, response, status_code, terminal, age, error)
+
+        if self.callback is not None:
+            self.callback(update)
+
+        return update
+
+
+class StatusPoller(BaseStatusPoller):
+    """
+    Polls the status of many messages or calls, pacing lookups by message age, until each reaches a final status.
+
+    A StatusUpdate is emitted whenever the status code of a transaction changes, when it becomes terminal and when a
+    lookup fails. Updates are delivered to the callback, and yielded when iterating over the poller:
+
+        poller = StatusPoller(messaging_client.status)
+        poller.register(response.json['reference_id'])
+
+        for update in poller:
+            print(update.reference_id, update.status_code)
+
+    Iteration ends once no transaction is left to poll. Alternatively start() polls on a background thread, updates
+    are then only delivered to the callback.
+    """
+
+    def __init__(self, status, **kwargs):
+        super(StatusPoller, self).__init__(status, **kwargs)
+
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def poll_due(self):
+        """
+        Looks up every transaction that is due, with at most concurrency lookups in flight.
+
+        :return: The list of StatusUpdate objects emitted.
+        """
+        due = self._pop_due(time.monotonic())
+        updates = []
+
+        for result in imap_bounded(lambda tracked: self.status(tracked.reference_id), due,
+                                   concurrency=self.concurrency):
+            update = self._handle(result.item, result.response, result.error)
+
+            if update is not None:
+                updates.append(update)
+
+        return updates
+
+    def __iter__(self):
+        while not self._stopped.is_set():
+            next_due = self.next_due()
+
+            if next_due is None:
+                return
+
+            delay = next_due - time.monotonic()
+            if delay > 0 and self._stopped.wait(delay):
+                return
+
+            for update in self.poll_due():
+                yield update
+
+    def run(self):
+        """
+        Polls until no transaction is left to poll or stop() is called.
+        """
+        for _ in self:
+            pass
+
+    def start(self):
+        """
+        Polls on a background thread until stop() is called, waiting for transactions to be registered when idle.
+        """
+        def loop():
+            while not self._stopped.is_set():
+                self.run()
+                self._stopped.wait(self.min_interval)
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops polling and waits for the background thread, if any, to finish.
+        """
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,155 @@
+from __future__ import unicode_literals
+
+import asyncio
+import threading
+import time
+
+MESSAGING_PREFIX = "/v1/messaging"
+VOICE_PREFIX = "/v1/voice"
+PHONEID_PREFIX = "/v1/phoneid"
+SCORE_PREFIX = "/v1/score"
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket allowing rate requests per second on average, with bursts of up to capacity requests.
+
+    Tokens are reserved rather than waited for: reserve() always succeeds immediately and returns how long the caller
+    must wait before using its token, so the same bucket paces both threads and asyncio tasks.
+
+    :param rate: The number of tokens added per second, as a float.
+    :param capacity: (optional) The maximum number of tokens in the bucket, defaults to rate.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def reserve(self, tokens=1, max_wait=None):
+        """
+        Takes tokens from the bucket, returning the number of seconds to wait before they may be used.
+
+        :param max_wait: (optional) The longest acceptable wait in seconds. If the wait would be longer, no token is
+            taken and None is returned.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            if max_wait is not None and wait > max_wait:
+                self._tokens += tokens
+                return None
+
+            self.acquired += 1
+            if wait > 0:
+                self.throttled += 1
+                self.wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+        return wait
+
+    def stats(self):
+        """
+        The wait time metrics of this bucket, as a dictionary.
+        """
+        with self._lock:
+            return {'acquired': self.acquired,
+                    'throttled': self.throttled,
+                    'wait_seconds': self.wait_seconds,
+                    'max_wait_seconds': self.max_wait_seconds}
+
+
+class RateLimiter(object):
+    """
+    Client-side rate limiting of TeleSign REST API requests, keyed by resource prefix, so that bursts are smoothed on
+    the client instead of being rejected by the API with a 429.
+
+    A single RateLimiter can be shared by any number of RestClient and AsyncRestClient instances and threads, for
+    example one per account:
+
+        limiter = RateLimiter({MESSAGING_PREFIX: 50, PHONEID_PREFIX: TokenBucket(10, capacity=20)})
+        messaging_client = MessagingClient(customer_id, api_key, rate_limiter=limiter)
+
+    :param limits: A dictionary mapping resource prefixes to a rate in requests per second or a TokenBucket. A request
+        is limited by the bucket of the longest prefix of its resource.
+    :param default: (optional) The rate or TokenBucket limiting resources that match no prefix, these are not limited
+        if None.
+    """
+
+    def __init__(self, limits, default=None):
+        self.buckets = dict((prefix, self._bucket(limit)) for prefix, limit in limits.items())
+        self.default = self._bucket(default) if default is not None else None
+
+        self._prefixes = sorted(self.buckets, key=len, reverse=True)
+
+    @staticmethod
+    def _bucket(limit):
+        return limit if isinstance(limit, TokenBucket) else TokenBucket(limit)
+
+    def bucket_for(self, resource):
+        """
+        The TokenBucket limiting resource, or None if it is not limited.
+        """
+        for prefix in self._prefixes:
+            if resource.startswith(prefix):
+                return self.buckets[prefix]
+
+        return self.default
+
+    def acquire(self, resource, timeout=None):
+        """
+        Blocks the calling thread until a request against resource is allowed.
+
+        :param timeout: (optional) The longest wait in seconds. A request that would wait longer is not allowed and
+            returns immediately, without waiting or taking a token.
+        :return: The number of seconds waited, or None if the request is not allowed.
+        """
+        bucket = self.bucket_for(resource)
+        wait = bucket.reserve(max_wait=timeout) if bucket is not None else 0.0
+
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+    async def acquire_async(self, resource, timeout=None):
+        """
+        Suspends the calling task until a request against resource is allowed.
+
+        :param timeout: (optional) The longest wait in seconds, see acquire.
+        :return: The number of seconds waited, or None if the request is not allowed.
+        """
+        bucket = self.bucket_for(resource)
+        wait = bucket.reserve(max_wait=timeout) if bucket is not None else 0.0
+
+        if wait:
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def stats(self):
+        """
+        The wait time metrics of every bucket keyed by prefix, with those of the default bucket under None.
+        """
+        stats = dict((prefix, bucket.stats()) for prefix, bucket in self.buckets.items())
+
+        if self.default is not None:
+            stats[None] = self.default.stats()
+
+        return stats
@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 
 import hmac
+import json
+import time
 import uuid
 from base64 import b64encode, b64decode
 from email.utils import formatdate
@@ -10,6 +12,37 @@ from platform import python_version
 import requests
 
 import telesign
+from telesign.auth import RequestSigner
+from telesign.circuit import EndpointPool
+from telesign.deadline import Deadline, DeadlineExceeded
+from telesign.instrumentation import RequestContext
+from telesign.phonenumber import InvalidPhoneNumber, phone_number_key
+from telesign.retry import RetryPolicy
+from telesign.transport import RequestsTransport
+
+
+class UserAgent(object):
+    """
+    A descriptor building the User-Agent of a client class on first access rather than at import time.
+
+    :param library: The name of the HTTP library used by the client, as a string.
+    :param library_version: Callable returning the version of the HTTP library, as a string.
+    """
+
+    def __init__(self, library, library_version):
+        self.library = library
+        self.library_version = library_version
+        self.value = None
+
+    def __get__(self, instance, owner):
+        if self.value is None:
+            self.value = "TeleSignSDK/python-{sdk_version} Python/{python_version} {library}/{library_version}".format(
+                sdk_version=telesign.__version__,
+                python_version=python_version(),
+                library=self.library,
+                library_version=self.library_version())
+
+        return self.value
 
 
 class RestClient(requests.models.RequestEncodingMixin):
@@ -20,57 +53,239 @@ class RestClient(requests.models.RequestEncodingMixin):
     RequestEncodingMixin offers the function _encode_params for url encoding the body for use in string_to_sign outside
     of a regular HTTP request.
 
+    A client is safe to share between threads once created: concurrent requests share only the connection pool, the
+    signer, which signs without locks from state fixed at creation, and the optional retry policy, rate limiter,
+    coalescer, endpoint pool and instruments, which are immutable or guard their own state with locks. Changing the
+    attributes of a client, or of its session, while requests are in flight is not supported. Pass max_concurrency, or
+    a pool_maxsize of at least the number of threads sharing the client, so that every thread can keep a connection
+    alive instead of opening connections that are discarded after a single request.
+
     See https://developer.telesign.com for detailed API documentation.
     """
-    user_agent = "TeleSignSDK/python-{sdk_version} Python/{python_version} Requests/{requests_version}".format(
-        sdk_version=telesign.__version__,
-        python_version=python_version(),
-        requests_version=requests.__version__)
+    user_agent = UserAgent("Requests", lambda: requests.__version__)
 
     class Response(object):
         """
         A simple HTTP Response object to abstract the underlying Requests library response.
 
+        The body text and the decoded json are computed on first access and cached, so a response whose status_code is
+        all that is checked is never decoded.
+
         :param requests_response: A Requests response object.
+        :param raw: (optional) Keep only the raw response bytes in content and release the Requests response, body
+            and json are then decoded from content as utf-8 if accessed.
         """
+        __slots__ = ('status_code', 'headers', 'ok', 'content', '_requests_response', '_body', '_json')
 
-        def __init__(self, requests_response):
+        def __init__(self, requests_response, raw=False):
             self.status_code = requests_response.status_code
             self.headers = requests_response.headers
-            self.body = requests_response.text
             self.ok = requests_response.ok
+            self.content = requests_response.content
+
+            self._requests_response = None if raw else requests_response
 
+        @property
+        def body(self):
             try:
-                self.json = requests_response.json()
+                return self._body
+            except AttributeError:
+                pass
+
+            if self._requests_response is not None:
+                self._body = self._requests_response.text
+            else:
+                self._body = self.content.decode('utf-8', 'replace') if self.content else ''
+
+            return self._body
+
+        @property
+        def json(self):
+            try:
+                return self._json
+            except AttributeError:
+                pass
+
+            try:
+                if self._requests_response is not None:
+                    self._json = self._requests_response.json()
+                else:
+                    self._json = json.loads(self.content.decode('utf-8'))
             except (Exception, ValueError):
-                self.json = None
+                self._json = None
+
+            return self._json
 
     def __init__(self,
                  customer_id,
                  api_key,
                  rest_endpoint='https://rest-api.telesign.com',
                  proxies=None,
-                 timeout=10):
+                 timeout=10,
+                 connect_timeout=None,
+                 read_timeout=None,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 pool_block=False,
+                 keep_alive=True,
+                 max_concurrency=None,
+                 session=None,
+                 raw_responses=False,
+                 retry_policy=None,
+                 rate_limiter=None,
+                 coalescer=None,
+                 transport=None,
+                 instruments=None,
+                 phone_number_normalizer=None):
         """
         TeleSign RestClient useful for making generic RESTful requests against our API.
 
         :param customer_id: Your customer_id string associated with your account.
         :param api_key: Your api_key string associated with your account.
-        :param rest_endpoint: (optional) Override the default rest_endpoint to target another endpoint string.
+        :param rest_endpoint: (optional) Override the default rest_endpoint to target another endpoint string. A list of
+            endpoint strings, or a telesign.circuit.EndpointPool, spreads requests over several endpoints with circuit
+            breakers and failover, see EndpointPool.
         :param proxies: (optional) Dictionary mapping protocol or protocol and hostname to the URL of the proxy.
         :param timeout: (optional) How long to wait for the server to send data before giving up, as a float.
+        :param connect_timeout: (optional) How long to wait for a connection before giving up, as a float. Defaults to
+            timeout. With a telesign.transport.HTTPClientTransport and pool_block, it also bounds the wait for a free
+            pooled connection, the default Requests transport waits for one without limit.
+        :param read_timeout: (optional) How long to wait for the server to send data before giving up, as a float.
+            Defaults to timeout.
+        :param pool_connections: (optional) The number of host connection pools to cache, as an int.
+        :param pool_maxsize: (optional) The maximum number of connections kept open per host, as an int. Set this to
+            the number of threads sharing the client so that no connection is opened only to be discarded.
+        :param pool_block: (optional) Whether a request should wait for a free pooled connection when all pool_maxsize
+            connections are in use, instead of opening an extra connection that is discarded afterwards.
+        :param keep_alive: (optional) Whether connections are kept alive and reused between requests.
+        :param max_concurrency: (optional) The number of threads sharing the client, as an int. The connection pool
+            is made large enough to keep a connection alive for each of them, pool_maxsize is raised if smaller.
+        :param session: (optional) A requests Session to send requests with, for example one created with
+            RestClient.create_session and shared by several clients so they use a single warm connection pool. The
+            pool_* and keep_alive arguments are ignored when a session is given.
+        :param raw_responses: (optional) Whether responses keep only the raw response bytes, see RestClient.Response.
+        :param retry_policy: (optional) The telesign.retry.RetryPolicy deciding which failed requests are retried,
+            defaults to RetryPolicy(). Pass RetryPolicy.disabled() to make exactly one attempt per request.
+        :param rate_limiter: (optional) A telesign.ratelimit.RateLimiter pacing the requests of this client, it can be
+            shared with other clients.
+        :param coalescer: (optional) A telesign.cache.RequestCoalescer letting concurrent identical GET requests share
+            a single HTTP request and Response.
+        :param transport: (optional) The telesign.transport.Transport sending the requests, it can be shared with
+            other clients. Defaults to a RequestsTransport using session. The session, proxies, pool_* and keep_alive
+            arguments are ignored when a transport is given.
+        :param instruments: (optional) A list of telesign.instrumentation.Instrument objects measuring every request.
+        :param phone_number_normalizer: (optional) A telesign.phonenumber.PhoneNumberNormalizer canonicalizing the
+            phone numbers passed to the product clients before they are sent, so that differently formatted numbers
+            make identical requests. Phone numbers are sent as given by default.
         """
         self.customer_id = customer_id
         self.api_key = api_key
 
-        self.api_host = rest_endpoint
+        self.signer = RequestSigner(customer_id, api_key, user_agent=self.user_agent)
+
+        if isinstance(rest_endpoint, (list, tuple)):
+            rest_endpoint = EndpointPool(rest_endpoint)
+
+        self.endpoints = rest_endpoint if isinstance(rest_endpoint, EndpointPool) else None
+
+        self.api_host = self.endpoints.primary if self.endpoints is not None else rest_endpoint
 
-        self.session = requests.Session()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
 
-        self.session.proxies = proxies if proxies else {}
+        self.rate_limiter = rate_limiter
+
+        self.coalescer = coalescer
+
+        if max_concurrency is not None:
+            pool_maxsize = max(pool_maxsize, max_concurrency)
+
+        if transport is None:
+            if session is None:
+                session = self.create_session(pool_connections=pool_connections,
+                                              pool_maxsize=pool_maxsize,
+                                              pool_block=pool_block,
+                                              keep_alive=keep_alive,
+                                              connect_retries=self.retry_policy.connect_retries)
+
+                session.proxies = proxies if proxies else {}
+            elif proxies:
+                session.proxies = proxies
+
+            transport = RequestsTransport(session)
+
+        self.transport = transport
+
+        self.session = getattr(transport, 'session', None)
+
+        if connect_timeout is not None or read_timeout is not None:
+            timeout = (connect_timeout if connect_timeout is not None else timeout,
+                       read_timeout if read_timeout is not None else timeout)
 
         self.timeout = timeout
 
+        self.instruments = list(instruments) if instruments else []
+
+        self.raw_responses = raw_responses
+
+        self.phone_number_normalizer = phone_number_normalizer
+
+    def normalize_phone_number(self, phone_number):
+        """
+        The phone_number canonicalized by the phone_number_normalizer of the client, or as given without one.
+
+        :raise telesign.phonenumber.InvalidPhoneNumber: If the normalizer rejects phone_number.
+        """
+        if self.phone_number_normalizer is None:
+            return phone_number
+
+        return self.phone_number_normalizer.normalize(phone_number)
+
+    def phone_number_key(self, phone_number):
+        """
+        The phone_number canonicalized by the phone_number_normalizer of the client, or by
+        telesign.phonenumber.phone_number_key without one or if the normalizer rejects it, identifying a phone number
+        regardless of its formatting.
+        """
+        if self.phone_number_normalizer is not None:
+            try:
+                return self.phone_number_normalizer.normalize(phone_number)
+            except InvalidPhoneNumber:
+                pass
+
+        return phone_number_key(phone_number)
+
+    @staticmethod
+    def create_session(pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, connect_retries=0):
+        """
+        Creates a Requests session with a tuned connection pool, suitable for sharing between several clients.
+
+        :param pool_connections: (optional) The number of host connection pools to cache, as an int.
+        :param pool_maxsize: (optional) The maximum number of connections kept open per host, as an int.
+        :param pool_block: (optional) Whether a request should wait for a free pooled connection when all pool_maxsize
+            connections are in use, instead of opening an extra connection that is discarded afterwards.
+        :param keep_alive: (optional) Whether connections are kept alive and reused between requests.
+        :param connect_retries: (optional) The number of times a failure to connect is retried, as an int. Only
+            failures that happen before the request is sent are retried, so this is safe for any request.
+        :return: The Requests session.
+        """
+        session = requests.Session()
+
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections,
+                                                pool_maxsize=pool_maxsize,
+                                                pool_block=pool_block,
+                                                max_retries=requests.adapters.Retry(total=connect_retries,
+                                                                                    connect=connect_retries,
+                                                                                    read=False,
+                                                                                    status=0,
+                                                                                    redirect=False))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
     @staticmethod
     def generate_telesign_headers(customer_id,
                                   api_key,
@@ -146,70 +361,190 @@ class RestClient(requests.models.RequestEncodingMixin):
 
         return headers
 
-    def post(self, resource, **params):
+    def post(self, resource, deadline=None, **params):
         """
         Generic TeleSign REST API POST handler.
 
         :param resource: The partial resource URI to perform the request against, as a string.
+        :param deadline: (optional) A telesign.deadline.Deadline, or a number of seconds, by which the request including
+            its retries must complete. A request still waiting to be sent at its deadline raises DeadlineExceeded.
         :param params: Body params to perform the POST request with, as a dictionary.
         :return: The RestClient Response object.
         """
-        return self._execute(self.session.post, 'POST', resource, **params)
+        return self._execute('POST', resource, params, deadline)
 
-    def get(self, resource, **params):
+    def get(self, resource, deadline=None, **params):
         """
         Generic TeleSign REST API GET handler.
 
         :param resource: The partial resource URI to perform the request against, as a string.
+        :param deadline: (optional) A telesign.deadline.Deadline, or a number of seconds, by which the request including
+            its retries must complete. A request still waiting to be sent at its deadline raises DeadlineExceeded.
         :param params: Body params to perform the GET request with, as a dictionary.
         :return: The RestClient Response object.
         """
-        return self._execute(self.session.get, 'GET', resource, **params)
+        if self.coalescer is not None:
+            key = self.coalescer.request_key(self.customer_id, self.api_host + resource, self._encode_params(params))
+
+            return self.coalescer.fetch(key, lambda: self._execute('GET', resource, params, deadline))
+
+        return self._execute('GET', resource, params, deadline)
 
-    def put(self, resource, **params):
+    def put(self, resource, deadline=None, **params):
         """
         Generic TeleSign REST API PUT handler.
 
         :param resource: The partial resource URI to perform the request against, as a string.
+        :param deadline: (optional) A telesign.deadline.Deadline, or a number of seconds, by which the request including
+            its retries must complete. A request still waiting to be sent at its deadline raises DeadlineExceeded.
         :param params: Body params to perform the PUT request with, as a dictionary.
         :return: The RestClient Response object.
         """
-        return self._execute(self.session.put, 'PUT', resource, **params)
+        return self._execute('PUT', resource, params, deadline)
 
-    def delete(self, resource, **params):
+    def delete(self, resource, deadline=None, **params):
         """
         Generic TeleSign REST API DELETE handler.
 
         :param resource: The partial resource URI to perform the request against, as a string.
+        :param deadline: (optional) A telesign.deadline.Deadline, or a number of seconds, by which the request including
+            its retries must complete. A request still waiting to be sent at its deadline raises DeadlineExceeded.
         :param params: Body params to perform the DELETE request with, as a dictionary.
         :return: The RestClient Response object.
         """
-        return self._execute(self.session.delete, 'DELETE', resource, **params)
+        return self._execute('DELETE', resource, params, deadline)
 
-    def _execute(self, method_function, method_name, resource, **params):
+    def _execute(self, method_name, resource, params, deadline=None):
         """
         Generic TeleSign REST API request handler.
 
-        :param method_function: The Requests HTTP request function to perform the request.
         :param method_name: The HTTP method name, as an upper case string.
         :param resource: The partial resource URI to perform the request against, as a string.
         :param params: Body params to perform the HTTP request with, as a dictionary.
+        :param deadline: (optional) The Deadline, or number of seconds, by which the request must complete.
         :return: The RestClient Response object.
         """
-        resource_uri = "{api_host}{resource}".format(api_host=self.api_host, resource=resource)
+        deadline = Deadline.coerce(deadline)
+
+        if not self.instruments:
+            return self._send(method_name, resource, params, None, deadline)
+
+        context = RequestContext(method_name, resource)
+
+        for instrument in self.instruments:
+            instrument.before_request(context)
+
+        try:
+            context.response = self._send(method_name, resource, params, context, deadline)
+            return context.response
+        except Exception as e:
+            context.error = e
+            raise
+        finally:
+            context.elapsed = time.perf_counter() - context.started
+
+            for instrument in self.instruments:
+                instrument.after_request(context)
+
+    def _send(self, method_name, resource, params, context, deadline=None):
+        """
+        Sends a request, retrying it as allowed by the retry policy and the deadline.
+
+        :param context: The RequestContext collecting timings, or None if the client is not instrumented.
+        :param deadline: The Deadline of the request, or None.
+        """
+        if context is not None:
+            mark = context.started
 
         url_encoded_fields = self._encode_params(params)
 
-        headers = RestClient.generate_telesign_headers(self.customer_id,
-                                                       self.api_key,
-                                                       method_name,
-                                                       resource,
-                                                       url_encoded_fields,
-                                                       user_agent=self.user_agent)
+        if context is not None:
+            mark = context.mark('encode', mark)
+
+        endpoints = self.endpoints
+        endpoint = None
+        resource_uri = "{api_host}{resource}".format(api_host=self.api_host, resource=resource)
+
+        retry_policy = self.retry_policy
+        retryable = retry_policy.is_retryable_request(method_name, params)
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if endpoints is not None:
+                endpoint = endpoints.select()
+                resource_uri = "{api_host}{resource}".format(api_host=endpoint.url, resource=resource)
+
+            try:
+                if self.rate_limiter is not None:
+                    if deadline is None:
+                        self.rate_limiter.acquire(resource)
+                    elif self.rate_limiter.acquire(resource, timeout=deadline.check()) is None:
+                        # fails fast rather than sleeping past the deadline
+                        raise DeadlineExceeded("deadline of {seconds:.3f}s is shorter than the rate limit wait".format(
+                            seconds=deadline.remaining()))
+
+                    if context is not None:
+                        mark = context.mark('rate_limit', mark)
+
+                # abandoned before it takes a connection if it spent its time queueing
+                timeout = self.timeout if deadline is None else deadline.bound(self.timeout)
+
+                headers = self.signer.headers(method_name, resource, url_encoded_fields)
+            except Exception:
+                # nothing was sent, a half open endpoint must not keep its trial call reserved
+                if endpoint is not None:
+                    endpoints.release(endpoint)
+                raise
+
+            if context is not None:
+                context.attempts = attempt
+                mark = context.mark('sign', mark)
+
+            sent = time.monotonic()
+
+            try:
+                transport_response = self.transport.request(method_name,
+                                                            resource_uri,
+                                                            url_encoded_fields,
+                                                            headers,
+                                                            timeout)
+            except Exception as e:
+                if endpoint is not None:
+                    endpoints.record(endpoint, False, time.monotonic() - sent)
+
+                if context is not None:
+                    mark = context.mark('transport', mark)
+
+                if not retryable or not isinstance(e, self.transport.retryable_errors):
+                    raise
+
+                delay = retry_policy.next_delay(attempt, time.monotonic() - started)
+                if delay is None or deadline is not None and delay >= deadline.remaining():
+                    raise
+            else:
+                if endpoint is not None:
+                    endpoints.record(endpoint, transport_response.status_code < 500, time.monotonic() - sent)
+
+                response = self.Response(transport_response, raw=self.raw_responses)
+
+                if context is not None:
+                    mark = context.mark('transport', mark)
+
+                    elapsed = getattr(transport_response, 'elapsed', None)
+                    if elapsed is not None:
+                        context.timings['server'] += elapsed.total_seconds()
+
+                if not retryable or not retry_policy.is_retryable_response(response):
+                    return response
+
+                delay = retry_policy.next_delay(attempt, time.monotonic() - started, response)
+                if delay is None or deadline is not None and delay >= deadline.remaining():
+                    return response
 
-        response = self.Response(method_function(resource_uri,
-                                                 data=url_encoded_fields,
-                                                 headers=headers,
-                                                 timeout=self.timeout))
+            retry_policy.sleep(delay)
 
-        return response
+            if context is not None:
+                mark = context.mark('backoff', mark)
@@ -0,0 +1,126 @@
+from __future__ import unicode_literals
+
+import random
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE')
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy(object):
+    """
+    Decides whether and when a failed TeleSign REST API request is retried.
+
+    Requests are retried with exponential backoff and full jitter, or after the delay requested by a Retry-After header,
+    until max_attempts is reached or the next attempt would start after total_timeout seconds. Idempotent methods are
+    retried by default, POST requests only when they carry an external_id, so that a retried send cannot be delivered
+    twice. Every attempt is signed again with a fresh nonce and date.
+
+    Connection failures that happen before a request is sent are always safe to retry, connect_retries of them are
+    retried by the Requests session itself.
+
+    :param max_attempts: (optional) The maximum number of attempts per request, including the first, as an int.
+    :param backoff_factor: (optional) The backoff ceiling of the first retry in seconds, doubled for each retry.
+    :param max_backoff: (optional) The maximum backoff between two attempts in seconds.
+    :param total_timeout: (optional) The time budget in seconds across all attempts of a request.
+    :param retry_status_codes: (optional) The HTTP status codes that are retried.
+    :param retry_methods: (optional) The HTTP methods that are retried.
+    :param retry_posts_with_external_id: (optional) Whether POST requests with an external_id param are retried.
+    :param connect_retries: (optional) The number of connection failures retried by the session, as an int.
+    """
+
+    def __init__(self,
+                 max_attempts=3,
+                 backoff_factor=0.5,
+                 max_backoff=10,
+                 total_timeout=30,
+                 retry_status_codes=RETRY_STATUS_CODES,
+                 retry_methods=IDEMPOTENT_METHODS,
+                 retry_posts_with_external_id=True,
+                 connect_retries=2):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.total_timeout = total_timeout
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_methods = frozenset(retry_methods)
+        self.retry_posts_with_external_id = retry_posts_with_external_id
+        self.connect_retries = connect_retries
+
+    @classmethod
+    def disabled(cls):
+        """
+        A RetryPolicy that never retries.
+        """
+        return cls(max_attempts=1, connect_retries=0)
+
+    def is_retryable_request(self, method_name, params):
+        """
+        Whether a request may be sent more than once.
+
+        :param method_name: The HTTP method name, as an upper case string.
+        :param params: Body params of the request, as a dictionary.
+        """
+        if self.max_attempts < 2:
+            return False
+
+        if method_name in self.retry_methods:
+            return True
+
+        return method_name == 'POST' and self.retry_posts_with_external_id and bool(params.get('external_id'))
+
+    def is_retryable_response(self, response):
+        """
+        Whether the status code of response is worth retrying.
+
+        :param response: The RestClient Response object.
+        """
+        return response.status_code in self.retry_status_codes
+
+    def next_delay(self, attempt, elapsed, response=None):
+        """
+        The delay in seconds before the next attempt, or None if the request must not be attempted again.
+
+        :param attempt: The number of attempts made so far, as an int.
+        :param elapsed: The seconds elapsed since the first attempt started.
+        :param response: (optional) The Response object of the failed attempt, None after a connection error.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.retry_after(response) if response is not None else None
+
+        if delay is None:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+        if elapsed + delay > self.total_timeout:
+            return None
+
+        return delay
+
+    @staticmethod
+    def retry_after(response):
+        """
+        The delay in seconds requested by the Retry-After header of response, or None.
+
+        :param response: The RestClient Response object.
+        """
+        value = response.headers.get('Retry-After') if response.headers else None
+
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        parsed = parsedate_tz(value)
+        if parsed is None:
+            return None
+
+        return max(0.0, mktime_tz(parsed) - time.time())
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
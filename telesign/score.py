@@ -10,16 +10,30 @@ class ScoreClient(RestClient):
     Score provides risk information about a specified phone number.
     """
 
-    def __init__(self, customer_id, api_key, **kwargs):
+    def __init__(self, customer_id, api_key, cache=None, **kwargs):
+        """
+        :param cache: (optional) A telesign.cache.ResponseCache answering repeated lookups of a phone number.
+        """
         super(ScoreClient, self).__init__(customer_id, api_key, **kwargs)
 
-    def score(self, phone_number, account_lifecycle_event, **params):
+        self.cache = cache
+
+    def score(self, phone_number, account_lifecycle_event, deadline=None, **params):
         """
         Score is an API that delivers reputation scoring based on phone number intelligence, traffic patterns, machine
         learning, and a global data consortium.
 
+        A deadline, see RestClient.post, is not part of the cache key.
+
         See https://developer.telesign.com/docs/score-api for detailed API documentation.
         """
-        return self.post(SCORE_RESOURCE.format(phone_number=phone_number),
-                         account_lifecycle_event=account_lifecycle_event,
-                         **params)
+        phone_number = self.normalize_phone_number(phone_number)
+        resource = SCORE_RESOURCE.format(phone_number=phone_number)
+        params = dict(account_lifecycle_event=account_lifecycle_event, **params)
+
+        if self.cache is None:
+            return self.post(resource, deadline=deadline, **params)
+
+        key = self.cache.key(self.customer_id, self.api_host, SCORE_RESOURCE, phone_number, params)
+
+        return self.cache.fetch(key, lambda: self.post(resource, deadline=deadline, **params))
@@ -0,0 +1,66 @@
+from __future__ import unicode_literals
+
+import threading
+
+
+class _Call(object):
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Deduplicates concurrent calls: while a call for a key is in flight, other threads calling with the same key wait for
+    it and share its result, or its exception, instead of making the call again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        """
+        Calls function, unless a call for key is already in flight, in which case its outcome is shared.
+
+        :param key: The hashable key identifying identical calls.
+        :param function: Callable taking no arguments.
+        :return: The return value of function.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.event.set()
+
+        return call.result
+
+    def in_flight(self):
+        """
+        The number of keys with a call in flight.
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,221 @@
+from __future__ import unicode_literals
+
+import json
+import ssl
+import threading
+import time
+from datetime import timedelta
+
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from queue import LifoQueue, Empty, Full
+from urllib.parse import urlsplit
+
+import requests
+
+
+class Transport(object):
+    """
+    The interface between RestClient and the HTTP library sending its requests.
+
+    A transport sends one signed request and returns an object exposing status_code, headers, ok, content, text and
+    json() like a Requests response, which RestClient wraps in its Response. Transports must be safe to share between
+    threads and clients.
+    """
+
+    retryable_errors = ()
+    """
+    The exception types raised by request when the request failed before a response was received.
+    """
+
+    def request(self, method_name, url, data, headers, timeout):
+        """
+        Sends a request.
+
+        :param method_name: The HTTP method name, as an upper case string.
+        :param url: The absolute URL of the request, as a string.
+        :param data: The url encoded body of the request, as a string.
+        :param headers: The headers of the request, as a dictionary.
+        :param timeout: How long to wait for the server to send data before giving up, as a float, or a (connect, read)
+            tuple of how long to wait for a connection and for the server to send data.
+        :return: The response object.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Closes the pooled connections of this transport.
+        """
+
+
+def split_timeout(timeout):
+    """
+    The (connect, read) timeouts of a timeout given as a float or as a (connect, read) tuple.
+    """
+    if isinstance(timeout, tuple):
+        return timeout
+
+    return timeout, timeout
+
+
+class RequestsTransport(Transport):
+    """
+    The default Transport, sending requests with a Requests session.
+
+    :param session: The Requests session, see RestClient.create_session.
+    """
+    retryable_errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, session):
+        self.session = session
+
+    def request(self, method_name, url, data, headers, timeout):
+        method_function = getattr(self.session, method_name.lower())
+
+        return method_function(url, data=data, headers=headers, timeout=timeout)
+
+    def close(self):
+        self.session.close()
+
+
+class HTTPClientResponse(object):
+    """
+    A fully read http.client response, exposing the attributes of a Requests response used by RestClient.Response.
+    Like in Requests, elapsed is the time between sending the request and parsing the response headers.
+    """
+    __slots__ = ('status_code', 'headers', 'content', 'elapsed')
+
+    def __init__(self, status_code, headers, content, elapsed):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.headers.get_content_charset() or 'utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class HTTPClientTransport(Transport):
+    """
+    A lean Transport built directly on the standard library's http.client, without the hooks, cookie handling,
+    redirect machinery and adapter layers of Requests. Proxies are not supported.
+
+    Connections are kept alive in a pool per host of at most pool_maxsize idle connections. A request sent on a pooled
+    connection that the server has meanwhile closed is sent again on a new connection. With pool_block, waiting for a
+    connection counts towards the connect timeout. Requires Python 3.
+
+    :param pool_maxsize: (optional) The maximum number of idle connections kept open per host, as an int.
+    :param pool_block: (optional) Whether a request should wait for a connection when pool_maxsize connections to its
+        host are in use, instead of opening an extra connection that is discarded afterwards.
+    :param connect_retries: (optional) The number of times a failure to connect is retried, as an int.
+    :param ssl_context: (optional) The ssl.SSLContext of https connections, defaults to ssl.create_default_context().
+    """
+    retryable_errors = (OSError, HTTPException)
+
+    def __init__(self, pool_maxsize=10, pool_block=False, connect_retries=0, ssl_context=None):
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connect_retries = connect_retries
+        self.ssl_context = ssl_context if ssl_context is not None else ssl.create_default_context()
+
+        self._pools = {}
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, origin):
+        pool = self._pools.get(origin)
+
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(origin)
+
+                if pool is None:
+                    pool = self._pools[origin] = LifoQueue(self.pool_maxsize)
+                    self._semaphores[origin] = threading.BoundedSemaphore(self.pool_maxsize)
+
+        return pool
+
+    def _new_connection(self, scheme, netloc, timeout):
+        if scheme == 'https':
+            connection = HTTPSConnection(netloc, timeout=timeout, context=self.ssl_context)
+        else:
+            connection = HTTPConnection(netloc, timeout=timeout)
+
+        for attempt in range(self.connect_retries + 1):
+            try:
+                connection.connect()
+                return connection
+            except OSError:
+                if attempt == self.connect_retries:
+                    raise
+
+    def request(self, method_name, url, data, headers, timeout):
+        scheme, netloc, path, query, _ = urlsplit(url)
+        if query:
+            path = "{path}?{query}".format(path=path, query=query)
+
+        origin = (scheme, netloc)
+        pool = self._pool(origin)
+        semaphore = self._semaphores[origin] if self.pool_block else None
+        body = data.encode('utf-8') if data else None
+        connect_timeout, read_timeout = split_timeout(timeout)
+
+        if semaphore is not None and not semaphore.acquire(timeout=connect_timeout):
+            raise TimeoutError("timed out waiting for a pooled connection to {netloc}".format(netloc=netloc))
+
+        try:
+            try:
+                connection, reused = pool.get_nowait(), True
+            except Empty:
+                connection, reused = self._new_connection(scheme, netloc, connect_timeout), False
+
+            while True:
+                try:
+                    if connection.sock is not None:
+                        connection.sock.settimeout(read_timeout)
+
+                    sent = time.perf_counter()
+                    connection.request(method_name, path or '/', body, headers)
+                    response = connection.getresponse()
+                    elapsed = timedelta(seconds=time.perf_counter() - sent)
+                    content = response.read()
+                    break
+                except (OSError, HTTPException) as e:
+                    connection.close()
+
+                    # only a pooled connection found closed by the server is retried, the request was not processed
+                    if not reused or not isinstance(e, ConnectionError):
+                        raise
+
+                    connection, reused = self._new_connection(scheme, netloc, connect_timeout), False
+
+            if response.will_close:
+                connection.close()
+            else:
+                try:
+                    pool.put_nowait(connection)
+                except Full:
+                    connection.close()
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+        return HTTPClientResponse(response.status, response.msg, content, elapsed)
+
+    def close(self):
+        with self._lock:
+            pools = list(self._pools.values())
+
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except Empty:
+                    break
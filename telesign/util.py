@@ -1,9 +1,10 @@
 from __future__ import unicode_literals
 
-from hmac import HMAC
+from hmac import HMAC, compare_digest
 from base64 import b64decode, b64encode
 from hashlib import sha256
-from random import SystemRandom
+
+from telesign.otp import default_generator
 
 
 def to_utc_rfc3339(a_datetime):
@@ -16,8 +17,10 @@ def to_utc_rfc3339(a_datetime):
 def random_with_n_digits(n):
     """
     Helper function to generate a random number n digits in length using a system random.
+
+    For many codes, use a telesign.otp.OtpGenerator, which hands them out from a pregenerated pool.
     """
-    return "".join(SystemRandom().choice('123456789') for _ in range(n))
+    return default_generator().characters(n)
 
 
 def verify_telesign_callback_signature(api_key, signature, json_str):
@@ -27,16 +30,23 @@ def verify_telesign_callback_signature(api_key, signature, json_str):
     :param api_key: the TeleSign API api_key associated with your account.
     :param signature: the TeleSign Authorization header value supplied in the callback, as a string.
     :param json_str: the POST body text, that is, the JSON string sent by TeleSign describing the transaction status.
-    """
-    your_signature = b64encode(HMAC(b64decode(api_key), json_str.encode("utf-8"), sha256).digest()).decode("utf-8")
 
-    if len(signature) != len(your_signature):
-        return False
+    To verify many callbacks with the same api_key use telesign.callback.CallbackVerifier instead.
+    """
+    your_signature = b64encode(HMAC(b64decode(api_key), json_str.encode("utf-8"), sha256).digest())
 
     # avoid timing attack with constant time equality check
-    signatures_equal = True
-    for x, y in zip(signature, your_signature):
-        if not x == y:
-            signatures_equal = False
+    return compare_digest(your_signature, signature.encode("utf-8"))
+
+
+def lookup_field(document, path):
+    """
+    Helper function to get the value at a dotted path of a decoded JSON document, or None if it is missing.
+    """
+    for key in path.split('.'):
+        if not isinstance(document, dict):
+            return None
+
+        document = document.get(key)
 
-    return signatures_equal
+    return document
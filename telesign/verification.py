@@ -0,0 +1,187 @@
+from __future__ import unicode_literals
+
+import heapq
+import threading
+import time
+from hmac import compare_digest
+
+from telesign.phonenumber import phone_number_key
+
+VERIFIED = 'verified'
+INVALID = 'invalid'
+EXPIRED = 'expired'
+NOT_FOUND = 'not_found'
+TOO_MANY_ATTEMPTS = 'too_many_attempts'
+
+
+class VerificationBackend(object):
+    """
+    The interface of a VerificationStore storage backend. Subclass it to share pending codes between processes in an
+    external service such as Redis, every method must be atomic.
+    """
+
+    def store(self, key, code, ttl, max_attempts):
+        """
+        Stores the code pending for key, replacing any code pending for it, for ttl seconds or max_attempts checks.
+        """
+        raise NotImplementedError
+
+    def check(self, key, code):
+        """
+        Checks code against the code pending for key. The pending code is removed once it is verified.
+
+        :return: VERIFIED, INVALID, EXPIRED, NOT_FOUND or TOO_MANY_ATTEMPTS.
+        """
+        raise NotImplementedError
+
+    def discard(self, key):
+        """
+        Removes the code pending for key, if any.
+        """
+        raise NotImplementedError
+
+
+class _Pending(object):
+    __slots__ = ('code', 'expires', 'attempts', 'max_attempts')
+
+    def __init__(self, code, expires, max_attempts):
+        self.code = code
+        self.expires = expires
+        self.attempts = 0
+        self.max_attempts = max_attempts
+
+
+class MemoryVerificationBackend(VerificationBackend):
+    """
+    A thread-safe in-process VerificationBackend.
+
+    Pending codes are indexed by expiry in a heap, expired codes are evicted in O(log n) each as new codes are stored.
+    Beyond maxsize pending codes, the codes closest to expiry are evicted first, so memory stays bounded.
+
+    :param maxsize: (optional) The maximum number of pending codes, as an int.
+    """
+
+    def __init__(self, maxsize=1000000):
+        self.maxsize = maxsize
+
+        self._pending = {}
+        self._expiries = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def store(self, key, code, ttl, max_attempts):
+        now = time.monotonic()
+        pending = _Pending(code.encode('utf-8'), now + ttl, max_attempts)
+
+        with self._lock:
+            self._evict(now)
+
+            self._pending[key] = pending
+            heapq.heappush(self._expiries, (pending.expires, key))
+
+            # replaced codes leave stale heap items behind, drop them once they outnumber the pending codes
+            if len(self._expiries) > 2 * len(self._pending) + 1024:
+                self._expiries = [(entry.expires, key) for key, entry in self._pending.items()]
+                heapq.heapify(self._expiries)
+
+    def _evict(self, now):
+        expiries = self._expiries
+
+        while expiries and (expiries[0][0] <= now or len(self._pending) >= self.maxsize):
+            expires, key = heapq.heappop(expiries)
+
+            # the item of a replaced code is stale, unless the new code expires at the same time anyway
+            pending = self._pending.get(key)
+            if pending is not None and pending.expires == expires:
+                del self._pending[key]
+
+    def check(self, key, code):
+        code = code.encode('utf-8')
+
+        with self._lock:
+            pending = self._pending.get(key)
+
+            if pending is None:
+                return NOT_FOUND
+
+            if pending.expires <= time.monotonic():
+                del self._pending[key]
+                return EXPIRED
+
+            if pending.attempts >= pending.max_attempts:
+                return TOO_MANY_ATTEMPTS
+
+            pending.attempts += 1
+
+            if compare_digest(pending.code, code):
+                del self._pending[key]
+                return VERIFIED
+
+        return INVALID
+
+    def discard(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
+
+
+class VerificationStore(object):
+    """
+    Keeps the one-time passcodes sent to phone numbers until they are verified, expire or are guessed wrong too often.
+
+    Codes are compared in constant time. A verified code is removed, so it cannot be used twice. After max_attempts
+    wrong codes, any code, including the right one, is refused until the code expires or a new one is sent.
+
+    :param backend: (optional) The VerificationBackend storing pending codes, defaults to a MemoryVerificationBackend.
+    :param ttl: (optional) The number of seconds a code stays valid.
+    :param max_attempts: (optional) The number of codes checked against a pending code before it is refused.
+    """
+
+    def __init__(self, backend=None, ttl=300, max_attempts=3):
+        self.backend = backend if backend is not None else MemoryVerificationBackend()
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+
+    @staticmethod
+    def key(phone_number):
+        """
+        The key codes are stored under for phone_number, in any format, see telesign.phonenumber.phone_number_key.
+        """
+        return phone_number_key(phone_number)
+
+    def add(self, phone_number, code, ttl=None):
+        """
+        Stores a code sent to phone_number, replacing any code pending for it.
+
+        :param ttl: (optional) The number of seconds the code stays valid, defaults to the ttl of the store.
+        """
+        self.backend.store(self.key(phone_number), code, ttl if ttl is not None else self.ttl, self.max_attempts)
+
+    def send(self, client, phone_number, **params):
+        """
+        Sends a new code to phone_number with the send_verification_code method of a MessagingClient or VoiceClient,
+        and stores it.
+
+        :return: The RestClient Response object.
+        """
+        code, response = client.send_verification_code(phone_number, **params)
+
+        if response.ok:
+            self.add(phone_number, code)
+
+        return response
+
+    def verify(self, phone_number, code):
+        """
+        Checks a code entered for phone_number.
+
+        :return: VERIFIED, INVALID, EXPIRED, NOT_FOUND or TOO_MANY_ATTEMPTS.
+        """
+        return self.backend.check(self.key(phone_number), code.strip())
+
+    def discard(self, phone_number):
+        """
+        Removes the code pending for phone_number, if any.
+        """
+        self.backend.discard(self.key(phone_number))
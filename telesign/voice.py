@@ -1,9 +1,11 @@
 from __future__ import unicode_literals
 
+from telesign.otp import default_generator
 from telesign.rest import RestClient
 
 VOICE_RESOURCE = "/v1/voice"
 VOICE_STATUS_RESOURCE = "/v1/voice/{reference_id}"
+VOICE_VERIFICATION_TEMPLATE = "Hello, your code is {spoken_code}. Once again, your code is {spoken_code}. Goodbye."
 
 
 class VoiceClient(RestClient):
@@ -12,21 +14,45 @@ class VoiceClient(RestClient):
     or you can send verification messages containing time-based, one-time passcodes (TOTP).
     """
 
-    def __init__(self, customer_id, api_key, **kwargs):
+    def __init__(self, customer_id, api_key, otp_generator=None, **kwargs):
+        """
+        :param otp_generator: (optional) The telesign.otp.OtpGenerator creating the codes of send_verification_code,
+            defaults to a generator of 5 digit codes shared by all clients.
+        """
         super(VoiceClient, self).__init__(customer_id, api_key, **kwargs)
 
+        self.otp_generator = otp_generator if otp_generator is not None else default_generator()
+
     def call(self, phone_number, message, message_type, **params):
         """
         Send a voice call to the target phone_number.
 
         See https://developer.telesign.com/docs/voice-api for detailed API documentation.
         """
+        phone_number = self.normalize_phone_number(phone_number)
+
         return self.post(VOICE_RESOURCE,
                          phone_number=phone_number,
                          message=message,
                          message_type=message_type,
                          **params)
 
+    def send_verification_code(self, phone_number, template=VOICE_VERIFICATION_TEMPLATE, message_type='OTP',
+                               **params):
+        """
+        Call the target phone_number and read out a new one-time passcode.
+
+        :param phone_number: The phone number to call, as a string.
+        :param template: (optional) The message, formatted with the code as code and with its characters separated by
+            pauses as spoken_code.
+        :param message_type: (optional) The message_type of the call.
+        :return: A (code, response) tuple of the code sent, as a string, and the RestClient Response object.
+        """
+        code = self.otp_generator.generate()
+        message = template.format(code=code, spoken_code=", ".join(code))
+
+        return code, self.call(phone_number, message, message_type, **params)
+
     def status(self, reference_id, **params):
         """
         Retrieves the current status of the voice call.
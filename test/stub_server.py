@@ -0,0 +1,88 @@
+from __future__ import unicode_literals
+
+import json
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class StubRequest(object):
+    """
+    A request received by the StubServer.
+    """
+
+    def __init__(self, method, path, headers, body, client_address=None):
+        self.client_address = client_address
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """
+    A local HTTP server standing in for the TeleSign REST API in tests, it records every request and answers with the
+    status code and JSON body returned by the handler callable.
+
+    :param handler: (optional) Callable taking a StubRequest and returning a (status_code, json_body) tuple.
+    :param drop_connections: (optional) Whether to silently close each connection after responding, as a server
+        timing out idle keep-alive connections would.
+    """
+    daemon_threads = True
+
+    def __init__(self, handler=None, drop_connections=False):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), _StubRequestHandler)
+        self.handler = handler or (lambda request: (200, {'reference_id': 'stub'}))
+        self.drop_connections = drop_connections
+        self.requests = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={'poll_interval': 0.05})
+        self._thread.daemon = True
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{port}".format(port=self.server_address[1])
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        self.server_close()
+
+    def record(self, request):
+        with self._lock:
+            self.requests.append(request)
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request = StubRequest(self.command, self.path, self.headers, self.rfile.read(length).decode('utf-8'),
+                              self.client_address)
+        self.server.record(request)
+
+        status_code, json_body = self.server.handler(request)
+        content = json.dumps(json_body).encode('utf-8')
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+        if self.server.drop_connections:
+            self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,77 @@
+from __future__ import unicode_literals
+
+import asyncio
+from unittest import TestCase
+
+from stub_server import StubServer
+
+from telesign.rest import RestClient
+from telesign.aio.rest import AsyncRestClient
+from telesign.aio.messaging import AsyncMessagingClient
+from telesign.aio.phoneid import AsyncPhoneIdClient
+
+
+class TestAio(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def expected_headers(self, request):
+        return RestClient.generate_telesign_headers(self.customer_id,
+                                                    self.api_key,
+                                                    request.method,
+                                                    request.path,
+                                                    request.body,
+                                                    date_rfc2616=request.headers['Date'],
+                                                    nonce=request.headers['x-ts-nonce'])
+
+    def test_post_is_signed_like_rest_client(self):
+        async def send(url):
+            async with AsyncRestClient(self.customer_id, self.api_key, rest_endpoint=url) as client:
+                return await client.post('/test/resource', test='123_\u03ff_test')
+
+        with StubServer() as server:
+            response = self.run_async(send(server.url))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json, {'reference_id': 'stub'})
+
+        request = server.requests[0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(request.body, 'test=123_%CF%BF_test')
+        self.assertEqual(request.headers['Content-Type'], 'application/x-www-form-urlencoded')
+        self.assertEqual(request.headers['Authorization'], self.expected_headers(request)['Authorization'])
+
+    def test_get_error_response(self):
+        async def send(url):
+            async with AsyncRestClient(self.customer_id, self.api_key, rest_endpoint=url) as client:
+                return await client.get('/test/resource')
+
+        with StubServer(lambda request: (404, {'status': {'code': 404}})) as server:
+            response = self.run_async(send(server.url))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.ok)
+        self.assertEqual(response.json, {'status': {'code': 404}})
+        self.assertEqual(server.requests[0].headers['Authorization'],
+                         self.expected_headers(server.requests[0])['Authorization'])
+
+    def test_concurrent_product_requests(self):
+        async def send(url):
+            async with AsyncMessagingClient(self.customer_id, self.api_key, rest_endpoint=url) as messaging:
+                async with AsyncPhoneIdClient(self.customer_id, self.api_key, rest_endpoint=url) as phoneid:
+                    return await asyncio.gather(
+                        phoneid.phoneid('15555555555'),
+                        *[messaging.message('15555555555', 'hello', 'ARN') for _ in range(20)])
+
+        with StubServer() as server:
+            responses = self.run_async(send(server.url))
+
+        self.assertEqual(len(responses), 21)
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(sorted(set(request.path for request in server.requests)),
+                         ['/v1/messaging', '/v1/phoneid/15555555555'])
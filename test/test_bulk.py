@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import threading
+import time
+from unittest import TestCase
+
+from stub_server import StubServer
+
+from telesign.bulk import imap_bounded
+from telesign.messaging import MessagingClient
+from telesign.phonenumber import PhoneNumberNormalizer
+
+
+class TestBulk(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_imap_bounded_ordered(self):
+        def slow_square(x):
+            time.sleep(0.01 * (5 - x % 5))
+            return x * x
+
+        results = list(imap_bounded(slow_square, range(20), concurrency=4))
+
+        self.assertEqual([result.index for result in results], list(range(20)))
+        self.assertEqual([result.response for result in results], [x * x for x in range(20)])
+
+    def test_imap_bounded_unordered(self):
+        results = list(imap_bounded(lambda x: x, range(20), concurrency=4, ordered=False))
+
+        self.assertEqual(sorted(result.response for result in results), list(range(20)))
+
+    def test_imap_bounded_errors_are_results(self):
+        def fail_on_odd(x):
+            if x % 2:
+                raise ValueError(x)
+            return x
+
+        results = list(imap_bounded(fail_on_odd, range(6), concurrency=2))
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual([result.error is None for result in results], [True, False] * 3)
+        self.assertIsInstance(results[1].error, ValueError)
+
+    def test_imap_bounded_consumes_input_lazily(self):
+        consumed = []
+        running = []
+        max_running = [0]
+        lock = threading.Lock()
+
+        def source():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        def work(x):
+            with lock:
+                running.append(x)
+                max_running[0] = max(max_running[0], len(running))
+            time.sleep(0.001)
+            with lock:
+                running.remove(x)
+            return x
+
+        results = imap_bounded(work, source(), concurrency=3, max_pending=6)
+        for _ in range(10):
+            next(results)
+
+        self.assertLessEqual(len(consumed), 16)
+        self.assertLessEqual(max_running[0], 3)
+        results.close()
+
+    def test_message_bulk(self):
+        def handler(request):
+            if 'phone_number=2' in request.body:
+                return 400, {'status': {'code': 11000}}
+            return 200, {'reference_id': request.body}
+
+        messages = [('1', 'hello', 'ARN'),
+                    ('2', 'hello', 'ARN'),
+                    ('3', 'hello', 'ARN', {'external_id': 'abc'})]
+
+        with StubServer(handler) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+            results = list(client.message_bulk(messages, concurrency=2))
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertEqual([result.item for result in results], messages)
+        self.assertIn('external_id=abc', results[2].response.json['reference_id'])
+
+    def test_imap_bounded_unique_key(self):
+        calls = []
+
+        results = list(imap_bounded(lambda x: calls.append(x) or x, [3, 1, 3, 2, 1], concurrency=2, unique_key=abs))
+
+        self.assertEqual([(result.index, result.response) for result in results], [(0, 3), (1, 1), (3, 2)])
+        self.assertEqual(sorted(calls), [1, 2, 3])
+
+    def test_message_bulk_dedup(self):
+        messages = [('+1 (555) 010-0000', 'hello', 'ARN'),
+                    ('15550100000', 'hello', 'ARN'),
+                    ('001 555 010 0000', 'goodbye', 'ARN')]
+
+        with StubServer() as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+            results = list(client.message_bulk(messages, dedup=True))
+
+        self.assertEqual([result.index for result in results], [0, 2])
+        self.assertEqual(len(server.requests), 2)
+
+    def test_message_bulk_dedup_uses_client_normalizer(self):
+        messages = [('020 7946 0018', 'hello', 'ARN'),
+                    ('+44 20 7946 0018', 'hello', 'ARN')]
+
+        with StubServer() as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                     phone_number_normalizer=PhoneNumberNormalizer('44'))
+            results = list(client.message_bulk(messages, dedup=True))
+
+        self.assertEqual([result.index for result in results], [0])
+        self.assertEqual(len(server.requests), 1)
@@ -0,0 +1,188 @@
+from __future__ import unicode_literals
+
+import threading
+import time
+from unittest import TestCase
+
+from mock import Mock
+
+from stub_server import StubServer
+
+from telesign.cache import MemoryCache, ResponseCache, RequestCoalescer
+from telesign.messaging import MessagingClient
+from telesign.phoneid import PhoneIdClient, PHONEID_RESOURCE
+from telesign.phonenumber import PhoneNumberNormalizer
+from telesign.score import ScoreClient
+from telesign.singleflight import SingleFlight
+
+
+class TestCache(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+        self.api_host = 'https://rest-api.telesign.com'
+
+    def test_memory_cache_ttl(self):
+        cache = MemoryCache()
+
+        cache.set('key', 'value', 0.05)
+        self.assertEqual(cache.get('key'), 'value')
+
+        time.sleep(0.06)
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(len(cache), 0)
+
+    def test_memory_cache_lru_eviction(self):
+        cache = MemoryCache(maxsize=2)
+
+        cache.set('a', 1, 60)
+        cache.set('b', 2, 60)
+        cache.get('a')
+        cache.set('c', 3, 60)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_key_ignores_phone_number_formatting(self):
+        def key(phone_number, params):
+            return ResponseCache.key(self.customer_id, self.api_host, PHONEID_RESOURCE, phone_number, params)
+
+        self.assertEqual(key('+1 (555) 010-0000', {'a': 1, 'b': 2}), key('15550100000', {'b': 2, 'a': 1}))
+        self.assertEqual(key('011 1 555 010 0000', {}), key('15550100000', {}))
+        self.assertNotEqual(key('15550100000', {}), key('15550100000', {'a': 1}))
+
+    def test_fetch_caches_only_ok_responses(self):
+        cache = ResponseCache(ttl=60)
+
+        error = Mock(ok=False)
+        self.assertIs(cache.fetch('key', lambda: error), error)
+        self.assertIsNone(cache.backend.get('key'))
+
+        ok = Mock(ok=True)
+        self.assertIs(cache.fetch('key', lambda: ok), ok)
+        self.assertIs(cache.fetch('key', lambda: self.fail("not cached")), ok)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_single_flight_shares_result_and_error(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def slow():
+            calls.append(1)
+            release.wait()
+            return 'result'
+
+        threads = [threading.Thread(target=lambda: results.append(single_flight.do('key', slow))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        while single_flight.in_flight() == 0:
+            time.sleep(0.001)
+        time.sleep(0.02)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['result'] * 8)
+
+        def fail():
+            raise ValueError()
+
+        self.assertRaises(ValueError, single_flight.do, 'key', fail)
+        self.assertEqual(single_flight.in_flight(), 0)
+
+    def test_phoneid_and_score_clients_use_cache(self):
+        with StubServer() as server:
+            cache = ResponseCache(ttl=60)
+            phoneid = PhoneIdClient(self.customer_id, self.api_key, rest_endpoint=server.url, cache=cache)
+            score = ScoreClient(self.customer_id, self.api_key, rest_endpoint=server.url, cache=cache)
+
+            for _ in range(3):
+                self.assertTrue(phoneid.phoneid('15555555555').ok)
+                self.assertTrue(score.score('15555555555', 'create').ok)
+            score.score('15555555555', 'sign-in')
+
+        self.assertEqual([request.path for request in server.requests],
+                         ['/v1/phoneid/15555555555', '/v1/score/15555555555', '/v1/score/15555555555'])
+        self.assertEqual(server.requests[1].body, 'account_lifecycle_event=create')
+
+    def test_key_includes_customer_id(self):
+        other_customer_id = "AAAAAAAA-BBBB-CCCC-1234-AB1234567890"
+
+        self.assertNotEqual(ResponseCache.key(self.customer_id, self.api_host, PHONEID_RESOURCE, '15550100000', {}),
+                            ResponseCache.key(other_customer_id, self.api_host, PHONEID_RESOURCE, '15550100000', {}))
+
+        with StubServer() as server:
+            cache = ResponseCache(ttl=60)
+            for customer_id in (self.customer_id, other_customer_id, self.customer_id):
+                PhoneIdClient(customer_id, self.api_key, rest_endpoint=server.url, cache=cache).phoneid('15550100000')
+
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_key_includes_endpoint(self):
+        self.assertNotEqual(ResponseCache.key(self.customer_id, self.api_host, PHONEID_RESOURCE, '15550100000', {}),
+                            ResponseCache.key(self.customer_id, 'https://rest-ww.telesign.com', PHONEID_RESOURCE,
+                                              '15550100000', {}))
+
+        cache = ResponseCache(ttl=60)
+        with StubServer() as server, StubServer() as other_server:
+            for url in (server.url, other_server.url, server.url):
+                PhoneIdClient(self.customer_id, self.api_key, rest_endpoint=url, cache=cache).phoneid('15550100000')
+
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(len(other_server.requests), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_cache_key_uses_client_normalizer(self):
+        with StubServer() as server:
+            phoneid = PhoneIdClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                    cache=ResponseCache(ttl=60), phone_number_normalizer=PhoneNumberNormalizer('44'))
+
+            phoneid.phoneid('020 7946 0018')
+            phoneid.phoneid('+44 20 7946 0018')
+
+        self.assertEqual([request.path for request in server.requests], ['/v1/phoneid/442079460018'])
+
+    def test_coalescer_shares_concurrent_status_polls(self):
+        def slow_handler(request):
+            time.sleep(0.1)
+            return 200, {'status': {'code': 200}}
+
+        with StubServer(slow_handler) as server:
+            coalescer = RequestCoalescer()
+            clients = [MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url, coalescer=coalescer)
+                       for _ in range(2)]
+            responses = []
+
+            threads = [threading.Thread(target=lambda i=i: responses.append(clients[i % 2].status('reference_id')))
+                       for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            clients[0].status('other_reference_id')
+            clients[0].status('reference_id')
+
+        self.assertEqual(len(responses), 8)
+        self.assertEqual(len(set(id(response) for response in responses)), 1)
+        self.assertEqual([request.path for request in server.requests],
+                         ['/v1/messaging/reference_id', '/v1/messaging/other_reference_id',
+                          '/v1/messaging/reference_id'])
+
+    def test_coalescer_freshness_window(self):
+        with StubServer() as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                     coalescer=RequestCoalescer(freshness=0.1))
+
+            first = client.status('reference_id')
+            self.assertIs(client.status('reference_id'), first)
+
+            time.sleep(0.11)
+            self.assertIsNot(client.status('reference_id'), first)
+
+        self.assertEqual(len(server.requests), 2)
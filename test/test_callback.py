@@ -0,0 +1,69 @@
+from __future__ import unicode_literals
+
+import json
+from unittest import TestCase
+
+from telesign.callback import CallbackVerifier, DeliveryReport, parse_delivery_report
+from telesign.util import verify_telesign_callback_signature
+
+
+class TestCallback(TestCase):
+    def setUp(self):
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+        self.signature = "B97g3N9lPdVaptvifxRau7bzVAC5hhRBZ6HKXABN744="
+        self.json_str = "{'test': 123}"
+
+        self.report = {'reference_id': 'B56A497AD2D0128C9045C7A52AB1DDEA',
+                       'status': {'code': 200,
+                                  'description': 'Delivered to handset',
+                                  'updated_on': '2017-04-25T19:02:51.000000Z'},
+                       'submit_timestamp': '2017-04-25T19:02:50.000000Z',
+                       'sub_resource': 'sms',
+                       'errors': []}
+
+    def test_verify(self):
+        verifier = CallbackVerifier(self.api_key)
+
+        self.assertTrue(verifier.verify(self.signature, self.json_str))
+        self.assertTrue(verifier.verify(self.signature.encode('utf-8'), self.json_str.encode('utf-8')))
+        self.assertFalse(verifier.verify("BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB=", self.json_str))
+        self.assertFalse(verifier.verify(self.signature[:-1], self.json_str))
+        self.assertFalse(verifier.verify('\u03ff', self.json_str))
+
+    def test_verify_matches_util(self):
+        verifier = CallbackVerifier(self.api_key)
+        body = json.dumps(self.report)
+        signature = verifier.signature(body).decode('utf-8')
+
+        self.assertTrue(verify_telesign_callback_signature(self.api_key, signature, body))
+        self.assertFalse(verify_telesign_callback_signature(self.api_key, signature[:-1], body))
+
+    def test_verify_many(self):
+        verifier = CallbackVerifier(self.api_key)
+
+        self.assertEqual(verifier.verify_many([(self.signature, self.json_str),
+                                               ("BBBB", self.json_str),
+                                               (self.signature, self.json_str.encode('utf-8'))]),
+                         [True, False, True])
+
+    def test_parse(self):
+        verifier = CallbackVerifier(self.api_key)
+        body = json.dumps(self.report).encode('utf-8')
+
+        report = verifier.parse(verifier.signature(body), body)
+
+        self.assertEqual(report, DeliveryReport(reference_id='B56A497AD2D0128C9045C7A52AB1DDEA',
+                                                status_code=200,
+                                                status_description='Delivered to handset',
+                                                updated_on='2017-04-25T19:02:51.000000Z',
+                                                submit_timestamp='2017-04-25T19:02:50.000000Z',
+                                                sub_resource='sms',
+                                                errors=()))
+        self.assertIsNone(verifier.parse(self.signature, body))
+
+    def test_parse_delivery_report_missing_fields(self):
+        report = parse_delivery_report('{"reference_id": "abc"}')
+
+        self.assertEqual(report.reference_id, 'abc')
+        self.assertIsNone(report.status_code)
+        self.assertEqual(report.errors, ())
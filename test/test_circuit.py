@@ -0,0 +1,115 @@
+from __future__ import unicode_literals
+
+import time
+from unittest import TestCase
+
+from mock import patch
+
+from stub_server import StubServer
+
+from telesign.circuit import CircuitBreaker, CircuitOpenError, EndpointPool, CLOSED, OPEN, HALF_OPEN
+from telesign.rest import RestClient
+from telesign.retry import RetryPolicy
+
+
+class TestCircuit(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_breaker_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4, reset_timeout=60)
+
+        for success in (True, False, True):
+            breaker.record(success, 0.01)
+        self.assertEqual(breaker.state, CLOSED)
+
+        breaker.record(False, 0.01)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+
+    def test_breaker_opens_on_slow_calls(self):
+        breaker = CircuitBreaker(slow_call_seconds=0.1, slow_call_rate_threshold=0.5, minimum_calls=2)
+
+        breaker.record(True, 0.2)
+        breaker.record(True, 0.2)
+
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_breaker_half_open_trial(self):
+        breaker = CircuitBreaker(minimum_calls=1, reset_timeout=0.02)
+        breaker.record(False, 0.01)
+        self.assertFalse(breaker.allow())
+
+        time.sleep(0.03)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow(), "only one trial call is allowed")
+
+        breaker.record(False, 0.01)
+        self.assertEqual(breaker.state, OPEN)
+
+        time.sleep(0.03)
+        self.assertTrue(breaker.allow())
+        breaker.record(True, 0.01)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+
+    def test_breaker_release_trial(self):
+        breaker = CircuitBreaker(minimum_calls=1, reset_timeout=0.02)
+        breaker.record(False, 0.01)
+        time.sleep(0.03)
+
+        self.assertTrue(breaker.allow())
+        breaker.release()
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+    def test_pool_latency_selection(self):
+        pool = EndpointPool(['https://a', 'https://b'])
+
+        first = pool.select()
+        pool.record(first, True, 0.5)
+        second = pool.select()
+        pool.record(second, True, 0.1)
+
+        self.assertNotEqual(first.url, second.url)
+        self.assertEqual(pool.select().url, second.url)
+
+    def test_pool_all_open(self):
+        pool = EndpointPool(['https://a'], minimum_calls=1, reset_timeout=60)
+        pool.record(pool.select(), False, 0.01)
+
+        self.assertRaises(CircuitOpenError, pool.select)
+
+    @patch('telesign.retry.RetryPolicy.sleep')
+    def test_client_fails_over(self, mock_sleep):
+        with StubServer(lambda request: (503, {})) as failing, StubServer() as healthy:
+            client = RestClient(self.customer_id, self.api_key,
+                                rest_endpoint=EndpointPool([failing.url, healthy.url], strategy='priority',
+                                                           minimum_calls=2, reset_timeout=60))
+
+            responses = [client.get('/v1/messaging/reference_id') for _ in range(4)]
+
+        self.assertEqual(client.api_host, failing.url)
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(len(failing.requests), 2)
+        self.assertEqual(len(healthy.requests), 4)
+
+    def test_client_fails_fast_when_open(self):
+        with StubServer() as server:
+            url = server.url
+
+        client = RestClient(self.customer_id, self.api_key, retry_policy=RetryPolicy.disabled(),
+                            rest_endpoint=EndpointPool([url], minimum_calls=2, reset_timeout=60))
+
+        for _ in range(2):
+            self.assertRaises(IOError, client.get, '/v1/messaging/reference_id')
+
+        self.assertRaises(CircuitOpenError, client.get, '/v1/messaging/reference_id')
+
+    def test_client_accepts_endpoint_list(self):
+        client = RestClient(self.customer_id, self.api_key, rest_endpoint=['https://a', 'https://b'])
+
+        self.assertEqual([endpoint.url for endpoint in client.endpoints.endpoints], ['https://a', 'https://b'])
+        self.assertEqual(client.api_host, 'https://a')
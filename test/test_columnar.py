@@ -0,0 +1,130 @@
+from __future__ import unicode_literals
+
+import io
+import os
+import pathlib
+import shutil
+import tempfile
+from unittest import TestCase, skipUnless
+
+import mock
+
+from telesign.columnar import Column, ResultAccumulator, CATEGORY, FLOAT, INT
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class TestColumnar(TestCase):
+    def setUp(self):
+        self.phoneid = {'status': {'code': 300, 'description': 'Transaction successfully completed'},
+                        'phone_type': {'code': '2', 'description': 'MOBILE'},
+                        'carrier': {'name': 'Carrier A'}}
+        self.score = {'status': {'code': 300}, 'risk': {'level': 'low', 'score': 12, 'recommendation': 'allow'}}
+        self.error = {'status': {'code': 11000, 'description': 'Invalid value'}}
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def accumulator(self):
+        accumulator = ResultAccumulator()
+        accumulator.add('15550100001', self.phoneid)
+        accumulator.add('15550100002', mock.Mock(json=self.score))
+        accumulator.add('15550100003', self.error)
+
+        return accumulator
+
+    def test_rows(self):
+        accumulator = self.accumulator()
+
+        self.assertEqual(len(accumulator), 3)
+        self.assertEqual(accumulator.names, ['phone_number', 'status_code', 'phone_type', 'carrier', 'risk_level',
+                                             'risk_score'])
+        self.assertEqual(list(accumulator.rows()),
+                         [('15550100001', 300, 'MOBILE', 'Carrier A', None, None),
+                          ('15550100002', 300, None, None, 'low', 12),
+                          ('15550100003', 11000, None, None, None, None)])
+
+    def test_columns_are_compact(self):
+        accumulator = ResultAccumulator()
+        for i in range(1000):
+            accumulator.add('1555010{i:04}'.format(i=i), self.phoneid)
+
+        carrier = accumulator.column('carrier')
+        self.assertEqual(carrier.categories, ['Carrier A'])
+        self.assertEqual(carrier.values.itemsize, 4)
+        self.assertEqual(accumulator.column('status_code').values.itemsize, 8)
+
+    def test_invalid_values_are_missing(self):
+        accumulator = ResultAccumulator([Column('score', 'risk.score', INT), Column('ratio', 'risk.ratio', FLOAT)],
+                                        phone_column=None)
+        accumulator.add('15550100001', {'risk': {'score': 'high', 'ratio': '0.5'}})
+        accumulator.add('15550100002', {'risk': {'score': '7', 'ratio': None}})
+
+        self.assertEqual(list(accumulator.rows()), [(None, 0.5), (7, None)])
+
+    def test_int_overflow_is_missing(self):
+        accumulator = ResultAccumulator([Column('score', 'risk.score', INT)])
+        accumulator.extend([('15550100001', {'risk': {'score': 2 ** 63}}),
+                            ('15550100002', {'risk': {'score': -2 ** 70}}),
+                            ('15550100003', {'risk': {'score': 2 ** 63 - 1}})])
+
+        self.assertEqual(list(accumulator.rows()), [('15550100001', None), ('15550100002', None),
+                                                    ('15550100003', 2 ** 63 - 1)])
+
+    def test_enriched_rows(self):
+        accumulator = ResultAccumulator([Column('carrier', 'phoneid.carrier.name', CATEGORY),
+                                         Column('risk_level', 'score.risk.level', CATEGORY)])
+        accumulator.add_row({'phone_number': '15550100001', 'phoneid': self.phoneid, 'score': self.score})
+
+        self.assertEqual(list(accumulator.rows()), [('15550100001', 'Carrier A', 'low')])
+
+    def test_duplicate_column_names(self):
+        with self.assertRaises(ValueError):
+            ResultAccumulator([Column('phone_number', 'phone_number')])
+
+    def test_to_csv(self):
+        output = io.StringIO()
+        self.accumulator().to_csv(output)
+
+        self.assertEqual(output.getvalue(),
+                         'phone_number,status_code,phone_type,carrier,risk_level,risk_score\n'
+                         '15550100001,300,MOBILE,Carrier A,,\n'
+                         '15550100002,300,,,low,12\n'
+                         '15550100003,11000,,,,\n')
+
+    def test_to_csv_path(self):
+        path = pathlib.Path(self.directory) / 'results.csv'
+        self.accumulator().to_csv(path)
+
+        with io.open(str(path), encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 4)
+
+    @skipUnless(pyarrow, "pyarrow is not installed")
+    def test_to_arrow(self):
+        accumulator = self.accumulator()
+        table = accumulator.to_arrow()
+
+        self.assertEqual(table.column_names, accumulator.names)
+        self.assertEqual(table.to_pylist()[1], {'phone_number': '15550100002', 'status_code': 300, 'phone_type': None,
+                                                'carrier': None, 'risk_level': 'low', 'risk_score': 12})
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('carrier').type))
+        self.assertEqual(table.column('risk_score').null_count, 2)
+
+        # the arrays remain growable once exported
+        accumulator.add('15550100004', self.score)
+        self.assertEqual(len(accumulator), 4)
+
+    @skipUnless(pyarrow, "pyarrow is not installed")
+    def test_to_parquet(self):
+        accumulator = self.accumulator()
+        path = os.path.join(self.directory, 'results.parquet')
+
+        accumulator.to_parquet(path)
+
+        self.assertEqual(pyarrow.parquet.read_table(path).to_pylist(), accumulator.to_arrow().to_pylist())
@@ -0,0 +1,135 @@
+from __future__ import unicode_literals
+
+import time
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from stub_server import StubServer
+
+from telesign.circuit import EndpointPool, HALF_OPEN
+from telesign.deadline import Deadline, DeadlineExceeded
+from telesign.phoneid import PhoneIdClient
+from telesign.ratelimit import RateLimiter, TokenBucket
+from telesign.rest import RestClient
+from telesign.retry import RetryPolicy
+from telesign.transport import HTTPClientTransport
+
+
+class TestDeadline(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_bound(self):
+        deadline = Deadline(5)
+
+        self.assertTrue(4 < deadline.bound(10) <= 5)
+        self.assertEqual(deadline.bound(1), 1)
+        self.assertEqual(deadline.bound((1, 2)), (1, 2))
+        self.assertTrue(4 < deadline.bound((1, 10))[1] <= 5)
+        self.assertIs(Deadline.coerce(deadline), deadline)
+        self.assertIsNone(Deadline.coerce(None))
+
+        self.assertRaises(DeadlineExceeded, Deadline(-1).bound, 10)
+
+    def test_connect_and_read_timeouts(self):
+        client = RestClient(self.customer_id, self.api_key, timeout=10, read_timeout=30)
+        self.assertEqual(client.timeout, (10, 30))
+
+        client = RestClient(self.customer_id, self.api_key, connect_timeout=2, read_timeout=30)
+        self.assertEqual(client.timeout, (2, 30))
+
+        self.assertEqual(RestClient(self.customer_id, self.api_key, timeout=5).timeout, 5)
+
+    def test_expired_request_is_not_sent(self):
+        with StubServer() as server:
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+
+            self.assertRaises(DeadlineExceeded, client.post, '/v1/resource', deadline=Deadline(-1), test=123)
+
+            self.assertEqual(server.requests, [])
+
+    def test_expired_request_releases_half_open_trial(self):
+        with StubServer() as server:
+            pool = EndpointPool([server.url], minimum_calls=1, reset_timeout=0.02)
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=pool)
+
+            pool.record(pool.endpoints[0], False, 0.01)
+            time.sleep(0.03)
+
+            self.assertRaises(DeadlineExceeded, client.get, '/v1/resource', deadline=Deadline(-1))
+            self.assertEqual(pool.endpoints[0].breaker.state, HALF_OPEN)
+
+            self.assertTrue(client.get('/v1/resource').ok)
+            self.assertEqual(len(server.requests), 1)
+
+    def test_timeout_bounded_by_deadline(self):
+        client = RestClient(self.customer_id, self.api_key, connect_timeout=2, read_timeout=30)
+        client.transport = Mock(retryable_errors=())
+        client.transport.request.return_value = Mock(status_code=200, headers={}, ok=True, content=b'{}')
+
+        client.get('/v1/resource', deadline=5)
+
+        connect_timeout, read_timeout = client.transport.request.call_args[0][4]
+        self.assertEqual(connect_timeout, 2)
+        self.assertTrue(4 < read_timeout <= 5)
+
+    def test_deadline_not_part_of_params(self):
+        with StubServer() as server:
+            client = PhoneIdClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+
+            client.phoneid('+1 555 0100', deadline=5, account_lifecycle_event='create')
+
+            self.assertEqual(server.requests[0].body, 'account_lifecycle_event=create')
+
+    @patch('telesign.retry.RetryPolicy.sleep')
+    def test_no_retry_past_deadline(self, mock_sleep):
+        def handler(request):
+            return 503, {'status': {'code': 503}, 'errors': []}
+
+        with StubServer(handler) as server:
+            policy = RetryPolicy(max_attempts=5, backoff_factor=10, max_backoff=10)
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url, retry_policy=policy)
+
+            with patch.object(policy, 'next_delay', return_value=10):
+                response = client.get('/v1/resource', deadline=2)
+
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(len(server.requests), 1)
+            mock_sleep.assert_not_called()
+
+    def test_rate_limit_wait_counts_towards_deadline(self):
+        with StubServer() as server:
+            rate_limiter = RateLimiter({'/v1/': 10}, default=None)
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url, rate_limiter=rate_limiter)
+
+            deadline = Deadline(0.05)
+            time.sleep(0.1)
+
+            self.assertRaises(DeadlineExceeded, client.get, '/v1/resource', deadline=deadline)
+            self.assertEqual(rate_limiter.stats()['/v1/']['acquired'], 0)
+
+    @patch('time.sleep')
+    def test_rate_limit_wait_longer_than_deadline(self, mock_sleep):
+        with StubServer() as server:
+            rate_limiter = RateLimiter({'/v1/': TokenBucket(1, capacity=1)}, default=None)
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url, rate_limiter=rate_limiter)
+
+            self.assertTrue(client.get('/v1/resource', deadline=5).ok)
+            self.assertRaises(DeadlineExceeded, client.get, '/v1/resource', deadline=0.1)
+
+            mock_sleep.assert_not_called()
+            self.assertEqual(len(server.requests), 1)
+
+            # the token was not taken, it is still available once it is refilled
+            self.assertEqual(rate_limiter.stats()['/v1/']['acquired'], 1)
+
+    def test_http_client_transport_pool_wait(self):
+        transport = HTTPClientTransport(pool_maxsize=1, pool_block=True)
+        semaphore = transport._semaphores.setdefault(('http', 'localhost:1'), Mock())
+        transport._pools[('http', 'localhost:1')] = Mock()
+        semaphore.acquire.return_value = False
+
+        self.assertRaises(TimeoutError, transport.request, 'GET', 'http://localhost:1/', '', {}, (0.01, 1))
+        semaphore.acquire.assert_called_once_with(timeout=0.01)
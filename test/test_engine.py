@@ -0,0 +1,61 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from stub_server import StubServer
+
+from telesign.engine import ProcessEngine
+
+
+class TestEngine(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_imap_mixed_jobs(self):
+        jobs = [('message', ('+1555000{i:04d}'.format(i=i), 'Your code is {i}'.format(i=i), 'OTP')) for i in range(40)]
+        jobs.append(('phoneid', ('+15550001234',), {'account_lifecycle_event': 'create'}))
+        jobs.append(('unknown', ()))
+
+        with StubServer() as server:
+            with ProcessEngine(self.customer_id, self.api_key, processes=2, threads=4, chunk_size=8,
+                               rest_endpoint=server.url) as engine:
+                results = list(engine.imap(jobs))
+
+        self.assertEqual([result.index for result in results], list(range(len(jobs))))
+        self.assertTrue(all(result.ok for result in results[:-1]))
+        self.assertEqual(results[0].response.json, {'reference_id': 'stub'})
+        self.assertIsInstance(results[-1].error, KeyError)
+
+        self.assertEqual(len(server.requests), 41)
+        self.assertIn('/v1/phoneid/+15550001234', [request.path for request in server.requests])
+
+    def test_imap_unordered(self):
+        jobs = [('call', ('+1555000{i:04d}'.format(i=i), 'Hello', 'ARN')) for i in range(20)]
+
+        with StubServer() as server:
+            with ProcessEngine(self.customer_id, self.api_key, processes=2, threads=2, chunk_size=4,
+                               rest_endpoint=server.url) as engine:
+                results = list(engine.imap(jobs, ordered=False))
+
+        self.assertEqual(sorted(result.index for result in results), list(range(20)))
+        self.assertTrue(all(result.ok for result in results))
+
+    def test_imap_backpressure(self):
+        consumed = []
+
+        def jobs():
+            for i in range(1000):
+                consumed.append(i)
+                yield 'message', ('+1555000{i:04d}'.format(i=i), 'Hello', 'ARN')
+
+        with StubServer() as server:
+            with ProcessEngine(self.customer_id, self.api_key, processes=1, threads=2, chunk_size=4, max_pending=2,
+                               rest_endpoint=server.url) as engine:
+                results = engine.imap(jobs())
+                next(results)
+
+                # the chunk being yielded, plus at most max_pending chunks in flight, plus the one being read
+                self.assertLessEqual(len(consumed), 4 * 4)
+
+                results.close()
@@ -0,0 +1,133 @@
+from __future__ import unicode_literals
+
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from stub_server import StubServer
+
+from telesign.enrich import Enricher, enrich_file, lookup_rate_limiter, main
+from telesign.phoneid import PhoneIdClient
+from telesign.score import ScoreClient
+
+
+class TestEnrich(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def handler(request):
+        if request.path.startswith('/v1/phoneid/'):
+            if request.path.endswith('0002'):
+                return 400, {'status': {'code': 11000, 'description': 'Invalid value'}}
+            return 200, {'status': {'code': 300, 'description': 'Transaction successfully completed'},
+                         'carrier': {'name': 'Carrier ' + request.path[-4:]}}
+        return 200, {'status': {'code': 300}, 'risk': {'level': 'low', 'score': 1}}
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def write_csv(self, name, rows):
+        with io.open(self.path(name), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'phone_number'])
+            writer.writerows(rows)
+
+    def enricher(self, server, **kwargs):
+        return Enricher(PhoneIdClient(self.customer_id, self.api_key, rest_endpoint=server.url),
+                        ScoreClient(self.customer_id, self.api_key, rest_endpoint=server.url),
+                        **kwargs)
+
+    def test_operations_require_clients(self):
+        phoneid = PhoneIdClient(self.customer_id, self.api_key)
+
+        self.assertEqual(Enricher(phoneid_client=phoneid).operations, ('phoneid',))
+        self.assertRaises(ValueError, Enricher, phoneid_client=phoneid, operations=('phoneid', 'score'))
+        self.assertRaises(ValueError, Enricher, phoneid_client=phoneid, operations=('carrier',))
+
+    def test_rate_is_shared_by_operations(self):
+        rate_limiter = lookup_rate_limiter(10)
+
+        self.assertIs(rate_limiter.bucket_for('/v1/phoneid/15550100000'),
+                      rate_limiter.bucket_for('/v1/score/15550100000'))
+        self.assertEqual(rate_limiter.bucket_for('/v1/score/15550100000').rate, 10)
+
+    def test_enrich_csv(self):
+        self.write_csv('in.csv', [['Ann', '1555010{i:04d}'.format(i=i)] for i in range(5)])
+
+        with StubServer(self.handler) as server:
+            enriched = enrich_file(self.enricher(server, operations=('phoneid', 'score'), concurrency=2),
+                                   self.path('in.csv'), self.path('out.csv'), checkpoint_every=2)
+
+        with io.open(self.path('out.csv'), encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(enriched, 5)
+        self.assertEqual([row['phone_number'] for row in rows], ['1555010{i:04d}'.format(i=i) for i in range(5)])
+        self.assertEqual(rows[0]['phoneid.carrier.name'], 'Carrier 0000')
+        self.assertEqual(rows[0]['score.risk.level'], 'low')
+        self.assertEqual(rows[0]['phoneid.error'], '')
+        self.assertEqual(rows[2]['phoneid.error'], 'HTTP 400')
+        self.assertEqual(len(server.requests), 10)
+        self.assertFalse(os.path.exists(self.path('out.csv.checkpoint')))
+
+    def test_resume(self):
+        self.write_csv('in.csv', [['Ann', '1555010{i:04d}'.format(i=i)] for i in range(7)])
+
+        with StubServer(self.handler) as server:
+            enricher = self.enricher(server, concurrency=1)
+            original = enricher.enrich_row
+
+            def crash_on_fifth(row):
+                if row['phone_number'].endswith('0004'):
+                    raise KeyboardInterrupt
+                return original(row)
+
+            enricher.enrich_row = crash_on_fifth
+
+            self.assertRaises(KeyboardInterrupt, enrich_file, enricher, self.path('in.csv'), self.path('out.csv'),
+                              checkpoint_every=3)
+            self.assertTrue(os.path.exists(self.path('out.csv.checkpoint')))
+
+            enricher.enrich_row = original
+            enriched = enrich_file(enricher, self.path('in.csv'), self.path('out.csv'), checkpoint_every=3)
+
+        with io.open(self.path('out.csv'), encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(enriched, 4)
+        self.assertEqual([row['phone_number'] for row in rows], ['1555010{i:04d}'.format(i=i) for i in range(7)])
+
+        # rows up to the checkpoint are not looked up again
+        paths = [request.path for request in server.requests]
+        self.assertEqual([paths.count('/v1/phoneid/1555010{i:04d}'.format(i=i)) for i in range(3)], [1, 1, 1])
+        self.assertEqual(paths.count('/v1/phoneid/15550100006'), 1)
+
+    def test_cli_jsonl(self):
+        with io.open(self.path('in.jsonl'), 'w', encoding='utf-8') as f:
+            for i in range(3):
+                f.write(json.dumps({'mobile': '+1 555 010 {i:04d}'.format(i=i)}) + '\n')
+            f.write(json.dumps({'mobile': 'not a number'}) + '\n')
+
+        with StubServer(self.handler) as server:
+            main([self.path('in.jsonl'), self.path('out.jsonl'), '--phone-column', 'mobile',
+                  '--customer-id', self.customer_id, '--api-key', self.api_key, '--rest-endpoint', server.url])
+
+        with io.open(self.path('out.jsonl'), encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1]['phoneid']['carrier']['name'], 'Carrier 0001')
+        self.assertIn('/v1/phoneid/15550100000', [request.path for request in server.requests])
+        self.assertTrue(rows[3]['phoneid.error'].startswith('InvalidPhoneNumber'))
+        self.assertEqual(len(server.requests), 3)
@@ -0,0 +1,47 @@
+from __future__ import unicode_literals
+
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+IMPORT_BENCHMARK = """
+import json, sys, time
+
+import requests
+
+started = time.perf_counter()
+import telesign.messaging, telesign.voice, telesign.phoneid, telesign.score, telesign.appverify
+elapsed = time.perf_counter() - started
+
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+
+class TestImport(TestCase):
+    """
+    Guards against import time regressions, each measurement runs in a fresh interpreter. The time measured excludes
+    importing requests itself, which is outside of the SDK's control.
+    """
+
+    def import_benchmark(self):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_BENCHMARK])
+        return json.loads(output.decode('utf-8'))
+
+    def test_import_does_not_load_pkg_resources(self):
+        result = self.import_benchmark()
+
+        self.assertNotIn('pkg_resources', result['modules'])
+
+    def test_import_time(self):
+        elapsed = min(self.import_benchmark()['elapsed'] for _ in range(3))
+
+        self.assertLess(elapsed, 0.15, "importing the product clients took {0:.3f}s".format(elapsed))
+
+    def test_version(self):
+        import telesign
+        from telesign.rest import RestClient
+
+        self.assertRegex(telesign.__version__, r'^\d+\.\d+\.\d+')
+        self.assertTrue(RestClient.user_agent.startswith("TeleSignSDK/python-{0} ".format(telesign.__version__)))
+        self.assertIn("Requests/", RestClient.user_agent)
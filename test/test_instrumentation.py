@@ -0,0 +1,127 @@
+from __future__ import unicode_literals
+
+import time
+from unittest import TestCase, skipUnless
+
+import requests
+from mock import Mock, patch
+
+from stub_server import StubServer
+
+from telesign.instrumentation import (HookInstrument, MetricsCollector, OpenTelemetryInstrument, PrometheusInstrument,
+                                      resource_label)
+from telesign.messaging import MessagingClient
+from telesign.rest import RestClient
+from telesign.retry import RetryPolicy
+from telesign.transport import HTTPClientTransport
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_resource_label(self):
+        self.assertEqual(resource_label('/v1/messaging'), '/v1/messaging')
+        self.assertEqual(resource_label('/v1/messaging/0123456789ABCDEF'), '/v1/messaging')
+        self.assertEqual(resource_label('/v1/phoneid/15555555555'), '/v1/phoneid')
+
+    def test_hooks_and_timings(self):
+        before = Mock()
+        contexts = []
+
+        for transport in (None, HTTPClientTransport()):
+            with StubServer() as server:
+                client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url, transport=transport,
+                                         instruments=[HookInstrument(before=before, after=contexts.append)])
+                client.status('0123456789ABCDEF')
+
+        self.assertEqual(before.call_count, 2)
+        for context in contexts:
+            self.assertEqual(context.method_name, 'GET')
+            self.assertEqual(context.label, '/v1/messaging')
+            self.assertEqual(context.status_code, 200)
+            self.assertEqual(context.attempts, 1)
+            self.assertGreater(context.timings['sign'], 0)
+            self.assertGreater(context.timings['transport'], 0)
+            self.assertGreater(context.timings['server'], 0)
+            self.assertLessEqual(context.timings['server'], context.timings['transport'])
+            self.assertGreaterEqual(context.elapsed, sum(context.timings.values()) - context.timings['server'])
+
+    @patch('telesign.retry.RetryPolicy.sleep', side_effect=lambda seconds: time.sleep(0.001))
+    def test_metrics_collector(self, mock_sleep):
+        def handler(request):
+            return (503, {}) if len(server.requests) == 1 else (200, {})
+
+        metrics = MetricsCollector()
+
+        with StubServer(handler) as server:
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url, instruments=[metrics])
+            client.get('/v1/voice/0123456789ABCDEF')
+            client.post('/v1/voice')
+
+        client.session.get = Mock(side_effect=requests.ConnectionError())
+        client.retry_policy = RetryPolicy.disabled()
+        self.assertRaises(requests.ConnectionError, client.get, '/v1/voice/0123456789ABCDEF')
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['requests'], {('/v1/voice', 200): 2})
+        self.assertEqual(snapshot['errors'], {('/v1/voice', 'ConnectionError'): 1})
+        self.assertGreater(snapshot['timings']['/v1/voice']['backoff'], 0)
+        self.assertGreater(snapshot['timings']['/v1/voice']['total'], 0)
+
+    @patch('telesign.auth.RequestSigner.headers', return_value={})
+    @patch('telesign.rest.RequestContext')
+    def test_no_context_without_instruments(self, mock_context, mock_headers):
+        client = RestClient(self.customer_id, self.api_key)
+        client.session.post = Mock()
+
+        client.post('/v1/resource')
+
+        self.assertEqual(mock_context.call_count, 0)
+
+    @skipUnless(prometheus_client, "prometheus_client is not installed")
+    def test_prometheus_instrument(self):
+        registry = prometheus_client.CollectorRegistry()
+
+        with StubServer() as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                     instruments=[PrometheusInstrument(registry=registry)])
+            client.message('15555555555', 'hello', 'ARN')
+
+        self.assertEqual(registry.get_sample_value('telesign_requests_total', {'method': 'POST',
+                                                                               'resource': '/v1/messaging',
+                                                                               'status_code': '200'}), 1)
+        self.assertEqual(registry.get_sample_value('telesign_request_phase_duration_seconds_count',
+                                                   {'resource': '/v1/messaging', 'phase': 'transport'}), 1)
+
+    @skipUnless(TracerProvider, "opentelemetry-sdk is not installed")
+    def test_opentelemetry_instrument(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        with StubServer(lambda request: (502, {})) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                     retry_policy=RetryPolicy.disabled(),
+                                     instruments=[OpenTelemetryInstrument(tracer=provider.get_tracer('test'))])
+            client.status('0123456789ABCDEF')
+
+        span, = exporter.get_finished_spans()
+        self.assertEqual(span.name, 'TeleSign GET /v1/messaging')
+        self.assertEqual(span.attributes['http.status_code'], 502)
+        self.assertEqual(span.attributes['telesign.resource'], '/v1/messaging/0123456789ABCDEF')
+        self.assertGreater(span.attributes['telesign.transport_seconds'], 0)
+        self.assertFalse(span.status.is_ok)
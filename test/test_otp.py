@@ -0,0 +1,127 @@
+from __future__ import unicode_literals
+
+import os
+import threading
+from collections import Counter, deque
+from unittest import TestCase, skipUnless
+
+from mock import patch
+
+from telesign.messaging import MessagingClient
+from telesign.otp import OtpGenerator
+from telesign.voice import VoiceClient
+
+
+class TestOtp(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_generate(self):
+        generator = OtpGenerator(length=6, pool_size=4)
+
+        codes = [generator.generate() for _ in range(10)]
+
+        for code in codes:
+            self.assertEqual(len(code), 6)
+            self.assertTrue(set(code) <= set('123456789'))
+
+        self.assertEqual(len(generator.generate(8)), 8)
+
+    @patch('os.urandom')
+    def test_rejection_sampling(self, mock_urandom):
+        mock_urandom.side_effect = [bytes(bytearray([252, 253, 0, 254, 255, 8, 9, 251] + [252] * 10)),
+                                    bytes(bytearray([17] * 20))]
+
+        self.assertEqual(OtpGenerator().characters(5), '1919' + '9')
+
+    def test_uniform_distribution(self):
+        counts = Counter(OtpGenerator().characters(90000))
+
+        self.assertEqual(sorted(counts), list('123456789'))
+
+        # chi-squared with 8 degrees of freedom, exceeded with probability below 1e-6
+        chi_squared = sum((count - 10000) ** 2 / 10000.0 for count in counts.values())
+        self.assertLess(chi_squared, 50)
+
+    def test_other_alphabets(self):
+        self.assertTrue(set(OtpGenerator(alphabet='AB').characters(100)) <= set('AB'))
+        self.assertTrue(set(OtpGenerator(alphabet='\u03b1\u03b2\u03b3').characters(100)) <= set('\u03b1\u03b2\u03b3'))
+        self.assertRaises(ValueError, OtpGenerator, alphabet='')
+
+    def test_pool_shared_between_threads(self):
+        generator = OtpGenerator(pool_size=16)
+        codes = []
+
+        def generate():
+            for _ in range(500):
+                codes.append(generator.generate())
+
+        threads = [threading.Thread(target=generate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(codes), 4000)
+        self.assertTrue(all(len(code) == 5 for code in codes))
+
+    def test_pool_emptied_by_another_thread(self):
+        class RacingPool(deque):
+            """
+            A pool another thread refills and then empties again, between the check and the pop of the lock holder.
+            """
+            raced = False
+
+            def __len__(self):
+                if not self.raced:
+                    self.raced = True
+                    return 1
+
+                return deque.__len__(self)
+
+        generator = OtpGenerator(pool_size=4)
+        generator._pool = RacingPool()
+
+        self.assertEqual(len(generator.generate()), 5)
+        self.assertEqual(len(generator._pool), 3)
+
+    @skipUnless(hasattr(os, 'fork'), "os.fork is not available")
+    def test_forked_processes_do_not_share_codes(self):
+        generator = OtpGenerator(pool_size=64)
+        generator.generate()
+
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            try:
+                os.write(write_end, "".join(generator.generate() for _ in range(10)).encode('ascii'))
+            finally:
+                os._exit(0)
+
+        os.close(write_end)
+        with os.fdopen(read_end, 'rb') as f:
+            child_codes = f.read().decode('ascii')
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(child_codes), 50)
+        self.assertNotEqual(child_codes, "".join(generator.generate() for _ in range(10)))
+
+    @patch('telesign.rest.RestClient.post')
+    def test_send_verification_code(self, mock_post):
+        generator = OtpGenerator(length=4, alphabet='7')
+
+        code, response = MessagingClient(self.customer_id, self.api_key, otp_generator=generator)\
+            .send_verification_code('+15555550100', external_id='abc')
+
+        self.assertEqual(code, '7777')
+        self.assertIs(response, mock_post.return_value)
+        self.assertEqual(mock_post.call_args[1]['message'], 'Your code is 7777')
+        self.assertEqual(mock_post.call_args[1]['message_type'], 'OTP')
+        self.assertEqual(mock_post.call_args[1]['external_id'], 'abc')
+
+        code, _ = VoiceClient(self.customer_id, self.api_key, otp_generator=generator)\
+            .send_verification_code('+15555550100', template="Code {spoken_code}")
+
+        self.assertEqual(mock_post.call_args[1]['message'], 'Code 7, 7, 7, 7')
@@ -0,0 +1,256 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from stub_server import StubServer
+
+from telesign.messaging import MessagingClient
+from telesign.outbox import Outbox, OutboxError, WriteAheadLog, ENQUEUED, SENT
+from telesign.retry import RetryPolicy
+
+
+class TestOutbox(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'outbox.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def client(self, server):
+        return MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                               retry_policy=RetryPolicy.disabled())
+
+    @staticmethod
+    def reference_handler(failures=0, status_code=503):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) <= failures:
+                return status_code, {'status': {'code': status_code}}
+            return 200, {'reference_id': 'ref{n}'.format(n=len(calls))}
+
+        return handler
+
+    def test_log_replay(self):
+        log = WriteAheadLog(self.path, initial_size=64)
+        for i in range(20):
+            log.append(ENQUEUED, 'record {i}'.format(i=i).encode('utf-8'))
+        log.append(SENT, b'\x00\xff')
+        log.close()
+
+        log = WriteAheadLog(self.path, initial_size=64)
+        records = list(log.records())
+        log.close()
+
+        self.assertEqual(len(records), 21)
+        self.assertEqual(records[0], (ENQUEUED, b'record 0'))
+        self.assertEqual(records[-1], (SENT, b'\x00\xff'))
+        self.assertGreater(os.path.getsize(self.path), 64)
+
+    def test_log_ignores_torn_record(self):
+        log = WriteAheadLog(self.path)
+        log.append(ENQUEUED, b'complete')
+        log.append(ENQUEUED, b'torn')
+        torn = log.position - 2
+        log.close()
+
+        with open(self.path, 'r+b') as f:
+            f.seek(torn)
+            f.write(b'XX')
+
+        log = WriteAheadLog(self.path)
+        self.assertEqual(list(log.records()), [(ENQUEUED, b'complete')])
+
+        log.append(ENQUEUED, b'after')
+        log.close()
+
+        log = WriteAheadLog(self.path)
+        self.assertEqual(list(log.records()), [(ENQUEUED, b'complete'), (ENQUEUED, b'after')])
+        log.close()
+
+    def test_send_and_record_reference_ids(self):
+        with StubServer(self.reference_handler()) as server:
+            with Outbox(self.client(server), self.path, batch_size=4) as outbox:
+                ids = [outbox.message('+1555000{i:04d}'.format(i=i), 'Hello', 'ARN', account_lifecycle_event='create')
+                       for i in range(10)]
+
+                self.assertTrue(outbox.drain(timeout=5))
+
+                references = set(outbox.reference_id(entry_id) for entry_id in ids)
+                self.assertEqual(references, set('ref{n}'.format(n=n) for n in range(1, 11)))
+                self.assertEqual(outbox.status(ids[0]).state, 'sent')
+
+        self.assertEqual(len(server.requests), 10)
+        self.assertIn('account_lifecycle_event=create', server.requests[0].body)
+
+    def test_survives_restart(self):
+        outbox = Outbox(None, self.path, start=False)
+        ids = [outbox.message('+15550000000', 'Hello {i}'.format(i=i), 'ARN') for i in range(5)]
+        outbox.close()
+
+        with StubServer(self.reference_handler()) as server:
+            with Outbox(self.client(server), self.path) as outbox:
+                self.assertTrue(outbox.drain(timeout=5))
+
+                new_id = outbox.message('+15550000000', 'Hello again', 'ARN')
+                self.assertTrue(outbox.drain(timeout=5))
+
+            self.assertEqual(len(server.requests), 6)
+            self.assertNotIn(new_id, ids)
+
+            with Outbox(self.client(server), self.path) as outbox:
+                self.assertEqual(outbox.pending(), 0)
+                self.assertEqual(outbox.status(ids[0]).state, 'sent')
+
+            self.assertEqual(len(server.requests), 6)
+
+    def test_retry_and_failure(self):
+        results = []
+
+        with StubServer(self.reference_handler(failures=2)) as server:
+            with Outbox(self.client(server), self.path, retry_interval=0.01, callback=results.append) as outbox:
+                entry_id = outbox.message('+15550000000', 'Hello', 'ARN')
+                self.assertTrue(outbox.drain(timeout=5))
+
+                self.assertEqual(outbox.reference_id(entry_id), 'ref3')
+                self.assertEqual([result.ok for result in results], [False, False, True])
+                self.assertEqual(results[-1].index, entry_id)
+
+        with StubServer(self.reference_handler(failures=1, status_code=400)) as server:
+            with Outbox(self.client(server), self.path, retry_interval=0.01) as outbox:
+                entry_id = outbox.message('+15550000000', 'Hello', 'ARN')
+                self.assertTrue(outbox.drain(timeout=5))
+
+                self.assertEqual(outbox.status(entry_id), ('failed', None, 400))
+
+            self.assertEqual(len(server.requests), 1)
+
+    def test_dead_letters(self):
+        dead = []
+
+        with StubServer(self.reference_handler(failures=10)) as server:
+            with Outbox(self.client(server), self.path, retry_interval=0.01, max_attempts=3,
+                        dead_letter=dead.append) as outbox:
+                entry_id = outbox.message('+15550000000', 'Hello', 'ARN')
+                self.assertTrue(outbox.drain(timeout=5))
+
+                self.assertEqual(outbox.status(entry_id), ('failed', None, 503))
+
+            self.assertEqual(len(server.requests), 3)
+
+        client = Mock(spec=['message'])
+        client.message.side_effect = TypeError("unexpected keyword argument")
+
+        with Outbox(client, self.path, retry_interval=0.01, dead_letter=dead.append) as outbox:
+            entry_id = outbox.message('+15550000000', 'Hello', 'ARN')
+            self.assertTrue(outbox.drain(timeout=5))
+
+            self.assertEqual(outbox.status(entry_id), ('failed', None, None))
+
+        self.assertEqual(client.message.call_count, 1)
+        self.assertEqual([result.index for result in dead], [0, 1])
+        self.assertIsInstance(dead[1].error, TypeError)
+
+    def test_transient_errors_are_retried(self):
+        client = Mock(spec=['message'])
+        client.message.side_effect = [IOError("connection reset"), Mock(ok=True, status_code=200,
+                                                                         json={'reference_id': 'ref'})]
+
+        with Outbox(client, self.path, retry_interval=0.01) as outbox:
+            entry_id = outbox.message('+15550000000', 'Hello', 'ARN')
+            self.assertTrue(outbox.drain(timeout=5))
+
+            self.assertEqual(outbox.reference_id(entry_id), 'ref')
+
+    def test_failing_callback_does_not_stop_drainer(self):
+        callback = Mock(side_effect=ValueError)
+
+        with StubServer(self.reference_handler()) as server:
+            with Outbox(self.client(server), self.path, callback=callback) as outbox:
+                for _ in range(3):
+                    outbox.message('+15550000000', 'Hello', 'ARN')
+                    self.assertTrue(outbox.drain(timeout=5))
+
+        self.assertEqual(callback.call_count, 3)
+
+    def test_dead_drainer_is_surfaced(self):
+        with StubServer(self.reference_handler()) as server:
+            with Outbox(self.client(server), self.path) as outbox:
+                with patch.object(outbox._log, 'append', side_effect=[None, OSError("disk full")]):
+                    outbox.message('+15550000000', 'Hello', 'ARN')
+
+                    self.assertRaises(OutboxError, outbox.drain, 5)
+                    self.assertRaises(OutboxError, outbox.message, '+15550000000', 'Hello', 'ARN')
+
+    def test_queueing_during_compaction(self):
+        compacting = threading.Event()
+        resume = threading.Event()
+
+        with StubServer(self.reference_handler()) as server:
+            outbox = Outbox(self.client(server), self.path, compact_size=256, start=False)
+            prepare_rewrite = outbox._log.prepare_rewrite
+
+            def slow_prepare_rewrite(records):
+                prepare_rewrite(records)
+                compacting.set()
+                resume.wait(5)
+
+            with patch.object(outbox._log, 'prepare_rewrite', side_effect=slow_prepare_rewrite):
+                for i in range(10):
+                    outbox.message('+15550000000', 'Hello {i}'.format(i=i), 'ARN')
+                outbox.start()
+
+                self.assertTrue(compacting.wait(5))
+                queued = outbox.message('+15550000000', 'Queued while compacting', 'ARN')
+                resume.set()
+
+                self.assertTrue(outbox.drain(timeout=5))
+
+            outbox.stop()
+            outbox.close()
+
+            outbox = Outbox(None, self.path, start=False)
+            self.assertEqual(outbox.status(queued).state, 'sent')
+            self.assertEqual(outbox.pending(), 0)
+            outbox.close()
+
+        self.assertEqual(len(server.requests), 11)
+
+    def test_start_twice(self):
+        with StubServer(self.reference_handler()) as server:
+            with Outbox(self.client(server), self.path) as outbox:
+                thread = outbox._thread
+                outbox.start()
+                self.assertIs(outbox._thread, thread)
+
+                for i in range(20):
+                    outbox.message('+15550000000', 'Hello {i}'.format(i=i), 'ARN')
+                self.assertTrue(outbox.drain(timeout=5))
+
+        self.assertEqual(len(server.requests), 20)
+
+    def test_compaction(self):
+        with StubServer(self.reference_handler()) as server:
+            with Outbox(self.client(server), self.path, compact_size=256) as outbox:
+                for i in range(10):
+                    outbox.message('+15550000000', 'Hello {i}'.format(i=i), 'ARN')
+                    self.assertTrue(outbox.drain(timeout=5))
+
+            outbox = Outbox(None, self.path, start=False)
+            self.assertEqual(outbox.message('+15550000000', 'Hello', 'ARN'), 10)
+            outbox.close()
+
+            log = WriteAheadLog(self.path)
+            self.assertLess(len(list(log.records())), 10)
+            log.close()
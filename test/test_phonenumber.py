@@ -0,0 +1,69 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from mock import patch
+
+from telesign.phonenumber import PhoneNumberNormalizer, InvalidPhoneNumber, normalize, phone_number_key
+from telesign.phoneid import PhoneIdClient
+
+
+class TestPhoneNumber(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_normalize(self):
+        for phone_number in ('+1 (555) 010-0000',
+                             '15550100000',
+                             '1.555.010.0000',
+                             '001 555 010 0000',
+                             '011-1-555-010-0000',
+                             ' +1\u2011555\u2011010\u20110000 ',
+                             '+1 555 010 0000 ext. 12'):
+            self.assertEqual(normalize(phone_number), '15550100000', phone_number)
+
+        self.assertEqual(PhoneNumberNormalizer().e164('1 555 010 0000'), '+15550100000')
+
+    def test_national_numbers(self):
+        self.assertEqual(normalize('020 7946 0018', default_country_code='44'), '442079460018')
+        self.assertEqual(normalize('+33 1 23 45 67 89', default_country_code='44'), '33123456789')
+        self.assertEqual(normalize('(555) 010-0000', default_country_code='1'), '15550100000')
+        self.assertEqual(normalize('1 555 010 0000', default_country_code='1'), '15550100000')
+
+    def test_international_prefix_depends_on_country(self):
+        # 011 is a UK area code prefix, only NANP dials out with it
+        self.assertEqual(normalize('0114 496 0000', default_country_code='44'), '441144960000')
+        self.assertEqual(normalize('0033 1 23 45 67 89', default_country_code='44'), '33123456789')
+
+        # 00 is not an international prefix in NANP
+        self.assertEqual(normalize('011 44 20 7946 0018', default_country_code='1'), '442079460018')
+        self.assertRaises(InvalidPhoneNumber, normalize, '00 44 20 7946 0018', default_country_code='1')
+
+    def test_invalid(self):
+        for phone_number in ('', '+', 'phone', '+1 555', '+1234567890123456', '1-800-FLOWERS', '\u0663' * 11,
+                             '0123456789'):
+            self.assertRaises(InvalidPhoneNumber, normalize, phone_number)
+
+        self.assertEqual(phone_number_key('+1 (555) 01'), '155501')
+
+    def test_normalize_many(self):
+        phone_numbers = ['+1 (555) 010-0000', 'invalid', '15550100000', '001 555 010 0001', '+44\x1f20 7946 0018']
+
+        self.assertEqual(PhoneNumberNormalizer().normalize_many(phone_numbers),
+                         ['15550100000', None, '15550100000', '15550100001', None])
+        self.assertEqual(PhoneNumberNormalizer().normalize_many(phone_numbers[:4]),
+                         ['15550100000', None, '15550100000', '15550100001'])
+        self.assertEqual(PhoneNumberNormalizer().normalize_many([]), [])
+
+    @patch('telesign.rest.RestClient.post')
+    def test_client_normalizes_phone_numbers(self, mock_post):
+        client = PhoneIdClient(self.customer_id, self.api_key, phone_number_normalizer=PhoneNumberNormalizer())
+
+        client.phoneid('+1 (555) 010-0000')
+
+        self.assertEqual(mock_post.call_args[0][0], '/v1/phoneid/15550100000')
+
+        PhoneIdClient(self.customer_id, self.api_key).phoneid('+1 (555) 010-0000')
+
+        self.assertEqual(mock_post.call_args[0][0], '/v1/phoneid/+1 (555) 010-0000')
@@ -0,0 +1,141 @@
+from __future__ import unicode_literals
+
+import asyncio
+import time
+from unittest import TestCase
+
+from mock import Mock
+
+from telesign.aio.poller import AsyncStatusPoller
+from telesign.poller import StatusPoller
+
+
+def status_sequence(sequences):
+    """
+    A fake status lookup answering each reference_id with the given status codes in turn.
+    """
+    calls = []
+
+    def status(reference_id):
+        calls.append(reference_id)
+        code = sequences[reference_id].pop(0) if len(sequences[reference_id]) > 1 else sequences[reference_id][0]
+        if isinstance(code, Exception):
+            raise code
+        return Mock(json={'reference_id': reference_id, 'status': {'code': code}})
+
+    return status, calls
+
+
+class TestPoller(TestCase):
+    def test_polls_until_terminal(self):
+        status, calls = status_sequence({'a': [290, 291, 200], 'b': [203], 'c': [ValueError(), 290, 210]})
+        callback = Mock()
+
+        poller = StatusPoller(status, callback=callback, min_interval=0.01, max_interval=0.01)
+        for reference_id in 'abc':
+            poller.register(reference_id)
+
+        updates = list(poller)
+
+        self.assertEqual(len(poller), 0)
+        self.assertEqual(calls.count('a'), 3)
+        self.assertEqual(calls.count('b'), 1)
+        self.assertEqual(calls.count('c'), 3)
+        self.assertEqual([(update.status_code, update.terminal) for update in updates if update.reference_id == 'a'],
+                         [(290, False), (291, False), (200, True)])
+        self.assertIsInstance([update for update in updates if update.reference_id == 'c'][0].error, ValueError)
+        self.assertEqual(callback.call_count, len(updates))
+
+    def test_error_responses_are_retried(self):
+        responses = [Mock(ok=False, status_code=503, json={'status': {'code': 10030}}),
+                     Mock(ok=False, status_code=429, json={'status': {'code': 10030}}),
+                     Mock(ok=True, status_code=200, json={'status': {'code': 200}})]
+
+        poller = StatusPoller(lambda reference_id: responses.pop(0), min_interval=0.01, max_interval=0.01)
+        poller.register('a')
+
+        updates = list(poller)
+
+        self.assertEqual([(update.status_code, update.terminal) for update in updates],
+                         [(None, False), (None, False), (200, True)])
+        self.assertEqual(updates[0].response.status_code, 503)
+
+    def test_client_errors_are_terminal(self):
+        calls = []
+
+        def status(reference_id):
+            calls.append(reference_id)
+            return Mock(ok=False, status_code=404, json={'status': {'code': 10032}})
+
+        poller = StatusPoller(status, min_interval=0.01, max_interval=0.01)
+        poller.register('unknown')
+
+        updates = list(poller)
+
+        self.assertEqual(calls, ['unknown'])
+        self.assertEqual([(update.status_code, update.terminal) for update in updates], [(None, True)])
+        self.assertEqual(updates[0].response.status_code, 404)
+
+    def test_only_changes_are_emitted(self):
+        status, calls = status_sequence({'a': [290, 290, 290, 200]})
+
+        poller = StatusPoller(status, min_interval=0.01, max_interval=0.01)
+        poller.register('a')
+
+        self.assertEqual([update.status_code for update in poller], [290, 200])
+        self.assertEqual(len(calls), 4)
+
+    def test_gives_up_after_max_age(self):
+        status, calls = status_sequence({'a': [290]})
+
+        poller = StatusPoller(status, min_interval=0.01, max_interval=0.01, max_age=0.05)
+        poller.register('a')
+
+        updates = list(poller)
+
+        self.assertTrue(updates[-1].terminal)
+        self.assertEqual(updates[-1].status_code, 290)
+
+    def test_interval_grows_with_age(self):
+        status, calls = status_sequence({'old': [290], 'new': [290]})
+
+        poller = StatusPoller(status, min_interval=0.01, max_interval=10, backoff=0.5)
+        poller.register('old', sent_at=time.monotonic() - 100)
+        poller.register('new')
+
+        time.sleep(0.02)
+        poller.poll_due()
+
+        self.assertAlmostEqual(poller.next_due() - time.monotonic(), 0.01, delta=0.01)
+        poller.unregister('new')
+        self.assertAlmostEqual(poller.next_due() - time.monotonic(), 10, delta=0.1)
+
+    def test_background_thread(self):
+        status, calls = status_sequence({'a': [200]})
+        callback = Mock()
+
+        poller = StatusPoller(status, callback=callback, min_interval=0.01)
+        poller.start()
+        poller.register('a')
+
+        deadline = time.monotonic() + 2
+        while not callback.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        poller.stop()
+
+        self.assertEqual(callback.call_args[0][0].status_code, 200)
+
+    def test_async_poller(self):
+        sequences = {'a': [290, 200], 'b': [100]}
+
+        async def status(reference_id):
+            await asyncio.sleep(0)
+            return Mock(json={'status': {'code': sequences[reference_id].pop(0)}})
+
+        async def collect():
+            poller = AsyncStatusPoller(status, min_interval=0.01, max_interval=0.01)
+            poller.register('a')
+            poller.register('b')
+            return [(update.reference_id, update.status_code) async for update in poller]
+
+        self.assertEqual(sorted(asyncio.run(collect())), [('a', 200), ('a', 290), ('b', 100)])
@@ -0,0 +1,80 @@
+from __future__ import unicode_literals
+
+import asyncio
+import time
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from telesign.messaging import MessagingClient
+from telesign.ratelimit import RateLimiter, TokenBucket, MESSAGING_PREFIX, PHONEID_PREFIX
+
+
+class TestRateLimit(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def test_token_bucket_burst_then_wait(self):
+        bucket = TokenBucket(10, capacity=3)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.1, delta=0.01)
+        self.assertAlmostEqual(waits[4], 0.2, delta=0.01)
+
+        stats = bucket.stats()
+        self.assertEqual(stats['acquired'], 5)
+        self.assertEqual(stats['throttled'], 2)
+        self.assertAlmostEqual(stats['wait_seconds'], 0.3, delta=0.02)
+        self.assertAlmostEqual(stats['max_wait_seconds'], 0.2, delta=0.01)
+
+    def test_token_bucket_max_wait(self):
+        bucket = TokenBucket(10, capacity=1)
+
+        self.assertEqual(bucket.reserve(max_wait=0.05), 0.0)
+        self.assertIsNone(bucket.reserve(max_wait=0.05))
+        self.assertAlmostEqual(bucket.reserve(max_wait=0.5), 0.1, delta=0.01)
+        self.assertEqual(bucket.stats()['acquired'], 2)
+
+    def test_rate_limiter_longest_prefix(self):
+        limiter = RateLimiter({'/v1': 1, MESSAGING_PREFIX: 2})
+
+        self.assertIs(limiter.bucket_for('/v1/messaging/reference_id'), limiter.buckets[MESSAGING_PREFIX])
+        self.assertIs(limiter.bucket_for('/v1/voice'), limiter.buckets['/v1'])
+        self.assertIsNone(limiter.bucket_for('/v2/other'))
+        self.assertIsNotNone(RateLimiter({}, default=5).bucket_for('/v2/other'))
+
+    def test_rate_limiter_acquire_paces(self):
+        limiter = RateLimiter({PHONEID_PREFIX: TokenBucket(50, capacity=1)})
+
+        started = time.monotonic()
+        for _ in range(6):
+            limiter.acquire('/v1/phoneid/15555555555')
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+        self.assertEqual(limiter.stats()[PHONEID_PREFIX]['throttled'], 5)
+
+    def test_rate_limiter_acquire_async(self):
+        limiter = RateLimiter({MESSAGING_PREFIX: TokenBucket(50, capacity=1)})
+
+        async def burst():
+            return await asyncio.gather(*[limiter.acquire_async(MESSAGING_PREFIX) for _ in range(6)])
+
+        started = time.monotonic()
+        waits = asyncio.run(burst())
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+        self.assertAlmostEqual(max(waits), 0.1, delta=0.01)
+
+    @patch('telesign.auth.RequestSigner.headers', return_value={})
+    def test_client_acquires_per_request(self, mock_headers):
+        limiter = Mock()
+
+        client = MessagingClient(self.customer_id, self.api_key, rate_limiter=limiter)
+        client.session.post = Mock()
+
+        client.message('15555555555', 'hello', 'ARN')
+
+        limiter.acquire.assert_called_once_with(MESSAGING_PREFIX)
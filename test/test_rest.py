@@ -5,6 +5,7 @@ from email.utils import parsedate_tz
 from uuid import UUID
 from mock import Mock, patch
 
+from telesign.auth import RequestSigner
 from telesign.rest import RestClient
 
 
@@ -21,6 +22,30 @@ class TestRest(TestCase):
         self.assertEqual(client.customer_id, self.customer_id)
         self.assertEqual(client.api_key, self.api_key)
 
+    def test_rest_client_constructor_connection_pool(self):
+
+        client = RestClient(self.customer_id,
+                            self.api_key,
+                            pool_maxsize=64,
+                            pool_block=True,
+                            keep_alive=False)
+
+        adapter = client.session.get_adapter('https://rest-api.telesign.com')
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertEqual(adapter._pool_block, True)
+        self.assertEqual(client.session.headers['Connection'], 'close')
+
+    def test_rest_client_constructor_shared_session(self):
+
+        session = RestClient.create_session(pool_maxsize=32)
+
+        client_a = RestClient(self.customer_id, self.api_key, session=session)
+        client_b = RestClient(self.customer_id, self.api_key, session=session)
+
+        self.assertIs(client_a.session, session)
+        self.assertIs(client_b.session, session)
+        self.assertEqual(session.get_adapter('https://rest-api.telesign.com')._pool_maxsize, 32)
+
     def test_rest_client_response_constructor_basic(self):
 
         requests_response = Mock(status_code=200,
@@ -37,6 +62,40 @@ class TestRest(TestCase):
         self.assertEqual(response.ok, requests_response.ok)
         self.assertEqual(response.json, requests_response.json())
 
+    def test_rest_client_response_lazy_decoding(self):
+
+        requests_response = Mock(status_code=200,
+                                 headers={'Header': 'Value'},
+                                 content=b'{"test": 123}',
+                                 text='{"test": 123}',
+                                 ok=True)
+
+        requests_response.json.return_value = {'test': 123}
+
+        response = RestClient.Response(requests_response)
+        self.assertEqual(requests_response.json.call_count, 0)
+
+        self.assertEqual(response.json, {'test': 123})
+        self.assertEqual(response.json, {'test': 123})
+        self.assertEqual(requests_response.json.call_count, 1)
+        self.assertFalse(hasattr(response, '__dict__'))
+
+    def test_rest_client_response_raw(self):
+
+        requests_response = Mock(status_code=200,
+                                 headers={'Header': 'Value'},
+                                 content='{"test": "\u03ff"}'.encode('utf-8'),
+                                 ok=True)
+
+        response = RestClient.Response(requests_response, raw=True)
+        self.assertEqual(response.content, requests_response.content)
+        self.assertEqual(response.body, '{"test": "\u03ff"}')
+        self.assertEqual(response.json, {'test': '\u03ff'})
+        self.assertEqual(requests_response.json.call_count, 0)
+
+        requests_response.content = b'not json'
+        self.assertIsNone(RestClient.Response(requests_response, raw=True).json)
+
     def test_generate_telesign_headers_with_post(self):
         method_name = 'POST'
         date_rfc2616 = 'Wed, 14 Dec 2016 18:20:12 GMT'
@@ -117,7 +176,44 @@ class TestRest(TestCase):
         except (TypeError, ValueError):
             self.fail("x-ts-nonce is not a UUID")
 
-    @patch('telesign.rest.RestClient.generate_telesign_headers', return_value={})
+    def test_request_signer_matches_generate_telesign_headers(self):
+        date_rfc2616 = 'Wed, 14 Dec 2016 18:20:12 GMT'
+        nonce = 'A1592C6F-E384-4CDB-BC42-C3AB970369E9'
+        resource = '/v1/resource'
+
+        signer = RequestSigner(self.customer_id, self.api_key, user_agent='unit_test')
+
+        for method_name, fields in [('POST', 'test=param'), ('POST', 'test=%CF%BF'), ('POST', ''),
+                                    ('PUT', 'test=param'), ('GET', ''), ('GET', 'test=param'), ('DELETE', '')]:
+            expected_headers = RestClient.generate_telesign_headers(self.customer_id,
+                                                                    self.api_key,
+                                                                    method_name,
+                                                                    resource,
+                                                                    fields,
+                                                                    date_rfc2616=date_rfc2616,
+                                                                    nonce=nonce,
+                                                                    user_agent='unit_test')
+
+            actual_headers = signer.headers(method_name, resource, fields, date_rfc2616=date_rfc2616, nonce=nonce)
+
+            self.assertEqual(expected_headers, actual_headers)
+
+    def test_request_signer_default_date_and_nonce(self):
+        signer = RequestSigner(self.customer_id, self.api_key)
+
+        actual_headers = signer.headers('GET', '/v1/resource', '')
+
+        self.assertFalse(parsedate_tz(actual_headers.get('Date')) is None)
+        self.assertNotIn('User-Agent', actual_headers)
+
+        try:
+            self.assertEqual(UUID(actual_headers.get('x-ts-nonce')).version, 4)
+        except (TypeError, ValueError):
+            self.fail("x-ts-nonce is not a UUID")
+
+        self.assertNotEqual(actual_headers['x-ts-nonce'], signer.headers('GET', '/v1/resource', '')['x-ts-nonce'])
+
+    @patch('telesign.auth.RequestSigner.headers', return_value={})
     def test_post(self, mock_generate_telesign_headers):
         test_host = 'https://test.com'
         test_resource = '/test/resource'
@@ -139,7 +235,7 @@ class TestRest(TestCase):
         self.assertEqual(post_kwargs, expected_post_kwargs,
                          "client.session.post.call_args kwargs do not match expected")
 
-    @patch('telesign.rest.RestClient.generate_telesign_headers', return_value={})
+    @patch('telesign.auth.RequestSigner.headers', return_value={})
     def test_get(self, mock_generate_telesign_headers):
         test_host = 'https://test.com'
         test_resource = '/test/resource'
@@ -161,7 +257,7 @@ class TestRest(TestCase):
         self.assertEqual(get_kwargs, expected_get_kwargs,
                          "client.session.get.call_args kwargs do not match expected")
 
-    @patch('telesign.rest.RestClient.generate_telesign_headers', return_value={})
+    @patch('telesign.auth.RequestSigner.headers', return_value={})
     def test_put(self, mock_generate_telesign_headers):
         test_host = 'https://test.com'
         test_resource = '/test/resource'
@@ -183,7 +279,7 @@ class TestRest(TestCase):
         self.assertEqual(put_kwargs, expected_put_kwargs,
                          "client.session.put.call_args kwargs do not match expected")
 
-    @patch('telesign.rest.RestClient.generate_telesign_headers', return_value={})
+    @patch('telesign.auth.RequestSigner.headers', return_value={})
     def test_delete(self, mock_generate_telesign_headers):
         test_host = 'https://test.com'
         test_resource = '/test/resource'
@@ -0,0 +1,115 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+import requests
+from mock import Mock, patch
+
+from stub_server import StubServer
+
+from telesign.messaging import MessagingClient
+from telesign.rest import RestClient
+from telesign.retry import RetryPolicy
+
+
+class TestRetry(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def failing_handler(self, failures, status_code=503):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) <= failures:
+                return status_code, {'status': {'code': status_code}}
+            return 200, {'reference_id': 'stub'}
+
+        return handler
+
+    def test_is_retryable_request(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable_request('GET', {}))
+        self.assertTrue(policy.is_retryable_request('DELETE', {}))
+        self.assertFalse(policy.is_retryable_request('POST', {}))
+        self.assertTrue(policy.is_retryable_request('POST', {'external_id': 'abc'}))
+        self.assertFalse(RetryPolicy(retry_posts_with_external_id=False).is_retryable_request('POST',
+                                                                                            {'external_id': 'abc'}))
+        self.assertFalse(RetryPolicy.disabled().is_retryable_request('GET', {}))
+
+    def test_next_delay(self):
+        policy = RetryPolicy(max_attempts=4, backoff_factor=1, max_backoff=3, total_timeout=10)
+
+        self.assertTrue(0 <= policy.next_delay(1, 0) <= 1)
+        self.assertTrue(0 <= policy.next_delay(3, 0) <= 3)
+        self.assertIsNone(policy.next_delay(4, 0))
+
+        response = Mock(headers={'Retry-After': '2'})
+        self.assertEqual(policy.next_delay(1, 0, response), 2)
+        self.assertIsNone(policy.next_delay(1, 9, response))
+
+    def test_retry_after_http_date(self):
+        response = Mock(headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+
+        self.assertEqual(RetryPolicy.retry_after(response), 0)
+        self.assertIsNone(RetryPolicy.retry_after(Mock(headers={})))
+
+    @patch('telesign.retry.RetryPolicy.sleep')
+    def test_get_retried_with_fresh_nonce(self, mock_sleep):
+        with StubServer(self.failing_handler(2)) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+            response = client.status('reference_id')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(len(set(request.headers['x-ts-nonce'] for request in server.requests)), 3)
+
+    @patch('telesign.retry.RetryPolicy.sleep')
+    def test_get_gives_up_after_max_attempts(self, mock_sleep):
+        with StubServer(self.failing_handler(5, status_code=429)) as server:
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                retry_policy=RetryPolicy(max_attempts=2))
+            response = client.get('/v1/resource')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(server.requests), 2)
+
+    @patch('telesign.retry.RetryPolicy.sleep')
+    def test_post_retried_only_with_external_id(self, mock_sleep):
+        with StubServer(self.failing_handler(1)) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+            response = client.message('15555555555', 'hello', 'ARN')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(server.requests), 1)
+
+        with StubServer(self.failing_handler(1)) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url)
+            response = client.message('15555555555', 'hello', 'ARN', external_id='abc')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(server.requests), 2)
+
+    @patch('telesign.retry.RetryPolicy.sleep')
+    def test_connection_error_retried(self, mock_sleep):
+        client = RestClient(self.customer_id, self.api_key)
+        client.session.get = Mock(side_effect=[requests.ConnectionError(), Mock(status_code=200)])
+
+        response = client.get('/v1/resource')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.session.get.call_count, 2)
+
+        client.session.post = Mock(side_effect=requests.ConnectionError())
+        self.assertRaises(requests.ConnectionError, client.post, '/v1/resource')
+        self.assertEqual(client.session.post.call_count, 1)
+
+    def test_session_connect_retries(self):
+        client = RestClient(self.customer_id, self.api_key, retry_policy=RetryPolicy(connect_retries=4))
+
+        max_retries = client.session.get_adapter('https://rest-api.telesign.com').max_retries
+        self.assertEqual(max_retries.connect, 4)
+        self.assertFalse(max_retries.read)
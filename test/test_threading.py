@@ -0,0 +1,118 @@
+from __future__ import unicode_literals
+
+import threading
+import time
+from unittest import TestCase
+
+from stub_server import StubServer
+
+from telesign.messaging import MessagingClient
+from telesign.rest import RestClient
+
+
+class TestThreading(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+        self.invalid = []
+
+    def verifying_handler(self, latency=0.0):
+        def handler(request):
+            expected = RestClient.generate_telesign_headers(self.customer_id,
+                                                            self.api_key,
+                                                            request.method,
+                                                            request.path,
+                                                            request.body,
+                                                            date_rfc2616=request.headers['Date'],
+                                                            nonce=request.headers['x-ts-nonce'])
+
+            if request.headers['Authorization'] != expected['Authorization']:
+                self.invalid.append(request)
+
+            if latency:
+                time.sleep(latency)
+
+            return 200, {'reference_id': 'stub'}
+
+        return handler
+
+    @staticmethod
+    def hammer(client, threads, requests_per_thread):
+        errors = []
+
+        def send(thread_index):
+            try:
+                for i in range(requests_per_thread):
+                    response = client.message('+1555{thread:03d}{i:04d}'.format(thread=thread_index, i=i),
+                                              'Your code is {i}'.format(i=i), 'OTP')
+                    if response.status_code != 200:
+                        errors.append(response.status_code)
+            except Exception as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=send, args=(index,)) for index in range(threads)]
+
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        return time.perf_counter() - started, errors
+
+    def test_max_concurrency_sizes_pool(self):
+        client = RestClient(self.customer_id, self.api_key, max_concurrency=64)
+
+        self.assertEqual(client.session.get_adapter('https://').poolmanager.connection_pool_kw['maxsize'], 64)
+
+    def test_shared_client_signatures(self):
+        threads, requests_per_thread = 16, 10
+
+        with StubServer(self.verifying_handler()) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                     max_concurrency=threads)
+
+            _, errors = self.hammer(client, threads, requests_per_thread)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.invalid, [])
+        self.assertEqual(len(server.requests), threads * requests_per_thread)
+
+        nonces = set(request.headers['x-ts-nonce'] for request in server.requests)
+        self.assertEqual(len(nonces), threads * requests_per_thread)
+
+        # every thread keeps its connection alive, none is opened only to be discarded
+        connections = set(request.client_address for request in server.requests)
+        self.assertLessEqual(len(connections), threads)
+
+    def test_requests_run_concurrently(self):
+        threads, requests_per_thread = 8, 5
+        handler = self.verifying_handler()
+        in_flight = [0, 0]  # current, highest
+        overlapping = threading.Condition()
+
+        def counting_handler(request):
+            with overlapping:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+                overlapping.notify_all()
+
+                # holds the first request until another one arrives, rather than relying on timing
+                overlapping.wait_for(lambda: in_flight[1] > 1, timeout=5)
+
+            try:
+                return handler(request)
+            finally:
+                with overlapping:
+                    in_flight[0] -= 1
+
+        with StubServer(counting_handler) as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                     max_concurrency=threads)
+
+            _, errors = self.hammer(client, threads, requests_per_thread)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.invalid, [])
+        self.assertGreater(in_flight[1], 1)
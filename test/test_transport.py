@@ -0,0 +1,94 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from mock import Mock
+
+from stub_server import StubServer
+
+from telesign.messaging import MessagingClient
+from telesign.rest import RestClient
+from telesign.retry import RetryPolicy
+from telesign.transport import HTTPClientTransport, RequestsTransport
+
+
+class TestTransport(TestCase):
+    def setUp(self):
+        self.customer_id = "FFFFFFFF-EEEE-DDDD-1234-AB1234567890"
+        self.api_key = "EXAMPLE----TE8sTgg45yusumoN6BYsBVkh+yRJ5czgsnCehZaOYldPJdmFh6NeX8kunZ2zU1YWaUw/0wV6xfw=="
+
+    def expected_authorization(self, request):
+        return RestClient.generate_telesign_headers(self.customer_id,
+                                                    self.api_key,
+                                                    request.method,
+                                                    request.path,
+                                                    request.body,
+                                                    date_rfc2616=request.headers['Date'],
+                                                    nonce=request.headers['x-ts-nonce'])['Authorization']
+
+    def test_default_transport(self):
+        client = RestClient(self.customer_id, self.api_key)
+
+        self.assertIsInstance(client.transport, RequestsTransport)
+        self.assertIs(client.transport.session, client.session)
+
+    def test_http_client_transport(self):
+        transport = HTTPClientTransport()
+
+        with StubServer() as server:
+            client = MessagingClient(self.customer_id, self.api_key, rest_endpoint=server.url, transport=transport)
+
+            post_response = client.message('15555555555', 'hello \u03ff', 'ARN')
+            get_response = client.status('reference_id', test='param')
+
+        self.assertIsNone(client.session)
+        self.assertTrue(post_response.ok)
+        self.assertEqual(post_response.json, {'reference_id': 'stub'})
+        self.assertEqual(get_response.body, '{"reference_id": "stub"}')
+
+        post_request, get_request = server.requests
+        self.assertEqual(post_request.body, 'phone_number=15555555555&message=hello+%CF%BF&message_type=ARN')
+        self.assertEqual(post_request.headers['Content-Type'], 'application/x-www-form-urlencoded')
+        self.assertEqual(post_request.headers['Authorization'], self.expected_authorization(post_request))
+        self.assertEqual(get_request.headers['Authorization'], self.expected_authorization(get_request))
+
+        self.assertEqual(post_request.client_address, get_request.client_address, "connection was not reused")
+
+    def test_http_client_transport_error_status(self):
+        with StubServer(lambda request: (404, {'status': {'code': 404}})) as server:
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                transport=HTTPClientTransport(), retry_policy=RetryPolicy.disabled())
+            response = client.get('/v1/resource')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.ok)
+        self.assertEqual(response.headers['content-type'], 'application/json')
+
+    def test_http_client_transport_replaces_dropped_connection(self):
+        with StubServer(drop_connections=True) as server:
+            client = RestClient(self.customer_id, self.api_key, rest_endpoint=server.url,
+                                transport=HTTPClientTransport(), retry_policy=RetryPolicy.disabled())
+
+            responses = [client.post('/v1/resource', test=i) for i in range(3)]
+
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(len(server.requests), 3)
+
+    def test_http_client_transport_connection_refused(self):
+        with StubServer() as server:
+            url = server.url
+
+        client = RestClient(self.customer_id, self.api_key, rest_endpoint=url,
+                            transport=HTTPClientTransport(), retry_policy=RetryPolicy.disabled())
+
+        self.assertRaises(OSError, client.get, '/v1/resource')
+
+    def test_shared_transport(self):
+        transport = Mock(retryable_errors=())
+
+        client_a = RestClient(self.customer_id, self.api_key, transport=transport)
+        client_b = RestClient(self.customer_id, self.api_key, transport=transport)
+        client_a.post('/v1/resource')
+        client_b.get('/v1/resource')
+
+        self.assertEqual([call[0][0] for call in transport.request.call_args_list], ['POST', 'GET'])
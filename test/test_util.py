@@ -28,6 +28,11 @@ class TestRest(TestCase):
         self.assertEqual(len(random_with_5_digits), 5, "random_with_5_digits is not requested length")
         self.assertEqual(len(random_with_3_digits), 3, "random_with_3_digits is not requested length")
 
+    def test_lookup_field(self):
+        self.assertEqual(util.lookup_field({'a': {'b': 1}}, 'a.b'), 1)
+        self.assertIsNone(util.lookup_field({'a': 1}, 'a.b'))
+        self.assertIsNone(util.lookup_field(None, 'a'))
+
     def test_verify_telesign_callback_signature_correct(self):
         signature = "B97g3N9lPdVaptvifxRau7bzVAC5hhRBZ6HKXABN744="
         json_str = "{'test': 123}"
@@ -0,0 +1,84 @@
+from __future__ import unicode_literals
+
+import sys
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from telesign.verification import VerificationStore, MemoryVerificationBackend, VERIFIED, INVALID, EXPIRED, \
+    NOT_FOUND, TOO_MANY_ATTEMPTS
+
+
+class TestVerification(TestCase):
+    def test_verify(self):
+        store = VerificationStore()
+        store.add('+1 (555) 555-0100', '12345')
+
+        self.assertEqual(store.verify('15555550100', '54321'), INVALID)
+        self.assertEqual(store.verify('15555550100', ' 12345\n'), VERIFIED)
+        self.assertEqual(store.verify('15555550100', '12345'), NOT_FOUND)
+
+    def test_too_many_attempts(self):
+        store = VerificationStore(max_attempts=2)
+        store.add('15555550100', '12345')
+
+        self.assertEqual(store.verify('15555550100', '00000'), INVALID)
+        self.assertEqual(store.verify('15555550100', '00000'), INVALID)
+        self.assertEqual(store.verify('15555550100', '12345'), TOO_MANY_ATTEMPTS)
+
+        store.add('15555550100', '67890')
+        self.assertEqual(store.verify('15555550100', '67890'), VERIFIED)
+
+    @patch('time.monotonic')
+    def test_expiry(self, mock_monotonic):
+        mock_monotonic.return_value = 1000.0
+        backend = MemoryVerificationBackend()
+        store = VerificationStore(backend, ttl=60)
+
+        store.add('15555550100', '12345')
+        store.add('15555550101', '12345', ttl=600)
+
+        mock_monotonic.return_value = 1061.0
+        self.assertEqual(store.verify('15555550100', '12345'), EXPIRED)
+
+        store.add('15555550102', '12345')
+        self.assertEqual(len(backend), 2)
+
+        mock_monotonic.return_value = 1700.0
+        store.add('15555550103', '12345')
+        self.assertEqual(len(backend), 1)
+
+    def test_bounded_memory(self):
+        backend = MemoryVerificationBackend(maxsize=100)
+        store = VerificationStore(backend)
+
+        for i in range(1000):
+            store.add('1555{i:07d}'.format(i=i), '12345', ttl=1000 + i)
+            store.add('15550000000', '12345')
+
+        self.assertLessEqual(len(backend), 100)
+        self.assertLess(len(backend._expiries), 2 * 100 + 1024 + 1)
+        self.assertEqual(store.verify('15550000999', '12345'), VERIFIED)
+        self.assertEqual(store.verify('15550000001', '12345'), NOT_FOUND)
+
+    def test_send(self):
+        store = VerificationStore()
+        client = Mock()
+        client.send_verification_code.return_value = ('12345', Mock(ok=True))
+
+        response = store.send(client, '+15555550100', external_id='abc')
+
+        self.assertIs(response, client.send_verification_code.return_value[1])
+        client.send_verification_code.assert_called_once_with('+15555550100', external_id='abc')
+        self.assertEqual(store.verify('15555550100', '12345'), VERIFIED)
+
+        client.send_verification_code.return_value = ('67890', Mock(ok=False))
+        store.send(client, '+15555550100')
+        self.assertEqual(store.verify('15555550100', '67890'), NOT_FOUND)
+
+    def test_pending_entry_size(self):
+        backend = MemoryVerificationBackend()
+        backend.store('15555550100', '12345', 60, 3)
+
+        self.assertFalse(hasattr(backend._pending['15555550100'], '__dict__'))
+        self.assertLess(sys.getsizeof(backend._pending['15555550100']), 100)